@@ -0,0 +1,82 @@
+"""
+Compare conforming a batch of records one at a time with the batch API, both in the
+calling process and in a pool of worker processes (one per CPU).
+
+Run with ``python benchmarks/bench_batch.py``.
+"""
+import timeit
+
+from dataspec import INVALID, s
+
+SPEC = s(
+    "claim",
+    {
+        "id": s.str(conform_format="uuid"),
+        "status": {"open", "paid", "denied"},
+        "payer": s.str(regex=r"[A-Z]{2}\d{4}"),
+        "amount": s.num(min_=0),
+        s.opt("note"): s.nilable(s.str(maxlength=200)),
+    },
+)
+
+RECORDS = [
+    {
+        "id": "c5a28680-986f-4f0d-8187-80d1fbe22059",
+        "status": ("open", "paid", "denied")[i % 3],
+        "payer": f"AB{i % 10000:04d}",
+        "amount": i * 1.5,
+        "note": None,
+    }
+    for i in range(10_000)
+]
+
+# Every hundredth record is invalid
+for record in RECORDS[::100]:
+    record["status"] = "unknown"
+
+
+def validate_each() -> list:
+    return [SPEC.validate_all(record) for record in RECORDS]
+
+
+def validate_batch() -> list:
+    return list(SPEC.validate_many(RECORDS))
+
+
+def conform_each() -> list:
+    return [SPEC.conform(record) for record in RECORDS]
+
+
+def conform_batch() -> list:
+    return list(SPEC.conform_many(RECORDS))
+
+
+def conform_processes() -> list:
+    return list(SPEC.conform_many(RECORDS, executor="process"))
+
+
+def main(repeat: int = 7) -> None:
+    assert [result.conformed for result in conform_batch()] == conform_each()
+    assert conform_batch() == conform_processes()
+    assert len(RECORDS) // 100 == len(validate_batch())
+    assert len(RECORDS) // 100 == sum(
+        result.conformed is INVALID for result in conform_batch()
+    )
+
+    for name, each, batch in (
+        ("validate", validate_each, validate_batch),
+        ("conform", conform_each, conform_batch),
+        ("processes", conform_each, conform_processes),
+    ):
+        each_t = min(timeit.repeat(each, number=1, repeat=repeat))
+        batch_t = min(timeit.repeat(batch, number=1, repeat=repeat))
+        print(
+            f"{name:<10} records={len(RECORDS)} "
+            f"each={each_t * 1e3:8.1f}ms "
+            f"batch={batch_t * 1e3:8.1f}ms "
+            f"speedup={each_t / batch_t:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Compare the throughput of interpreted and compiled Specs.
+
+Run with ``python benchmarks/bench_compile.py``.
+"""
+import timeit
+import uuid
+
+from dataspec import s
+
+SPEC = s(
+    "order",
+    {
+        "id": s.str(conform_format="uuid"),
+        "status": {"open", "shipped", "closed"},
+        "lines": [
+            s(
+                "line",
+                {
+                    "sku": s.str(regex=r"[A-Z]{3}-\d{4}"),
+                    "quantity": s.num(min_=1, type_=int),
+                    "price": s.num(min_=0),
+                    s.opt("note"): s.nilable(s.str(maxlength=200)),
+                },
+            ),
+            {"kind": list},
+        ],
+        s.opt("coupon"): s.nilable(s.str()),
+    },
+)
+
+VALUE = {
+    "id": str(uuid.uuid4()),
+    "status": "open",
+    "lines": [
+        {"sku": f"ABC-{i:04d}", "quantity": i + 1, "price": 9.99, "note": None}
+        for i in range(50)
+    ],
+    "coupon": None,
+}
+
+
+def main(number: int = 2000) -> None:
+    compiled = SPEC.compile()
+    assert compiled.conform(VALUE) == SPEC.conform(VALUE)
+
+    for method in ("is_valid", "conform"):
+        interpreted_t = timeit.timeit(
+            lambda: getattr(SPEC, method)(VALUE), number=number
+        )
+        compiled_t = timeit.timeit(
+            lambda: getattr(compiled, method)(VALUE), number=number
+        )
+        print(
+            f"{method:<10} interpreted={interpreted_t / number * 1e6:8.1f}us "
+            f"compiled={compiled_t / number * 1e6:8.1f}us "
+            f"speedup={interpreted_t / compiled_t:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
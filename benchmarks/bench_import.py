@@ -0,0 +1,78 @@
+"""
+Measure the time to import dataspec, failing if it exceeds a budget.
+
+The import is timed with ``python -X importtime`` in a fresh interpreter, after one
+untimed import which compiles and caches bytecode, and the best of several runs is
+compared against the budget. The budget is generous enough to avoid spurious
+failures on slow machines, but small enough to catch eagerly importing optional
+dependencies (such as ``dateutil`` and ``phonenumbers``) or building Specs at import.
+
+Import times depend heavily on the machine and on how busy it is, so this check is
+not part of the test suite. Run with ``python benchmarks/bench_import.py`` or with
+``tox -e import-time``. Pass ``--help`` for options.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List, Optional
+
+
+def run_python(*args: str, env: Dict[str, str]) -> str:
+    return subprocess.run(
+        [sys.executable, *args],
+        check=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        universal_newlines=True,
+        env=env,
+    ).stdout
+
+
+def import_time_us(env: Dict[str, str]) -> int:
+    """Return the cumulative time in microseconds to import dataspec, as reported by
+    ``python -X importtime``."""
+    output = run_python("-X", "importtime", "-c", "import dataspec", env=env)
+    for line in output.splitlines():
+        _, cumulative, name = line.split("|")
+        if name.strip() == "dataspec":
+            return int(cumulative)
+    raise RuntimeError("dataspec not found in -X importtime output")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--budget",
+        type=int,
+        default=150_000,
+        help="maximum import time in microseconds (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="number of timed imports, of which the best is compared against the "
+        "budget (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as pycache:
+        # Allow bytecode to be cached, so only the first import compiles source
+        env = dict(os.environ, PYTHONPYCACHEPREFIX=pycache)
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+        run_python("-c", "import dataspec", env=env)
+        times = [import_time_us(env) for _ in range(args.repeat)]
+
+    best = min(times)
+    status = "ok" if best < args.budget else "EXCEEDED"
+    print(
+        f"import dataspec {best / 1e3:9.1f}ms (budget {args.budget / 1e3:9.1f}ms) "
+        f"{status}"
+    )
+    return 0 if best < args.budget else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,312 @@
+"""
+Measure throughput and latency percentiles of validating nested mapping documents
+from several threads or processes at once.
+
+Each worker conforms (or validates) a stream of claim documents in a closed loop and
+records the latency of every call. A configurable fraction of the documents are
+invalid, each failing several nested Specs, so valid-heavy and error-heavy mixes can
+be compared. With ``--render-errors``, every error is rendered with
+``ErrorDetails.as_map`` as a service would before logging or returning it, which
+shows how much formatting errors adds to the tail.
+
+The report includes the throughput across all workers along with p50, p95, p99, and
+maximum latencies and a latency histogram, for all documents and separately for the
+valid and invalid documents.
+
+Run with ``python benchmarks/bench_load.py``. Pass ``--help`` for options.
+"""
+import argparse
+import bisect
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from dataspec import INVALID, s
+
+LINE = s(
+    "line",
+    {
+        "code": s.str(regex=r"[A-Z]\d{4}"),
+        "units": s.num(type_=int, min_=1, max_=999),
+        "charge": s.num(min_=0),
+        s.opt("modifiers"): s([s.str(length=2), {"maxlength": 4}]),
+    },
+)
+
+SPEC = s(
+    "claim",
+    {
+        "id": s.str(conform_format="uuid"),
+        "status": {"open", "paid", "denied"},
+        "payer": s.str(regex=r"[A-Z]{2}\d{4}"),
+        "member": {
+            "id": s.str(regex=r"M\d{8}"),
+            "name": s.str(minlength=1, maxlength=64),
+            "dob": s.date(format_="%Y-%m-%d"),
+            "email": s.nilable(s.email()),
+        },
+        "lines": s([LINE, {"minlength": 1}]),
+        s.opt("note"): s.nilable(s.str(maxlength=200)),
+    },
+)
+
+OPERATIONS = ("conform", "validate_all")
+
+# Histogram bucket upper bounds in microseconds
+BUCKETS = [10 * 2 ** (i / 2) for i in range(28)]
+
+
+def make_document(rng: random.Random, invalid: bool) -> dict:
+    """Return a claim document with between 1 and 20 lines; invalid documents fail
+    validation at several levels of nesting."""
+    doc = {
+        "id": "c5a28680-986f-4f0d-8187-80d1fbe22059",
+        "status": rng.choice(("open", "paid", "denied")),
+        "payer": f"AB{rng.randrange(10000):04d}",
+        "member": {
+            "id": f"M{rng.randrange(10 ** 8):08d}",
+            "name": "Jane Doe",
+            "dob": "1970-01-01",
+            "email": "jane@example.com",
+        },
+        "lines": [
+            {
+                "code": f"J{rng.randrange(10000):04d}",
+                "units": rng.randrange(1, 10),
+                "charge": rng.randrange(100, 10000) / 100,
+                "modifiers": ["GT", "59"],
+            }
+            for _ in range(rng.randrange(1, 21))
+        ],
+        "note": None,
+    }
+    if invalid:
+        doc["status"] = "unknown"
+        doc["member"]["dob"] = "01/01/1970"
+        doc["lines"][-1]["units"] = 0
+        doc["lines"][-1]["modifiers"] = ["GT", "5"]
+    return doc
+
+
+def make_documents(count: int, error_rate: float, seed: int) -> List[dict]:
+    rng = random.Random(seed)
+    return [make_document(rng, rng.random() < error_rate) for _ in range(count)]
+
+
+def make_call(operation: str, render_errors: bool) -> Callable[[dict], bool]:
+    """Return a function which validates or conforms a document, returning whether it
+    was valid."""
+    if operation == "conform":
+        conform = SPEC.conform
+
+        if render_errors:
+
+            def call(doc: dict) -> bool:
+                if conform(doc) is INVALID:
+                    for e in SPEC.validate_all(doc):
+                        e.as_map()
+                    return False
+                return True
+
+        else:
+
+            def call(doc: dict) -> bool:
+                return conform(doc) is not INVALID
+
+    else:
+        validate_all = SPEC.validate_all
+
+        if render_errors:
+
+            def call(doc: dict) -> bool:
+                errors = validate_all(doc)
+                for e in errors:
+                    e.as_map()
+                return not errors
+
+        else:
+
+            def call(doc: dict) -> bool:
+                return not validate_all(doc)
+
+    return call
+
+
+class Latencies(NamedTuple):
+    valid: List[int]
+    invalid: List[int]
+
+
+def run_worker(
+    operation: str,
+    render_errors: bool,
+    requests: int,
+    error_rate: float,
+    seed: int,
+    start: Optional[threading.Barrier] = None,
+) -> Latencies:
+    """Process ``requests`` documents, returning the latency of each call in
+    nanoseconds for the valid and invalid documents."""
+    docs = make_documents(requests, error_rate, seed)
+    call = make_call(operation, render_errors)
+    latencies = Latencies([], [])
+    clock = time.perf_counter_ns
+
+    if start is not None:
+        start.wait()
+    for doc in docs:
+        t = clock()
+        is_valid = call(doc)
+        elapsed = clock() - t
+        (latencies.valid if is_valid else latencies.invalid).append(elapsed)
+    return latencies
+
+
+def run_threads(workers: int, **kwargs) -> Tuple[float, List[Latencies]]:
+    """Run ``workers`` threads at once, returning the elapsed time in seconds and the
+    latencies from each thread."""
+    barrier = threading.Barrier(workers + 1)
+    results: List[Latencies] = [Latencies([], [])] * workers
+
+    def worker(i: int) -> None:
+        results[i] = run_worker(seed=i, start=barrier, **kwargs)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(workers)]
+    for t in threads:
+        t.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for t in threads:
+        t.join()
+    return time.perf_counter() - start, results
+
+
+def run_processes(workers: int, **kwargs) -> Tuple[float, List[Latencies]]:
+    """Run ``workers`` processes at once, returning the elapsed time in seconds and
+    the latencies from each process.
+
+    Every process is started and has validated a few documents before timing starts,
+    so the elapsed time does not include starting processes."""
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        warmup = dict(kwargs, requests=10)
+        for f in [
+            executor.submit(run_worker, seed=i, **warmup) for i in range(workers)
+        ]:
+            f.result()
+
+        start = time.perf_counter()
+        futures = [
+            executor.submit(run_worker, seed=i, **kwargs) for i in range(workers)
+        ]
+        results = [f.result() for f in futures]
+        return time.perf_counter() - start, results
+
+
+def percentile(ordered: List[int], p: float) -> int:
+    """Return the ``p`` th percentile (by the nearest rank) of sorted latencies."""
+    return ordered[max(0, min(len(ordered) - 1, round(p / 100 * len(ordered)) - 1))]
+
+
+def histogram(ordered: List[int]) -> Dict[float, int]:
+    """Return the number of sorted latencies in each histogram bucket, keyed by the
+    upper bound of the bucket in microseconds."""
+    counts: Dict[float, int] = {}
+    lower = 0
+    for bound in BUCKETS + [float("inf")]:
+        upper = bisect.bisect_right(ordered, bound * 1e3, lo=lower)
+        if upper > lower:
+            counts[bound] = upper - lower
+        lower = upper
+    return counts
+
+
+def report(name: str, latencies: List[int], show_histogram: bool) -> None:
+    if not latencies:
+        return
+    ordered = sorted(latencies)
+    print(
+        f"  {name:<8} n={len(ordered):<8} "
+        + " ".join(f"p{p}={percentile(ordered, p) / 1e3:9.1f}us" for p in (50, 95, 99))
+        + f" max={ordered[-1] / 1e3:9.1f}us"
+    )
+    if show_histogram:
+        counts = histogram(ordered)
+        widest = max(counts.values())
+        for bound, count in counts.items():
+            bar = "#" * max(1, round(40 * count / widest))
+            print(f"    <= {bound:10.1f}us {count:8} {bar}")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        nargs="+",
+        default=[1, os.cpu_count() or 1],
+        help="numbers of concurrent workers to run (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--executor", choices=("thread", "process"), nargs="+", default=["thread"]
+    )
+    parser.add_argument(
+        "--operation", choices=OPERATIONS, nargs="+", default=list(OPERATIONS)
+    )
+    parser.add_argument(
+        "--mix",
+        choices=("valid-heavy", "error-heavy"),
+        nargs="+",
+        default=["valid-heavy", "error-heavy"],
+        help="valid-heavy documents are 1%% invalid; error-heavy documents are "
+        "50%% invalid",
+    )
+    parser.add_argument(
+        "-n",
+        "--requests",
+        type=int,
+        default=5_000,
+        help="documents validated by each worker (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--render-errors",
+        action="store_true",
+        help="render every error of invalid documents with ErrorDetails.as_map",
+    )
+    parser.add_argument(
+        "--histogram", action="store_true", help="print latency histograms"
+    )
+    args = parser.parse_args(argv)
+
+    print(f"python={sys.version.split()[0]} cpus={os.cpu_count()}")
+    error_rates = {"valid-heavy": 0.01, "error-heavy": 0.5}
+    runners = {"thread": run_threads, "process": run_processes}
+    for executor in args.executor:
+        for operation in args.operation:
+            for mix in args.mix:
+                for workers in args.workers:
+                    elapsed, results = runners[executor](
+                        workers,
+                        operation=operation,
+                        render_errors=args.render_errors,
+                        requests=args.requests,
+                        error_rate=error_rates[mix],
+                    )
+                    valid = [t for r in results for t in r.valid]
+                    invalid = [t for r in results for t in r.invalid]
+                    throughput = (len(valid) + len(invalid)) / elapsed
+                    print(
+                        f"{executor:<7} workers={workers:<3} {operation:<12} {mix:<11} "
+                        f"{throughput:12,.0f} docs/s"
+                    )
+                    report("all", valid + invalid, args.histogram)
+                    report("valid", valid, False)
+                    report("invalid", invalid, False)
+
+
+if __name__ == "__main__":
+    main()
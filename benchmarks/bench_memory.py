@@ -0,0 +1,190 @@
+"""
+Measure memory used by large Specs, by conforming large documents, and by the errors
+produced validating invalid documents, failing if any exceeds a stored threshold.
+
+Memory is measured with :py:mod:`tracemalloc` for three workloads:
+
+ * ``schema_bytes_per_key`` is the memory retained by a mapping Spec with many keys
+   (its ``_keyspecs`` mapping, the ``_KeySpec`` for every key, and the key Specs)
+   divided by the number of keys
+ * ``conform_peak_ratio`` is the peak memory allocated while conforming a large
+   document (about 100 MB by default) divided by the memory used by the document
+ * ``bytes_per_error`` is the memory retained by the list of errors returned by
+   ``validate_all`` for a document with many invalid values, divided by the number of
+   errors
+
+Unlike timings, these measurements vary little between machines running the same
+version of Python, so the thresholds are kept in ``memory_thresholds.json`` next to
+this file. Record new thresholds with ``--save-thresholds`` after a change which is
+expected to use more (or less) memory.
+
+Run with ``python benchmarks/bench_memory.py`` or with ``tox -e memory``, which is part
+of the default tox environments and uses the Python version the thresholds were
+recorded with (tox skips it where that version is not installed). Pass ``--help`` for
+options.
+"""
+import argparse
+import json
+import os
+import sys
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+from dataspec import s
+
+THRESHOLDS = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "memory_thresholds.json"
+)
+
+RECORD = s(
+    "record",
+    {
+        "id": s.num(type_=int, min_=0),
+        "name": s.str(minlength=1, maxlength=64, conformer=str.title),
+        "status": {"active", "inactive"},
+        "tags": s([s.str(maxlength=16)]),
+        "address": {
+            "street": s.str(),
+            "city": s.str(),
+            "zip": s.str(regex=r"\d{5}"),
+        },
+    },
+)
+
+
+def traced(fn: Callable[[], object]) -> Tuple[object, int, int]:
+    """Call ``fn``, returning its result along with the memory in bytes allocated by
+    ``fn`` which is still in use after it returns and the peak memory allocated while
+    it ran."""
+    tracemalloc.reset_peak()
+    before, _ = tracemalloc.get_traced_memory()
+    result = fn()
+    after, peak = tracemalloc.get_traced_memory()
+    return result, after - before, peak - before
+
+
+def schema_bytes_per_key(keys: int) -> float:
+    def build():
+        return s(
+            "schema",
+            {
+                f"field_{i}": (s.str(maxlength=i), s.num(max_=i), {i, -i})[i % 3]
+                for i in range(keys)
+            },
+        )
+
+    _, retained, _ = traced(build)
+    return retained / keys
+
+
+def make_record(i: int) -> dict:
+    return {
+        "id": i,
+        "name": f"record number {i}",
+        "status": ("active", "inactive")[i % 2],
+        "tags": ["alpha", "beta", "gamma"],
+        "address": {
+            "street": f"{i} Main Street",
+            "city": "Springfield",
+            "zip": "12345",
+        },
+    }
+
+
+def conform_peak_ratio(megabytes: int) -> float:
+    spec = s([RECORD])
+    record_size = traced(lambda: make_record(10**6))[1]
+    count = megabytes * 2**20 // record_size
+
+    doc, doc_size, _ = traced(lambda: [make_record(i) for i in range(count)])
+    assert spec.is_valid(doc)
+    _, _, peak = traced(lambda: spec.conform(doc))
+    return peak / doc_size
+
+
+def bytes_per_error(count: int) -> float:
+    spec = s([RECORD])
+    doc = [dict(make_record(i), id=-i - 1, status="unknown") for i in range(count)]
+    errors, retained, _ = traced(lambda: spec.validate_all(doc))
+    assert len(errors) == 2 * count
+    return retained / len(errors)
+
+
+def measure(scale: float) -> Dict[str, float]:
+    tracemalloc.start()
+    try:
+        return {
+            "schema_bytes_per_key": schema_bytes_per_key(max(1, int(10_000 * scale))),
+            "conform_peak_ratio": conform_peak_ratio(max(1, int(100 * scale))),
+            "bytes_per_error": bytes_per_error(max(1, int(10_000 * scale))),
+        }
+    finally:
+        tracemalloc.stop()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="multiply the size of every workload by this factor (default: "
+        "%(default)s)",
+    )
+    parser.add_argument(
+        "--thresholds",
+        default=THRESHOLDS,
+        help="JSON file of thresholds to compare against (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--save-thresholds",
+        action="store_true",
+        help="write the results plus the headroom to the thresholds file instead of "
+        "comparing them",
+    )
+    parser.add_argument(
+        "--headroom",
+        type=float,
+        default=0.1,
+        help="fraction added to the results when saving thresholds (default: "
+        "%(default)s)",
+    )
+    args = parser.parse_args(argv)
+
+    results = measure(args.scale)
+
+    if args.save_thresholds:
+        thresholds = {
+            "python": sys.version_info[:2],
+            "thresholds": {
+                name: round(value * (1 + args.headroom), 3)
+                for name, value in results.items()
+            },
+        }
+        with open(args.thresholds, "w") as f:
+            json.dump(thresholds, f, indent=2, sort_keys=True)
+        for name, value in results.items():
+            print(f"{name:<24} {value:12.3f}")
+        return 0
+
+    with open(args.thresholds) as f:
+        thresholds = json.load(f)
+    if tuple(thresholds["python"]) != sys.version_info[:2]:
+        print(
+            "Warning: thresholds were recorded with Python "
+            f"{'.'.join(map(str, thresholds['python']))}"
+        )
+
+    failures = 0
+    for name, value in results.items():
+        limit = thresholds["thresholds"][name]
+        status = "ok"
+        if value > limit:
+            failures += 1
+            status = "EXCEEDED"
+        print(f"{name:<24} {value:12.3f} (threshold {limit:12.3f}) {status}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
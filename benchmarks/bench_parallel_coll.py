@@ -0,0 +1,75 @@
+"""
+Measure how validating and conforming large collections of large strings and bytes
+scales with the number of threads in the pool shared by collection Specs created
+with the ``"parallel_threshold"`` option.
+
+Regular expression matching holds the GIL on the standard build of CPython, so the
+parallel Specs are expected to perform about as well as the sequential Specs there
+(less the overhead of dispatching chunks to the pool). On free-threaded builds of
+CPython, elements are validated concurrently and throughput should scale with the
+number of threads up to the number of CPUs.
+
+Run with ``python benchmarks/bench_parallel_coll.py``.
+"""
+import os
+import sys
+import timeit
+
+from dataspec import parallel, s
+
+NUM_ELEMS = 2_000
+ELEM_SIZE = 4_096
+
+STRS = [f"{i:08d}" + "abcdefgh" * (ELEM_SIZE // 8 - 1) for i in range(NUM_ELEMS)]
+BYTES = [e.encode() for e in STRS]
+
+SPECS = {
+    "str": s.str(regex=r"\d{8}[a-h]+"),
+    "bytes": s.bytes(regex=rb"\d{8}[a-h]+"),
+}
+
+
+def _set_threads(threads: int) -> None:
+    # pylint: disable=protected-access
+    if parallel._THREAD_POOL is not None:
+        parallel._THREAD_POOL.shutdown()
+    parallel._THREAD_POOL = None
+    parallel._THREAD_POOL_WORKERS = threads
+
+
+def main(repeat: int = 5) -> None:
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    cpus = os.cpu_count() or 1
+    gil = "enabled" if gil_enabled else "disabled"
+    print(
+        f"python={sys.version.split()[0]} gil={gil} "
+        f"cpus={cpus} elems={NUM_ELEMS} size={ELEM_SIZE}"
+    )
+
+    thread_counts = sorted({n for n in (1, 2, 4, 8, 16, 32) if n < cpus} | {cpus})
+    for name, elem_spec in SPECS.items():
+        elems = STRS if name == "str" else BYTES
+        sequential = s([elem_spec])
+        threaded = s([elem_spec, {"parallel_threshold": 1_000}])
+        assert sequential.conform(elems) == threaded.conform(elems)
+
+        sequential_t = min(
+            timeit.repeat(lambda: sequential.conform(elems), number=1, repeat=repeat)
+        )
+        print(f"{name:<6} sequential          {sequential_t * 1e3:8.1f}ms")
+
+        for threads in thread_counts:
+            _set_threads(threads)
+            threaded_t = min(
+                timeit.repeat(lambda: threaded.conform(elems), number=1, repeat=repeat)
+            )
+            print(
+                f"{name:<6} threads={threads:<3}         {threaded_t * 1e3:8.1f}ms "
+                f"speedup={sequential_t / threaded_t:5.2f}x"
+            )
+
+    _set_threads(cpus)
+
+
+if __name__ == "__main__":
+    main()
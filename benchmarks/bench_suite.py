@@ -0,0 +1,362 @@
+"""
+Measure ``validate``, ``is_valid``, ``conform``, and ``validate_all`` for valid and
+invalid values across every kind of Spec and every builtin Spec factory.
+
+Each case is a Spec along with one value which satisfies it and one which does not.
+Nested mapping documents are measured at several depths and breadths. The best time
+per call of each case, operation, and input is written to a JSON file and compared
+against the baseline in ``benchmarks/baseline.json``. The suite exits with status 1 if
+any measurement is slower than the baseline by more than the tolerance, or with
+status 2 if there is no baseline to compare against.
+
+Baselines are only comparable on the machine and Python version they were recorded
+on, so record a new one with ``--save-baseline`` before comparing on a new machine.
+
+Run with ``python benchmarks/bench_suite.py``. Pass ``--help`` for options.
+"""
+import argparse
+import json
+import os
+import platform
+import re
+import sys
+import timeit
+import uuid
+from datetime import date, datetime, time
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional
+
+from dataspec import ErrorDetails, Spec, s
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+class Case(NamedTuple):
+    name: str
+    spec: Spec
+    valid: Any
+    invalid: Any
+
+
+class Point:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+def is_even(v) -> Iterator[ErrorDetails]:
+    if v % 2:
+        yield ErrorDetails(message="Value must be even", pred=is_even, value=v)
+
+
+def _nested_spec(depth: int) -> Spec:
+    """Return a mapping Spec for a tree of nodes ``depth`` levels deep."""
+    node = s(
+        "leaf",
+        {
+            "id": s.num(type_=int, min_=0),
+            "name": s.str(minlength=1, maxlength=32),
+            "status": {"active", "inactive"},
+        },
+    )
+    for level in range(depth - 1):
+        node = s(
+            f"node_{level}",
+            {
+                "id": s.num(type_=int, min_=0),
+                "name": s.str(minlength=1, maxlength=32),
+                "status": {"active", "inactive"},
+                "children": s([node]),
+            },
+        )
+    return node
+
+
+def _nested_doc(depth: int, breadth: int) -> dict:
+    """Return a document for the Spec from ``_nested_spec(depth)`` in which every node
+    has ``breadth`` children."""
+    doc = {"id": 1, "name": "node", "status": "active"}
+    if depth > 1:
+        doc["children"] = [_nested_doc(depth - 1, breadth) for _ in range(breadth)]
+    return doc
+
+
+def _invalidate_leaf(doc: dict) -> dict:
+    """Return a copy of ``doc`` in which only the last leaf node is invalid."""
+    doc = dict(doc)
+    if "children" in doc:
+        children = list(doc["children"])
+        children[-1] = _invalidate_leaf(children[-1])
+        doc["children"] = children
+    else:
+        doc["status"] = "unknown"
+    return doc
+
+
+def _nested_cases() -> Iterator[Case]:
+    for depth, breadth in ((2, 4), (3, 8), (4, 4), (3, 32)):
+        doc = _nested_doc(depth, breadth)
+        yield Case(
+            f"nested[depth={depth},breadth={breadth}]",
+            _nested_spec(depth),
+            doc,
+            _invalidate_leaf(doc),
+        )
+
+
+def cases() -> List[Case]:  # pylint: disable=too-many-locals
+    """Return every benchmark case."""
+    uuid_str = "c5a28680-986f-4f0d-8187-80d1fbe22059"
+    all_cases = [
+        # Spec types
+        Case("PredicateSpec", s("positive", lambda v: v > 0), 1, -1),
+        Case("ValidatorSpec", s("even", is_even), 2, 3),
+        Case("SetSpec", s({"open", "paid", "denied"}), "paid", "unknown"),
+        Case("CollSpec", s([s.num(min_=0)]), list(range(100)), [*range(99), -1]),
+        Case(
+            "CollSpec[kind=set]",
+            s([s.num(min_=0), {"kind": set}]),
+            set(range(100)),
+            [*range(100)],
+        ),
+        Case(
+            "TupleSpec",
+            s((s.str(), s.num(), s.bool())),
+            ("a", 1, True),
+            ("a", 1, "true"),
+        ),
+        Case(
+            "DictSpec",
+            s(
+                {
+                    "id": s.str(conform_format="uuid"),
+                    "status": {"open", "paid", "denied"},
+                    "amount": s.num(min_=0),
+                    s.opt("note"): s.nilable(s.str(maxlength=200)),
+                }
+            ),
+            {"id": uuid_str, "status": "paid", "amount": 12.5, "note": None},
+            {"id": "not a uuid", "status": "unknown", "amount": -1, "note": 3},
+        ),
+        Case(
+            "ObjectSpec",
+            s.obj({"x": s.num(), s.opt("y"): s.num()}),
+            Point(1, 2),
+            Point(1, "2"),
+        ),
+        Case(
+            "any_spec",
+            s.any(s.num(type_=int), s.str(regex=r"\d+", conformer=int)),
+            "123",
+            "abc",
+        ),
+        Case("all_spec", s.all(s.str(), s.str(minlength=3), str.isdigit), "123", "1a"),
+        # Factories
+        Case("blankable", s.blankable(s.str(regex=r"\d+")), "", "abc"),
+        Case("bool", s.bool(), True, "true"),
+        Case("bytes", s.bytes(minlength=2, maxlength=8), b"abcd", b"a"),
+        Case(
+            "date", s.date(before=date(2100, 1, 1)), date(2000, 1, 1), date(2200, 1, 1)
+        ),
+        Case(
+            "date[format_]",
+            s.date(format_="%Y-%m-%d"),
+            "2000-01-01",
+            "01/01/2000",
+        ),
+        Case("default", s.default(s.num(), default=0), 1, "a"),
+        Case(
+            "dict_tag",
+            s.dict_tag({"id": s.num(), "name": s.str()}),
+            {"id": 1, "name": "a"},
+            {"id": "1", "name": 1},
+        ),
+        Case("email", s.email(domain="example.com"), "a@example.com", "a@other.com"),
+        Case("every", s.every(), 1, None),
+        Case(
+            "inst",
+            s.inst(after=datetime(2000, 1, 1)),
+            datetime(2010, 1, 1),
+            datetime(1990, 1, 1),
+        ),
+        Case(
+            "kv",
+            s.kv(s.str(regex=r"[a-z]+"), s.num()),
+            {"a": 1, "b": 2, "c": 3},
+            {"a": 1, "b": 2, "C": "3"},
+        ),
+        Case(
+            "merge",
+            s.merge({"id": s.num()}, {"name": s.str()}),
+            {"id": 1, "name": "a"},
+            {"id": "1", "name": 1},
+        ),
+        Case("nilable", s.nilable(s.num()), None, "a"),
+        Case("num", s.num(min_=0, max_=100), 50, 150),
+        Case("str", s.str(minlength=2, maxlength=8), "abcd", "a"),
+        Case("str[regex]", s.str(regex=r"[A-Z]{2}\d{4}"), "AB1234", "ab1234"),
+        Case("str[format_=uuid]", s.str(format_="uuid"), uuid_str, "not a uuid"),
+        Case("time", s.time(before=time(12)), time(6), time(18)),
+        Case("url", s.url(hostname="example.com"), "https://example.com/a", "ftp://x"),
+        Case("uuid", s.uuid(versions={4}), uuid.UUID(uuid_str), uuid.uuid1()),
+    ]
+
+    inst_str = getattr(s, "inst_str", None)
+    if inst_str is not None:
+        all_cases.append(
+            Case("inst_str", inst_str(), "2000-01-01T00:00:00", "not a date")
+        )
+
+    phone = getattr(s, "phone", None)
+    if phone is not None:
+        all_cases.append(Case("phone", phone(region="US"), "(212) 555-1234", "555-12"))
+
+    all_cases.extend(_nested_cases())
+    return all_cases
+
+
+OPERATIONS: Dict[str, Callable[[Spec], Callable[[Any], Any]]] = {
+    "validate": lambda spec: lambda v: list(spec.validate(v)),
+    "is_valid": lambda spec: spec.is_valid,
+    "conform": lambda spec: spec.conform,
+    "validate_all": lambda spec: spec.validate_all,
+}
+
+
+def measure(fn: Callable[[], Any], repeat: int, min_time: float) -> float:
+    """Return the best time in seconds for one call of ``fn``."""
+    timer = timeit.Timer(fn)
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run(selected: List[Case], repeat: int, min_time: float) -> Dict[str, float]:
+    """Return the time per call of every operation for every selected case, keyed by
+    the name of the case, the operation, and the input."""
+    results = {}
+    for case in selected:
+        assert case.spec.is_valid(case.valid), f"{case.name}: valid value is invalid"
+        for op_name, op in OPERATIONS.items():
+            call = op(case.spec)
+            for input_name in ("valid", "invalid"):
+                v = getattr(case, input_name)
+                key = f"{case.name}.{op_name}.{input_name}"
+                results[key] = measure(lambda: call(v), repeat, min_time)
+                print(f"{key:<60} {results[key] * 1e6:12.3f}us")
+    return results
+
+
+def compare(
+    results: Dict[str, float], baseline: Dict[str, float], tolerance: float
+) -> List[str]:
+    """Print the change in every result from the baseline and return the keys of the
+    results which are slower than the baseline by more than ``tolerance``."""
+    regressions = []
+    for key, t in results.items():
+        base_t = baseline.get(key)
+        if base_t is None:
+            continue
+        change = t / base_t - 1
+        flag = ""
+        if change > tolerance:
+            regressions.append(key)
+            flag = "  REGRESSION"
+        print(
+            f"{key:<60} {base_t * 1e6:12.3f}us -> {t * 1e6:12.3f}us "
+            f"{change:+7.1%}{flag}"
+        )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "-k",
+        "--filter",
+        default=None,
+        help="only run cases whose names match this regular expression",
+    )
+    parser.add_argument(
+        "-o", "--output", default=None, help="write the results to this JSON file"
+    )
+    parser.add_argument(
+        "--baseline",
+        default=BASELINE,
+        help="JSON file of baseline results to compare against (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="write the results to the baseline file instead of comparing them",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="slowdown relative to the baseline reported as a regression "
+        "(default: %(default)s)",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.02,
+        help="minimum time in seconds of each timed repetition (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+
+    selected = cases()
+    if args.filter is not None:
+        pattern = re.compile(args.filter)
+        selected = [case for case in selected if pattern.search(case.name)]
+
+    report = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "results": run(selected, args.repeat, args.min_time),
+    }
+
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+    if args.save_baseline:
+        baseline_report = {"results": {}}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                baseline_report = json.load(f)
+        baseline_report.update(
+            report, results={**baseline_report["results"], **report["results"]}
+        )
+        with open(args.baseline, "w") as f:
+            json.dump(baseline_report, f, indent=2, sort_keys=True)
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline found at {args.baseline}; record one with --save-baseline")
+        return 2
+
+    with open(args.baseline) as f:
+        baseline_report = json.load(f)
+    for field in ("implementation", "python", "machine"):
+        if baseline_report.get(field) != report[field]:
+            print(
+                f"Warning: baseline was recorded with {field} "
+                f"{baseline_report.get(field)}, not {report[field]}"
+            )
+
+    print()
+    regressions = compare(report["results"], baseline_report["results"], args.tolerance)
+    if regressions:
+        print(
+            f"\n{len(regressions)} result(s) slower than the baseline by more than "
+            f"{args.tolerance:.0%}"
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+"""
+Measure the throughput of conforming records with a single Spec instance shared by
+an increasing number of threads.
+
+Conforming a value does not modify the Spec, so threads never wait for each other.
+On the standard build of CPython, threads take turns holding the GIL and throughput
+is expected to stay roughly flat as threads are added. On free-threaded builds of
+CPython (such as ``python3.13t``), throughput should scale close to linearly with the
+number of threads up to the number of CPUs.
+
+Run with ``python benchmarks/bench_threads.py``.
+"""
+import os
+import sys
+import threading
+import time
+
+from dataspec import s
+
+SPEC = s(
+    "claim",
+    {
+        "id": s.str(conform_format="uuid"),
+        "status": {"open", "paid", "denied"},
+        "payer": s.str(regex=r"[A-Z]{2}\d{4}"),
+        "amount": s.num(min_=0),
+        s.opt("note"): s.nilable(s.str(maxlength=200)),
+    },
+)
+
+RECORDS = [
+    {
+        "id": "c5a28680-986f-4f0d-8187-80d1fbe22059",
+        "status": ("open", "paid", "denied")[i % 3],
+        "payer": f"AB{i % 10000:04d}",
+        "amount": i * 1.5,
+        "note": None,
+    }
+    for i in range(5_000)
+]
+
+
+def run(threads: int) -> float:
+    """Conform every record in each of ``threads`` threads at once, returning the
+    number of records conformed per second across all threads."""
+    barrier = threading.Barrier(threads + 1)
+    conform = SPEC.conform
+
+    def worker() -> None:
+        barrier.wait()
+        for record in RECORDS:
+            conform(record)
+        barrier.wait()
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for t in workers:
+        t.start()
+    barrier.wait()
+    start = time.perf_counter()
+    barrier.wait()
+    elapsed = time.perf_counter() - start
+    for t in workers:
+        t.join()
+    return threads * len(RECORDS) / elapsed
+
+
+def main(repeat: int = 5) -> None:
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    cpus = os.cpu_count() or 1
+    gil = "enabled" if gil_enabled else "disabled"
+    print(
+        f"python={sys.version.split()[0]} gil={gil} "
+        f"cpus={cpus} records={len(RECORDS)}"
+    )
+
+    thread_counts = sorted({n for n in (1, 2, 4, 8, 16, 32) if n < cpus} | {cpus})
+    baseline = None
+    for threads in thread_counts:
+        throughput = max(run(threads) for _ in range(repeat))
+        if baseline is None:
+            baseline = throughput
+        scaling = throughput / baseline
+        print(
+            f"threads={threads:<3} {throughput:12,.0f} records/s "
+            f"scaling={scaling:5.2f}x efficiency={scaling / threads:6.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
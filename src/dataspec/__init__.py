@@ -1,6 +1,8 @@
 from dataspec.api import SpecAPI, s
 from dataspec.base import (
     INVALID,
+    BatchResult,
+    BranchInfo,
     Conformer,
     ErrorDetails,
     Invalid,
@@ -10,14 +12,20 @@ from dataspec.base import (
     Tag,
     ValidationError,
     ValidatorFn,
+    branch_info,
     pred_to_validator,
+    set_interning,
     tag_maybe,
 )
 from dataspec.factories import register_str_format
+from dataspec.profiling import profile
+from dataspec.tracing import set_trace_hooks
 
 __all__ = [
     "INVALID",
     "Invalid",
+    "BatchResult",
+    "BranchInfo",
     "Conformer",
     "ErrorDetails",
     "PredicateFn",
@@ -27,8 +35,12 @@ __all__ = [
     "Tag",
     "ValidatorFn",
     "ValidationError",
+    "branch_info",
     "pred_to_validator",
+    "profile",
     "register_str_format",
     "s",
+    "set_interning",
+    "set_trace_hooks",
     "tag_maybe",
 ]
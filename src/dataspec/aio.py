@@ -0,0 +1,517 @@
+"""
+Validate and conform values with Specs created from asynchronous predicates.
+
+Specs created from coroutine functions and asynchronous generator functions cannot be
+validated by :py:meth:`dataspec.Spec.validate`. The functions in this module walk a
+Spec tree and its input value, awaiting asynchronous predicates and validating the
+values of mapping keys, the elements of collections and tuples, and the attributes of
+objects concurrently. Concurrent validation is also applied to the Specs produced by
+:py:meth:`dataspec.SpecAPI.kv`, while the Specs produced by
+:py:meth:`dataspec.SpecAPI.all`, :py:meth:`dataspec.SpecAPI.any`,
+:py:meth:`dataspec.SpecAPI.nilable`, :py:meth:`dataspec.SpecAPI.blankable`, and
+:py:meth:`dataspec.SpecAPI.union` validate their constituent Specs in order, just as
+they do synchronously.
+
+Parts of a Spec tree which do not contain any asynchronous predicates are validated by
+their own synchronous methods, so adding an asynchronous predicate to one key of a
+large mapping Spec does not slow down the validation of the other keys. The errors
+and conformed values produced are the same as those produced by
+:py:meth:`dataspec.Spec.conform_or_errors` for the equivalent synchronous predicates.
+"""
+# pylint: disable=protected-access
+import asyncio
+from itertools import chain
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+from dataspec.base import (
+    INVALID,
+    AsyncPredicateSpec,
+    AsyncValidatorSpec,
+    CollSpec,
+    DictSpec,
+    ErrorDetails,
+    Invalid,
+    ObjectSpec,
+    Spec,
+    Tag,
+    TupleSpec,
+    ValidatorSpec,
+    _enrich_errors,
+)
+from dataspec.cache import CachedSpec
+from dataspec.compiler import CompiledSpec
+
+_Result = Tuple[Any, List[ErrorDetails]]
+
+# The results for children whose Specs are synchronous are produced as soon as the
+# children are found; the rest are awaited concurrently with their siblings
+_Pending = Union[_Result, Awaitable[_Result]]
+
+
+class _Context:
+    """The state shared by every level of the validation of a single value."""
+
+    __slots__ = ("conform", "semaphore")
+
+    def __init__(self, conform: bool, semaphore: Optional[asyncio.Semaphore]):
+        self.conform = conform
+        self.semaphore = semaphore
+
+    def with_conform(self, conform: bool) -> "_Context":
+        if conform is self.conform:
+            return self
+        return _Context(conform, self.semaphore)
+
+
+def _children(spec: Spec) -> Iterable[Spec]:
+    """Return the Specs which ``spec`` validates its input value (or parts of it)
+    against, if they are understood by this module."""
+    spec_type = type(spec)
+    if spec_type is CompiledSpec or spec_type is CachedSpec:
+        return (spec.source,)  # type: ignore[attr-defined]
+    elif spec_type is DictSpec:
+        return [keyspec.spec for keyspec in spec._keyspecs.values()]  # type: ignore
+    elif spec_type is CollSpec:
+        return (spec._spec,)  # type: ignore[attr-defined]
+    elif spec_type is TupleSpec:
+        return spec._specs  # type: ignore[attr-defined]
+    elif spec_type is ObjectSpec:
+        return chain(
+            spec._reqattrspecs.values(),  # type: ignore[attr-defined]
+            spec._optattrspecs.values(),  # type: ignore[attr-defined]
+        )
+    elif spec_type is ValidatorSpec:
+        combinator = getattr(spec._validate, "combinator", None)  # type: ignore
+        if combinator is not None:
+            kind, args, _ = combinator
+            if kind in {"all", "any"}:
+                return args[0]
+            elif kind == "kv":
+                return args[1:3]
+            elif kind == "or":
+                return args[:1]
+            elif kind == "union":
+                return args[0].values()
+    return ()
+
+
+def _has_async(spec: Spec) -> bool:
+    """Return True if ``spec`` or any of its children is an asynchronous Spec."""
+    # Specs are immutable, so the answer is cached in each Spec's instance dict
+    # rather than computed again for every value
+    attrs = vars(spec)
+    try:
+        return attrs["_has_async"]
+    except KeyError:
+        pass
+
+    has_async = isinstance(spec, (AsyncPredicateSpec, AsyncValidatorSpec)) or any(
+        _has_async(child) for child in _children(spec)
+    )
+    attrs["_has_async"] = has_async
+    return has_async
+
+
+def _sync(spec: Spec, v: Any, ctx: _Context) -> _Result:
+    if ctx.conform:
+        return spec.conform_or_errors(v)
+    return None, list(spec.validate(v))
+
+
+def _enrich(result: _Result, tag: Tag, loc: Any) -> _Result:
+    conformed, errors = result
+    if errors:
+        errors = list(_enrich_errors(errors, tag, loc))
+    return conformed, errors
+
+
+async def _enriched(pending: Awaitable[_Result], tag: Tag, loc: Any) -> _Result:
+    return _enrich(await pending, tag, loc)
+
+
+def _child(spec: Spec, v: Any, ctx: _Context, tag: Tag, loc: Any) -> _Pending:
+    """Return the result of validating the child value ``v`` of a value validated by
+    a Spec tagged ``tag``, or an awaitable result if ``spec`` is asynchronous."""
+    if _has_async(spec):
+        return _enriched(_walk(spec, v, ctx), tag, loc)
+    return _enrich(_sync(spec, v, ctx), tag, loc)
+
+
+async def _resolve(
+    entries: Iterator[Tuple[Any, _Pending]],
+    catches: Union[Type[BaseException], Tuple[Type[BaseException], ...]],
+) -> Tuple[List[Tuple[Any, _Result]], bool]:
+    """
+    Resolve the results for the children of a value produced by ``entries``,
+    awaiting every asynchronous result concurrently.
+
+    Return the results in the order of ``entries`` along with whether an exception
+    of one of the ``catches`` types was raised. As for the synchronous methods, which
+    stop validating the children of a value at such an exception, only the results
+    before the first exception are returned, whether the exception was raised while
+    producing ``entries`` or while validating one of the children.
+    """
+    locs: List[Any] = []
+    pending: List[Any] = []
+    caught = False
+    try:
+        for loc, entry in entries:
+            locs.append(loc)
+            pending.append(entry)
+    except catches:
+        caught = True
+    except BaseException:
+        for entry in pending:
+            if asyncio.iscoroutine(entry):
+                entry.close()
+        raise
+
+    awaiting = [i for i, entry in enumerate(pending) if not isinstance(entry, tuple)]
+    if awaiting:
+        done = await asyncio.gather(
+            *(pending[i] for i in awaiting), return_exceptions=True
+        )
+        for i, result in zip(awaiting, done):
+            pending[i] = result
+
+    results: List[Tuple[Any, _Result]] = []
+    for loc, result in zip(locs, pending):
+        if isinstance(result, BaseException):
+            if isinstance(result, catches):
+                return results, True
+            raise result
+        results.append((loc, result))
+    return results, caught
+
+
+def _errors(results: Iterable[Tuple[Any, _Result]]) -> List[ErrorDetails]:
+    return [error for _, (_, errors) in results for error in errors]
+
+
+async def _validate_then_conform(spec: Spec, v: Any, ctx: _Context) -> _Result:
+    """Validate ``v`` and then conform it with the conformer of ``spec``, for Specs
+    whose default conformer has been replaced."""
+    _, errors = await _walk(spec, v, ctx.with_conform(False))
+    if errors:
+        return INVALID, errors
+    return spec.conform_valid(v), errors
+
+
+async def _walk_async(
+    spec: Union[AsyncPredicateSpec, AsyncValidatorSpec], v: Any, ctx: _Context
+) -> _Result:
+    if ctx.semaphore is None:
+        errors = await spec._aerrors(v)
+    else:
+        async with ctx.semaphore:
+            errors = await spec._aerrors(v)
+
+    if errors:
+        return INVALID, errors
+    return (spec.conform_valid(v) if ctx.conform else None), errors
+
+
+async def _walk_dict(spec: DictSpec, d: Any, ctx: _Context) -> _Result:
+    if ctx.conform and spec.conformer is not spec._default_conformer:
+        return await _validate_then_conform(spec, d, ctx)
+
+    def entries() -> Iterator[Tuple[Any, _Pending]]:
+        for k, keyspec in spec._keyspecs.items():
+            if k in d:
+                yield k, _child(keyspec.spec, d[k], ctx, spec.tag, k)
+            elif not keyspec.is_optional:
+                yield k, (INVALID, [spec._missing_key_error(d, k, keyspec)])
+
+    results, not_a_mapping = await _resolve(entries(), (AttributeError, TypeError))
+    errors = _errors(results)
+    if not_a_mapping:
+        errors.append(spec._not_a_mapping_error(d))
+    if errors:
+        return INVALID, errors
+    if not ctx.conform:
+        return None, errors
+
+    conformed_d = {k: conformed for k, (conformed, _) in results}
+    if spec._post_conformer is not None:
+        return spec._post_conformer(conformed_d), errors
+    return conformed_d, errors
+
+
+async def _walk_coll(spec: CollSpec, v: Any, ctx: _Context) -> _Result:
+    if ctx.conform and spec.conformer is not spec._default_conformer:
+        return await _validate_then_conform(spec, v, ctx)
+
+    errors: List[ErrorDetails] = []
+    if spec._validate_coll is not None:
+        errors.extend(_enrich_errors(spec._validate_coll.validate(v), spec.tag))
+
+    results, _ = await _resolve(
+        ((i, _child(spec._spec, e, ctx, spec.tag, i)) for i, e in enumerate(v)), ()
+    )
+    errors.extend(_errors(results))
+    if errors:
+        return INVALID, errors
+    if not ctx.conform:
+        return None, errors
+
+    conformed_v = (spec._out_type or type(v))(
+        conformed for _, (conformed, _) in results
+    )
+    if spec._post_conformer is not None:
+        conformed_v = spec._post_conformer(conformed_v)
+    return conformed_v, errors
+
+
+async def _walk_tuple(spec: TupleSpec, t: Any, ctx: _Context) -> _Result:
+    if ctx.conform and spec.conformer is not spec._default_conformer:
+        return await _validate_then_conform(spec, t, ctx)
+
+    try:
+        if len(t) != len(spec._specs):
+            return INVALID, [spec._length_error(t)]
+    except TypeError:
+        return INVALID, [spec._not_a_tuple_error(t)]
+
+    results, not_a_tuple = await _resolve(
+        (
+            (i, _child(e_spec, elem, ctx, spec.tag, i))
+            for i, (e_spec, elem) in enumerate(zip(spec._specs, t))
+        ),
+        TypeError,
+    )
+    errors = _errors(results)
+    if not_a_tuple:
+        errors.append(spec._not_a_tuple_error(t))
+    if errors:
+        return INVALID, errors
+    if not ctx.conform:
+        return None, errors
+
+    make = tuple if spec._namedtuple is None else spec._namedtuple._make
+    conformed_t: Any = make(conformed for _, (conformed, _) in results)
+    if spec._post_conformer is not None:
+        conformed_t = spec._post_conformer(conformed_t)
+    return conformed_t, errors
+
+
+async def _walk_object(spec: ObjectSpec, o: Any, ctx: _Context) -> _Result:
+    def entries() -> Iterator[Tuple[Any, _Pending]]:
+        for k, vspec in spec._reqattrspecs.items():
+            if hasattr(o, k):
+                yield k, _child(vspec, getattr(o, k), ctx, spec.tag, k)
+            else:
+                yield k, (INVALID, [spec._missing_attr_error(o, k, vspec)])
+
+        for k, vspec in spec._optattrspecs.items():
+            if hasattr(o, k):
+                yield k, _child(vspec, getattr(o, k), ctx, spec.tag, k)
+
+    results, _ = await _resolve(entries(), ())
+    errors = _errors(results)
+    if errors:
+        return INVALID, errors
+    return (spec.conform_valid(o) if ctx.conform else None), errors
+
+
+async def _walk_all(
+    e: Any,
+    ctx: _Context,
+    specs: Sequence[Spec],
+    conformer: Optional[Callable[[Any], Any]] = None,
+) -> _Result:
+    # Each Spec validates the value conformed by the previous Spec
+    step_ctx = ctx.with_conform(True)
+    for spec in specs:
+        e, errors = await _walk(spec, e, step_ctx)
+        if errors:
+            return INVALID, errors
+
+    if ctx.conform and conformer is not None and not isinstance(e, Invalid):
+        e = conformer(e)
+    return e, []
+
+
+async def _walk_any(
+    e: Any,
+    ctx: _Context,
+    specs: Sequence[Spec],
+    conformer: Optional[Callable[[Any], Any]] = None,
+    tag_conformed: bool = False,
+) -> _Result:
+    errors = []
+    for spec in specs:
+        conformed, spec_errors = await _walk(spec, e, ctx)
+        if spec_errors:
+            errors.extend(spec_errors)
+            continue
+
+        if ctx.conform:
+            if conformer is not None:
+                conformed = conformer(conformed)
+            if tag_conformed:
+                conformed = (spec.tag, conformed)
+        return conformed, []
+
+    return INVALID, errors
+
+
+async def _walk_kv(  # pylint: disable=too-many-arguments
+    d: Any,
+    ctx: _Context,
+    tag: Tag,
+    keyspec: Spec,
+    valspec: Spec,
+    not_a_mapping: Callable[[Any], ErrorDetails],
+    conform_keys: bool = False,
+    conformer: Optional[Callable[[Any], Any]] = None,
+) -> _Result:
+    def entries() -> Iterator[Tuple[Any, _Pending]]:
+        for k, v in d.items():
+            yield k, _child(keyspec, k, ctx, tag, d)
+            yield k, _child(valspec, v, ctx, tag, k)
+
+    results, caught = await _resolve(entries(), (AttributeError, TypeError))
+    errors = _errors(results)
+    if caught:
+        errors.append(not_a_mapping(d))
+    if errors:
+        return INVALID, errors
+    if not ctx.conform:
+        return None, errors
+
+    conformed_d = {}
+    for (k, (conformed_k, _)), (_, (conformed_v, _)) in zip(
+        results[::2], results[1::2]
+    ):
+        conformed_d[conformed_k if conform_keys else k] = conformed_v
+    if conformer is not None:
+        return conformer(conformed_d), errors
+    return conformed_d, errors
+
+
+async def _walk_or(  # pylint: disable=too-many-arguments
+    e: Any,
+    ctx: _Context,
+    spec: Spec,
+    accepts: Callable[[Any], bool],
+    error: Callable[[Any], ErrorDetails],
+    conformer: Optional[Callable[[Any], Any]] = None,
+) -> _Result:
+    if accepts(e):
+        conformed = e
+    else:
+        conformed, errors = await _walk(spec, e, ctx)
+        if errors:
+            return INVALID, [*errors, error(e)]
+
+    if ctx.conform and conformer is not None and not isinstance(conformed, Invalid):
+        conformed = conformer(conformed)
+    return conformed, []
+
+
+async def _walk_union(  # pylint: disable=too-many-arguments
+    d: Any,
+    ctx: _Context,
+    specs: Mapping[Any, Spec],
+    variant: Callable[[Any], Optional[Spec]],
+    variant_error: Callable[[Any], ErrorDetails],
+    conformer: Optional[Callable[[Any], Any]] = None,
+) -> _Result:
+    spec = variant(d)
+    if spec is None:
+        return INVALID, [variant_error(d)]
+
+    conformed, errors = await _walk(spec, d, ctx)
+    if errors:
+        return INVALID, errors
+    if ctx.conform and conformer is not None and not isinstance(conformed, Invalid):
+        conformed = conformer(conformed)
+    return conformed, []
+
+
+_COMBINATORS = {
+    "all": _walk_all,
+    "any": _walk_any,
+    "kv": _walk_kv,
+    "or": _walk_or,
+    "union": _walk_union,
+}
+
+
+async def _walk_validator(spec: ValidatorSpec, v: Any, ctx: _Context) -> _Result:
+    if ctx.conform and spec.conformer is not spec._default_conformer:
+        return await _validate_then_conform(spec, v, ctx)
+
+    kind, args, options = spec._validate.combinator  # type: ignore[attr-defined]
+    try:
+        conformed, errors = await _COMBINATORS[kind](
+            v, ctx, *args, **options  # type: ignore[operator]
+        )
+    except Exception as e:  # pylint: disable=broad-except
+        return INVALID, [spec._exception_error(v, e)]
+
+    if errors:
+        return INVALID, [error.with_details(spec.tag) for error in errors]
+    return conformed, errors
+
+
+_WALKERS = {
+    AsyncPredicateSpec: _walk_async,
+    AsyncValidatorSpec: _walk_async,
+    DictSpec: _walk_dict,
+    CollSpec: _walk_coll,
+    TupleSpec: _walk_tuple,
+    ObjectSpec: _walk_object,
+    ValidatorSpec: _walk_validator,
+}
+
+
+async def _walk(spec: Spec, v: Any, ctx: _Context) -> _Result:
+    if not _has_async(spec):
+        return _sync(spec, v, ctx)
+
+    spec_type = type(spec)
+    if spec_type is CompiledSpec or spec_type is CachedSpec:
+        return await _walk(spec.source, v, ctx)  # type: ignore[attr-defined]
+    return await _WALKERS[spec_type](spec, v, ctx)  # type: ignore[operator]
+
+
+async def aconform_or_errors(
+    spec: Spec, v: Any, conform: bool = True, max_concurrency: Optional[int] = 32
+) -> Tuple[Any, List[ErrorDetails]]:
+    """
+    Validate and (optionally) conform the value ``v`` against ``spec``, returning a
+    tuple of the possibly conformed value and a list of all Spec failures of ``v`` as
+    :py:class:`dataspec.ErrorDetails` instances.
+
+    Results are the same as those of :py:meth:`dataspec.Spec.conform_or_errors`. If
+    ``conform`` is :py:obj:`False`, values are only validated and the first element of
+    the result is :py:obj:`dataspec.INVALID` for invalid values and otherwise
+    unspecified.
+
+    :param spec: a Spec
+    :param v: a value to validate and conform
+    :param conform: if :py:obj:`False`, only validate ``v``
+    :param max_concurrency: the maximum number of asynchronous predicates awaited at
+        the same time or :py:obj:`None` for no limit; must be at least 1
+    :return: a tuple of a conformed value (or :py:obj:`dataspec.INVALID`) and a list
+        of Spec failures as :py:class:`dataspec.ErrorDetails` instances
+    """
+    if max_concurrency is not None and max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+
+    semaphore = None if max_concurrency is None else asyncio.Semaphore(max_concurrency)
+    return await _walk(spec, v, _Context(conform, semaphore))
@@ -1,5 +1,6 @@
 import functools
-from typing import Mapping, Optional, Tuple, Union
+import threading
+from typing import Any, Callable, Mapping, Optional, Tuple, Union
 
 from dataspec.base import (
     Conformer,
@@ -12,6 +13,7 @@ from dataspec.base import (
     kv_spec,
     make_spec,
     merge_spec,
+    union_spec,
 )
 from dataspec.factories import (
     blankable_spec,
@@ -88,6 +90,29 @@ def _fdef(
     return wrap_f_specs
 
 
+class _PrebakedSpec:
+    """Descriptor for a builtin Spec on :py:class:`SpecAPI` which is created the first
+    time it is accessed, rather than when :py:mod:`dataspec` is imported."""
+
+    __slots__ = ("_factory", "_args", "_kwargs", "_spec", "_lock")
+
+    def __init__(self, factory: Callable[..., Spec], *args: Any, **kwargs: Any):
+        self._factory = factory
+        self._args = args
+        self._kwargs = kwargs
+        self._spec: Optional[Spec] = None
+        self._lock = threading.Lock()
+
+    def __get__(self, instance: Any, owner: Any = None) -> Spec:
+        spec = self._spec
+        if spec is None:
+            with self._lock:
+                if self._spec is None:
+                    self._spec = self._factory(*self._args, **self._kwargs)
+                spec = self._spec
+        return spec
+
+
 # We are using this gross and weird API class singleton because MyPy currently
 # does not typing attributes on function objects, so this is the only way
 # for us to supply a callable with callable attributes.
@@ -126,24 +151,25 @@ class SpecAPI:
     obj = staticmethod(obj_spec)
     str = staticmethod(str_spec)
     time = staticmethod(time_spec)
+    union = staticmethod(union_spec)
     url = staticmethod(url_str_spec)
     uuid = staticmethod(uuid_spec)
 
     # Builtin pre-baked specs
-    is_any = every_spec("is_any")
-    is_bool = bool_spec("is_bool")
-    is_bytes = bytes_spec("is_bytes")
-    is_date = date_spec("is_date")
-    is_email = email_spec("is_email")
-    is_false = bool_spec("is_false", allowed_values={False})
-    is_float = num_spec("is_float", type_=float)
-    is_inst = datetime_spec("is_inst")
-    is_int = num_spec("is_int", type_=int)
-    is_num = num_spec("is_num")
-    is_str = str_spec("is_str")
-    is_time = time_spec("is_str")
-    is_true = bool_spec("is_true", allowed_values={True})
-    is_uuid = uuid_spec("is_true")
+    is_any = _PrebakedSpec(every_spec, "is_any")
+    is_bool = _PrebakedSpec(bool_spec, "is_bool")
+    is_bytes = _PrebakedSpec(bytes_spec, "is_bytes")
+    is_date = _PrebakedSpec(date_spec, "is_date")
+    is_email = _PrebakedSpec(email_spec, "is_email")
+    is_false = _PrebakedSpec(bool_spec, "is_false", allowed_values={False})
+    is_float = _PrebakedSpec(num_spec, "is_float", type_=float)
+    is_inst = _PrebakedSpec(datetime_spec, "is_inst")
+    is_int = _PrebakedSpec(num_spec, "is_int", type_=int)
+    is_num = _PrebakedSpec(num_spec, "is_num")
+    is_str = _PrebakedSpec(str_spec, "is_str")
+    is_time = _PrebakedSpec(time_spec, "is_str")
+    is_true = _PrebakedSpec(bool_spec, "is_true", allowed_values={True})
+    is_uuid = _PrebakedSpec(uuid_spec, "is_true")
 
     # Utility functions
     explain = staticmethod(_explain)
@@ -2,13 +2,18 @@ import functools
 import inspect
 import re
 import sys
+import weakref
 from abc import ABC, abstractmethod
 from collections import defaultdict, namedtuple
 from enum import EnumMeta
-from itertools import chain
+from itertools import chain, islice
 from typing import (
+    TYPE_CHECKING,
     Any,
+    AsyncIterator,
+    Awaitable,
     Callable,
+    Dict,
     FrozenSet,
     Generic,
     Hashable,
@@ -30,6 +35,9 @@ from typing import (
 
 import attr
 
+if TYPE_CHECKING:  # pragma: no cover
+    from dataspec.cache import CachedSpec  # pylint: disable=cyclic-import
+
 # In Python 3.6, you cannot inherit directly from Generic with slotted classes:
 # https://github.com/python-attrs/attrs/issues/313
 _USE_SLOTS_FOR_GENERIC = sys.version_info >= (3, 7)
@@ -56,6 +64,9 @@ Conformer = Callable[[T], Union[V, Invalid]]
 ObjectSpecKey = Union[str, "OptionalKey[str]"]
 PredicateFn = Callable[[Any], bool]
 ValidatorFn = Callable[[Any], Iterable["ErrorDetails"]]
+ConformOrErrorsFn = Callable[[Any], Tuple[Any, List["ErrorDetails"]]]
+AsyncPredicateFn = Callable[[Any], Awaitable[bool]]
+AsyncValidatorFn = Callable[[Any], AsyncIterator["ErrorDetails"]]
 Tag = str
 
 SpecPredicate = Union[  # type: ignore
@@ -68,13 +79,79 @@ SpecPredicate = Union[  # type: ignore
     Type[Any],
     PredicateFn,
     ValidatorFn,
+    AsyncPredicateFn,
+    AsyncValidatorFn,
     "Spec",
 ]
 
 NO_ERROR_PATH = object()
 
 
-@attr.s(auto_attribs=True, slots=True)
+@attr.s(auto_attribs=True, eq=False, frozen=True, slots=True)
+class MessageTemplate:
+    """
+    ``MessageTemplate`` instances defer rendering :py:class:`dataspec.ErrorDetails`
+    messages until the message is requested.
+
+    The rendered message is
+    ``template.format(value=convert_value(value), **fmtkwargs)``, or the template
+    itself if it cannot be rendered. Templates compare equal to their rendered message.
+
+    :param template: a format string for the message
+    :param value: the value interpolated into the message as ``value``
+    :param convert_value: an optional function which can convert the value before
+        interpolating it into the message
+    :param fmtkwargs: optional key/value pairs which will be interpolated into the
+        message
+    """
+
+    template: str
+    value: Any
+    convert_value: Optional[Callable[[Any], Any]] = None
+    fmtkwargs: Mapping[str, Any] = attr.ib(factory=dict)
+
+    def __str__(self) -> str:
+        try:
+            value = (
+                self.value
+                if self.convert_value is None
+                else self.convert_value(self.value)
+            )
+            return self.template.format(value=value, **self.fmtkwargs)
+        except Exception:  # pylint: disable=broad-except
+            # Errors are often read far from where they were produced, so a template
+            # which cannot be rendered should not make reading the error fail
+            return self.template
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (str, MessageTemplate)):
+            return str(self) == str(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore
+
+
+class _ErrorFrame(NamedTuple):
+    """A single enclosing Spec level of an error, linked to an adjacent level."""
+
+    tag: Tag
+    loc: Any
+    link: Optional["_ErrorFrame"]
+
+
+# The fields are given in ``these`` so that message, via, and path may be properties,
+# which render the message and copy the levels added by with_details into via and path
+# when they are read, while keeping their names for attr.asdict, repr, and equality
+@attr.s(
+    these={
+        "message": attr.ib(),
+        "pred": attr.ib(),
+        "value": attr.ib(),
+        "via": attr.ib(factory=list),
+        "path": attr.ib(factory=list),
+    },
+    init=False,
+)
 class ErrorDetails:
     """
     ``ErrorDetails`` instances encode details about values which fail Spec validation.
@@ -96,8 +173,12 @@ class ErrorDetails:
     evaluated against the same value, it is likely that the number of Tags in ``via``
     will not match the number elements in the ``path``.
 
-    :param message: a string message intended for developers to indicate why the
-        input value failed to validate
+    Messages are often expensive to render, since they typically include the failing
+    value, so callers may provide a :py:class:`dataspec.base.MessageTemplate` as the
+    ``message``. The template is rendered the first time ``message`` is accessed.
+
+    :param message: a string message (or a :py:class:`dataspec.base.MessageTemplate`)
+        intended for developers to indicate why the input value failed to validate
     :param pred: the input Spec predicate that caused the failure
     :param value: the value that failed to validate
     :param via: a list of :py:data:`dataspec.Tag` s for :py:class:`dataspec.Spec` s
@@ -107,23 +188,126 @@ class ErrorDetails:
         structures such as ``Mapping`` types and collections
     """
 
-    message: str
+    __slots__ = (
+        "_message",
+        "pred",
+        "value",
+        "_via",
+        "_path",
+        "_frames",
+        "_parents",
+        "__weakref__",
+    )
+
+    _message: Union[str, MessageTemplate]
     pred: SpecPredicate
     value: Any
-    via: List[Tag] = attr.ib(factory=list)
-    path: List[Any] = attr.ib(factory=list)
+    _via: List[Tag]
+    _path: List[Any]
+    # Enclosing levels added by with_details which have not yet been copied into
+    # via and path, outermost first
+    _frames: Optional[_ErrorFrame]
+    # Enclosing levels which may be shared with other errors, innermost first; these
+    # are always inside of any levels in _frames
+    _parents: Optional[_ErrorFrame]
+
+    def __init__(
+        self,
+        message: Union[str, MessageTemplate],
+        pred: SpecPredicate,
+        value: Any,
+        via: Optional[List[Tag]] = None,
+        path: Optional[List[Any]] = None,
+    ):
+        self._message = message
+        self.pred = pred
+        self.value = value
+        self._via = [] if via is None else via
+        self._path = [] if path is None else path
+        self._frames = None
+        self._parents = None
+
+    @property
+    def message(self) -> str:
+        """Return the message for this error, rendering it if necessary."""
+        if not isinstance(self._message, str):
+            self._message = str(self._message)
+        return self._message
+
+    @message.setter
+    def message(self, message: Union[str, MessageTemplate]) -> None:
+        self._message = message
+
+    @property
+    def via(self) -> List[Tag]:
+        self._apply_frames()
+        return self._via
+
+    @via.setter
+    def via(self, via: List[Tag]) -> None:
+        self._apply_frames()
+        self._via = via
+
+    @property
+    def path(self) -> List[Any]:
+        self._apply_frames()
+        return self._path
+
+    @path.setter
+    def path(self, path: List[Any]) -> None:
+        self._apply_frames()
+        self._path = path
+
+    def _apply_frames(self) -> None:
+        frame = self._frames
+        parent = self._parents
+        if frame is None and parent is None:
+            return
+
+        via: List[Tag] = []
+        path: List[Any] = []
+        while frame is not None:
+            via.append(frame.tag)
+            if frame.loc is not NO_ERROR_PATH:
+                path.append(frame.loc)
+            frame = frame.link
+
+        parents = []
+        while parent is not None:
+            parents.append(parent)
+            parent = parent.link
+        for frame in reversed(parents):
+            via.append(frame.tag)
+            if frame.loc is not NO_ERROR_PATH:
+                path.append(frame.loc)
+
+        via.extend(self._via)
+        path.extend(self._path)
+        self._via = via
+        self._path = path
+        self._frames = None
+        self._parents = None
+
+    def _with_parents(self, parents: Optional[_ErrorFrame]) -> "ErrorDetails":
+        """Add the enclosing levels ``parents`` (linked from innermost to outermost)
+        to this error, as by calling :py:meth:`with_details` for each level from
+        innermost to outermost. ``parents`` may be shared with other errors."""
+        self._apply_frames()
+        self._parents = parents
+        return self
 
     def with_details(self, tag: Tag, loc: Any = NO_ERROR_PATH) -> "ErrorDetails":
         """
         Add the given tag to the ``via`` list and add a key path if one is specified by
         the caller.
 
-        This method mutates the ``via`` and ``path`` list attributes directly rather than
-        returning a new ``ErrorDetails`` instance.
+        This method mutates the ``via`` and ``path`` attributes directly rather than
+        returning a new ``ErrorDetails`` instance. Enclosing levels are recorded in
+        constant time and only copied into ``via`` and ``path`` when either is next
+        accessed, so enriching an error as it passes through every level of a deeply
+        nested Spec costs time linear in the depth of the Spec.
         """
-        self.via.insert(0, tag)
-        if loc is not NO_ERROR_PATH:
-            self.path.insert(0, loc)
+        self._frames = _ErrorFrame(tag, loc, self._frames)
         return self
 
     def as_map(self) -> Mapping[str, Union[str, List[str]]]:
@@ -175,13 +359,49 @@ class ValidationError(Exception):
     errors: Sequence[ErrorDetails]
 
 
+@attr.s(auto_attribs=True, slots=True)
+class BatchResult:
+    """
+    ``BatchResults`` are produced by :py:meth:`dataspec.Spec.conform_many` for each
+    value in the input batch.
+
+    :param index: the index of the value in the input batch
+    :param conformed: the conformed value, or :py:obj:`dataspec.INVALID` if the value
+        was invalid
+    :param errors: a list of all :py:class:`dataspec.ErrorDetails` instances generated
+        by the Spec for the value, which is empty if the value was valid
+    """
+
+    index: int
+    conformed: Any
+    errors: List[ErrorDetails]
+
+
 class Spec(ABC):
     """
     The abstract base class of all Specs.
 
     All Specs returned by :py:data:`dataspec.s` conform to this interface.
+
+    Specs created by :py:data:`dataspec.s` and the builtin Spec factories (and Specs
+    derived from them by methods such as :py:meth:`dataspec.Spec.with_tag`) can be
+    pickled. Such Specs are pickled as the function call which created them, along
+    with its arguments, and are created again by calling the same function when they
+    are unpickled. Any predicates, conformers, and other arguments used to create a
+    Spec must therefore also be picklable, and any string formats registered with
+    :py:func:`dataspec.register_str_format` must also be registered in the process
+    which unpickles the Spec.
     """
 
+    # The function and arguments which created this Spec, if known
+    _recipe: Optional[Tuple[Callable[..., "Spec"], Tuple[Any, ...], Mapping[str, Any]]]
+    _recipe = None
+
+    def __reduce_ex__(self, protocol):
+        if self._recipe is None:
+            return super().__reduce_ex__(protocol)
+        return _rebuild_spec, self._recipe
+
     @property
     @abstractmethod
     def tag(self) -> Tag:  # pragma: no cover
@@ -207,7 +427,13 @@ class Spec(ABC):
         """
         raise NotImplementedError
 
-    def validate_all(self, v: Any) -> List[ErrorDetails]:  # pragma: no cover
+    def validate_all(
+        self,
+        v: Any,
+        max_errors: Optional[int] = None,
+        fail_fast: bool = False,
+        iterative: bool = False,
+    ) -> List[ErrorDetails]:
         """
         Validate the value ``v`` against the Spec, returning a :py:class:`list` of all
         Spec failures of ``v`` as :py:class:`dataspec.ErrorDetails` instances.
@@ -215,22 +441,68 @@ class Spec(ABC):
         This method is equivalent to ``list(spec.validate(v))``. If an empty list is
         returned ``v`` is valid according to the Spec.
 
+        Callers may limit the number of failures collected using ``max_errors`` or
+        ``fail_fast``. Builtin Specs produce their failures lazily, so validation of
+        nested collections, mappings, and tuples stops as soon as the limit is
+        reached rather than visiting the remainder of ``v``.
+
+        If ``iterative`` is :py:obj:`True`, ``v`` will be validated by the engine in
+        :py:func:`dataspec.engine.iter_errors`, which produces the same errors without
+        recursion and can validate values nested more deeply than Python's recursion
+        limit.
+
         :param v: a value to validate
+        :param max_errors: if given, the maximum number of Spec failures to collect;
+            must be at least 1
+        :param fail_fast: if :py:obj:`True`, stop validation at the first Spec failure;
+            equivalent to ``max_errors=1``
+        :param iterative: if :py:obj:`True`, validate ``v`` using the iterative
+            validation engine
         :return: a list of Spec failures as :py:class:`dataspec.ErrorDetails`
             instances, if any
         """
-        return list(self.validate(v))
+        if iterative:
+            from dataspec.engine import (  # pylint: disable=import-outside-toplevel
+                iter_errors,
+            )
 
-    def validate_ex(self, v: Any) -> None:
+            errors = iter_errors(self, v)
+        else:
+            errors = self.validate(v)
+
+        if fail_fast:
+            max_errors = 1
+        if max_errors is None:
+            return list(errors)
+        if max_errors < 1:
+            raise ValueError("max_errors must be at least 1")
+        return list(islice(errors, max_errors))
+
+    def validate_ex(
+        self,
+        v: Any,
+        max_errors: Optional[int] = None,
+        fail_fast: bool = False,
+        iterative: bool = False,
+    ) -> None:
         """
         Validate the value ``v`` against the Spec, throwing a
         :py:class:`dataspec.ValidationError` containing a list of all of the Spec
         failures for ``v`` , if any. Returns :py:obj:`None` otherwise.
 
+        ``max_errors``, ``fail_fast``, and ``iterative`` are interpreted as for
+        :py:meth:`dataspec.Spec.validate_all`.
+
         :param v: a value to validate
+        :param max_errors: if given, the maximum number of Spec failures to collect
+        :param fail_fast: if :py:obj:`True`, stop validation at the first Spec failure
+        :param iterative: if :py:obj:`True`, validate ``v`` using the iterative
+            validation engine
         :return: :py:obj:`None`
         """
-        errors = self.validate_all(v)
+        errors = self.validate_all(
+            v, max_errors=max_errors, fail_fast=fail_fast, iterative=iterative
+        )
         if errors:
             raise ValidationError(errors)
 
@@ -243,6 +515,18 @@ class Spec(ABC):
         :return: :py:obj:`True` if the value is valid according to the Spec, otherwise
             :py:obj:`False`
         """
+        return self._check(v)
+
+    def _check(self, v: Any) -> bool:
+        """
+        Return :py:obj:`True` if ``v`` is valid according to the Spec, otherwise
+        return :py:obj:`False`.
+
+        Subclasses should override this method to answer the question without
+        creating generators or :py:class:`dataspec.ErrorDetails` instances. Specs
+        should call ``_check`` rather than ``validate`` on their child Specs whenever
+        they only need to know whether the child value is valid.
+        """
         try:
             next(self.validate(v))
         except StopIteration:
@@ -291,6 +575,238 @@ class Spec(ABC):
             return v
         return self.conformer(v)  # pylint: disable=not-callable
 
+    def conform_or_errors(self, v: Any) -> Tuple[Any, List[ErrorDetails]]:
+        """
+        Validate and conform ``v`` in a single pass over the Spec, returning a tuple of
+        the possibly conformed value and a list of all Spec failures of ``v`` as
+        :py:class:`dataspec.ErrorDetails` instances.
+
+        If ``v`` is valid according to the Spec, the list of errors will be empty and
+        the first element will be the value as returned by
+        :py:meth:`dataspec.Spec.conform`. If ``v`` is invalid, the first element will be
+        :py:obj:`dataspec.INVALID` and the list of errors will be the same as those
+        returned by :py:meth:`dataspec.Spec.validate_all`.
+
+        Mapping, collection, and tuple Specs (and Specs composed of other Specs such as
+        :py:meth:`dataspec.SpecAPI.nilable`) conform their children as they validate
+        them, so each nested value is visited only once. Specs whose default conformer
+        has been replaced by :py:meth:`dataspec.Spec.with_conformer` validate ``v``
+        first and then apply their conformer.
+
+        :param v: a value to validate and conform
+        :return: a tuple of a conformed value (or :py:obj:`dataspec.INVALID`) and a
+            list of Spec failures as :py:class:`dataspec.ErrorDetails` instances
+        """
+        errors = list(self.validate(v))
+        if errors:
+            return INVALID, errors
+        return self.conform_valid(v), errors
+
+    async def avalidate(
+        self, v: Any, max_concurrency: Optional[int] = 32
+    ) -> List[ErrorDetails]:
+        """
+        Validate the value ``v`` against the Spec asynchronously, returning a
+        :py:class:`list` of all Spec failures of ``v`` as
+        :py:class:`dataspec.ErrorDetails` instances.
+
+        Specs created from coroutine functions and asynchronous generator functions
+        can only be validated by this method and :py:meth:`dataspec.Spec.aconform`.
+        The values of the keys of mapping Specs, the elements of collection and tuple
+        Specs, and the attributes of object Specs are validated concurrently wherever
+        they are validated by such Specs, awaiting at most ``max_concurrency``
+        asynchronous predicates at a time. Errors are returned in the same order as
+        :py:meth:`dataspec.Spec.validate_all`.
+
+        :param v: a value to validate
+        :param max_concurrency: the maximum number of asynchronous predicates awaited
+            at the same time or :py:obj:`None` for no limit; must be at least 1
+        :return: a list of Spec failures as :py:class:`dataspec.ErrorDetails`
+            instances, if any
+        """
+        from dataspec.aio import (  # pylint: disable=import-outside-toplevel
+            aconform_or_errors,
+        )
+
+        _, errors = await aconform_or_errors(
+            self, v, conform=False, max_concurrency=max_concurrency
+        )
+        return errors
+
+    async def aconform(self, v: Any, max_concurrency: Optional[int] = 32):
+        """
+        Conform ``v`` to the Spec asynchronously, returning the possibly conformed
+        value or :py:obj:`dataspec.INVALID` if the value is invalid.
+
+        Values are validated as by :py:meth:`dataspec.Spec.avalidate`.
+
+        :param v: a value to conform
+        :param max_concurrency: the maximum number of asynchronous predicates awaited
+            at the same time or :py:obj:`None` for no limit; must be at least 1
+        :return: a conformed value or :py:obj:`dataspec.INVALID` if the input value
+            could not be conformed
+        """
+        from dataspec.aio import (  # pylint: disable=import-outside-toplevel
+            aconform_or_errors,
+        )
+
+        conformed, _ = await aconform_or_errors(
+            self, v, conform=True, max_concurrency=max_concurrency
+        )
+        return conformed
+
+    def validate_many(
+        self, vs: Iterable[Any]
+    ) -> Iterator[Tuple[int, List[ErrorDetails]]]:
+        """
+        Validate each value in the iterable ``vs``, yielding a tuple of the index and a
+        list of all Spec failures for each invalid value.
+
+        Valid values produce no output, so the result of validating a batch of values
+        which are all valid is empty. Values are validated lazily as the result is
+        consumed, so ``vs`` may be a generator over an arbitrarily large input.
+
+        The Spec is compiled (as by :py:meth:`dataspec.Spec.compile`) once for the
+        whole batch, which makes validating a large batch significantly faster than
+        validating each value separately. Callers validating many small batches should
+        compile the Spec once themselves and call this method on the compiled Spec.
+        Errors are produced by this Spec, so they are the same as those from
+        :py:meth:`dataspec.Spec.validate_all`.
+
+        :param vs: an iterable of values to validate
+        :return: an iterator of tuples of the index of each invalid value and its Spec
+            failures as :py:class:`dataspec.ErrorDetails` instances
+        """
+        check = self.compile()._check  # pylint: disable=protected-access
+        validate = self.validate
+        for i, v in enumerate(vs):
+            if not check(v):
+                yield i, list(validate(v))
+
+    def conform_many(
+        self,
+        vs: Iterable[Any],
+        executor: Optional[str] = None,
+        workers: Optional[int] = None,
+        chunksize: int = 1000,
+        mp_context: Optional[Any] = None,
+    ) -> Iterator[BatchResult]:
+        """
+        Validate and conform each value in the iterable ``vs``, yielding a
+        :py:class:`dataspec.BatchResult` for every value in the order of ``vs``.
+
+        Each result contains the index of the value in ``vs``, the conformed value (or
+        :py:obj:`dataspec.INVALID`), and a list of Spec failures as returned by
+        :py:meth:`dataspec.Spec.conform_or_errors`. Values are conformed lazily as the
+        result is consumed, so ``vs`` may be a generator over an arbitrarily large
+        input.
+
+        The Spec is compiled (as by :py:meth:`dataspec.Spec.compile`) once for the
+        whole batch, which makes conforming a large batch significantly faster than
+        conforming each value separately. Callers conforming many small batches should
+        compile the Spec once themselves and call this method on the compiled Spec.
+
+        If ``executor`` is ``"process"``, values are conformed in chunks of
+        ``chunksize`` values by a pool of ``workers`` processes, which is started for
+        the batch and shut down once it is complete. Each value and its conformed value
+        must be picklable, as must the Spec itself; Specs created by the
+        :py:data:`dataspec.s` factories are picklable so long as every predicate and
+        conformer they were created from is. Errors for invalid values are always
+        produced in the calling process. Process pools carry a significant startup
+        cost, so they are only worthwhile for large batches of values which are
+        expensive to conform.
+
+        :param vs: an iterable of values to validate and conform
+        :param executor: if ``"process"``, conform values in a pool of worker
+            processes; if :py:obj:`None`, conform values in the calling thread
+        :param workers: the number of worker processes; defaults to the number of CPUs
+        :param chunksize: the number of values sent to a worker process at a time
+        :param mp_context: the :py:mod:`multiprocessing` context used to start worker
+            processes; defaults to the context for the default start method
+        :return: an iterator of :py:class:`dataspec.BatchResult` instances
+        """
+        if executor is None:
+            return self._conform_many(vs)
+        elif executor == "process":
+            from dataspec.parallel import (  # pylint: disable=import-outside-toplevel
+                conform_many_in_processes,
+            )
+
+            return conform_many_in_processes(
+                self, vs, workers=workers, chunksize=chunksize, mp_context=mp_context
+            )
+        else:
+            raise ValueError(f"Unknown executor {executor!r}; expected 'process'")
+
+    def _conform_many(self, vs: Iterable[Any]) -> Iterator[BatchResult]:
+        conform = self.compile().conform
+        conform_or_errors = self.conform_or_errors
+        for i, v in enumerate(vs):
+            conformed = conform(v)
+            if conformed is INVALID:
+                yield BatchResult(i, *conform_or_errors(v))
+            else:
+                yield BatchResult(i, conformed, [])
+
+    def compile(self) -> "Spec":
+        """
+        Return a new Spec which validates and conforms values using Python functions
+        generated from this Spec's tree.
+
+        Compiled Specs check type guards, set membership, and predicates inline and
+        traverse mappings, collections, tuples, and objects without intermediate
+        generators, which makes :py:meth:`dataspec.Spec.is_valid` and
+        :py:meth:`dataspec.Spec.conform` significantly faster for large Specs. Invalid
+        values are always handed back to this Spec to produce errors, so compiled Specs
+        produce exactly the same :py:class:`dataspec.ErrorDetails` as their source.
+
+        Compilation is relatively expensive, so Specs should be compiled once and
+        reused. Specs derived from a compiled Spec using
+        :py:meth:`dataspec.Spec.with_tag` and :py:meth:`dataspec.Spec.with_conformer`
+        are compiled again.
+
+        :return: a compiled copy of this Spec
+        """
+        from dataspec.compiler import (  # pylint: disable=import-outside-toplevel
+            CompiledSpec,
+        )
+
+        return _record_recipe(CompiledSpec.from_spec(self), self.compile)
+
+    def cached(self, maxsize: int = 1024, ttl: Optional[float] = None) -> "CachedSpec":
+        """
+        Return a new Spec which memoizes the results of
+        :py:meth:`dataspec.Spec.is_valid` and :py:meth:`dataspec.Spec.conform` for
+        this Spec.
+
+        Results are cached for hashable input values, keyed on both the value and its
+        type. Once ``maxsize`` values are cached, the least recently used value is
+        evicted to make room for the next. If a ``ttl`` is given, cached results are
+        discarded once they are older than ``ttl`` seconds. The number of cache hits,
+        misses, and evictions is available from
+        :py:meth:`dataspec.cache.CachedSpec.cache_info`.
+
+        Cached Specs are most useful for Specs which run expensive checks (such as
+        string format parsers) on values which occur repeatedly in the input data.
+
+        Every caller receives the same cached conformed value, so only immutable
+        conformed values (such as strings, numbers, dates, and tuples of such values)
+        are cached. Mutable conformed values (such as lists and dicts) are produced by
+        this Spec for each call.
+
+        :param maxsize: the maximum number of values to cache; must be at least 1
+        :param ttl: if given, the number of seconds for which each result is cached
+        :return: a cached copy of this Spec
+        """
+        from dataspec.cache import CachedSpec  # pylint: disable=import-outside-toplevel
+
+        return _record_recipe(
+            CachedSpec(self, maxsize=maxsize, ttl=ttl),
+            self.cached,
+            maxsize=maxsize,
+            ttl=ttl,
+        )
+
     def compose_conformer(self, conformer: Conformer) -> "Spec":
         """
         Return a new Spec instance with a new conformer which is the composition of the
@@ -319,7 +835,9 @@ class Spec(ABC):
             assert existing_conformer is not None
             return conformer(existing_conformer(v))  # pylint: disable=not-callable
 
-        return self.with_conformer(conform_spec)
+        return _record_recipe(
+            self.with_conformer(conform_spec), self.compose_conformer, conformer
+        )
 
     def with_conformer(self, conformer: Optional[Conformer]) -> "Spec":
         """
@@ -336,7 +854,9 @@ class Spec(ABC):
             instance or :py:obj:`None` to remove the conformer associated with this
         :return: a copy of the current Spec instance with new conformer
         """
-        return attr.evolve(self, conformer=conformer)
+        return _record_recipe(
+            _evolve(self, conformer=conformer), self.with_conformer, conformer
+        )
 
     def with_tag(self, tag: Tag) -> "Spec":
         """
@@ -347,7 +867,16 @@ class Spec(ABC):
         :param tag: a new tag to use for the new Spec
         :return: a copy of the current Spec instance with the new tag applied
         """
-        return attr.evolve(self, tag=tag)
+        return _record_recipe(_evolve(self, tag=tag), self.with_tag, tag)
+
+
+def _evolve(spec: Spec, **changes: Any) -> Spec:
+    """Return a copy of ``spec`` with ``changes`` applied to its attributes.
+
+    :py:class:`dataspec.Spec` itself is not an attrs class, but every concrete Spec
+    which does not override :py:meth:`dataspec.Spec.with_conformer` and
+    :py:meth:`dataspec.Spec.with_tag` is."""
+    return attr.evolve(cast(Any, spec), **changes)
 
 
 def tag_maybe(
@@ -359,6 +888,149 @@ def tag_maybe(
     return tag, (cast("Tuple[T, ...]", (maybe_tag, *args)) if tag is None else args)
 
 
+# Interned Specs, keyed by the structure of the arguments used to create them, or
+# None if interning is disabled
+_INTERNED_SPECS: Optional[MutableMapping[Hashable, "Spec"]] = None
+
+# Values of these types are compared by value in structural keys; any other value
+# (such as a function, a type, or a Spec) is compared by identity
+_STRUCTURAL_VALUE_TYPES = frozenset({bool, bytes, complex, float, int, str, type(None)})
+
+
+def set_interning(enabled: bool) -> None:
+    """
+    Enable or disable interning of Specs created by :py:func:`dataspec.base.make_spec`
+    and the builtin Spec factories.
+
+    While interning is enabled, calling a Spec factory with arguments structurally
+    identical to those of a previous call returns the Spec instance created by that
+    previous call rather than creating a new Spec. Arguments are structurally
+    identical if they are equal strings, numbers, or other scalar values; the same
+    function, type, or Spec object; or collections, mappings, and tuples whose
+    elements are structurally identical. Since nested Specs are interned as they are
+    created, large schemas which repeat the same field definitions will share a single
+    Spec for each distinct definition.
+
+    Specs which keep mutable state of their own, such as adaptive
+    :py:meth:`dataspec.SpecAPI.any` Specs and cached Specs, are never interned.
+
+    Interned Specs are held until interning is disabled, which discards the table of
+    interned Specs. Specs created while interning was enabled remain valid.
+
+    :param enabled: if :py:obj:`True`, enable interning; otherwise, disable interning
+    :return: :py:obj:`None`
+    """
+    global _INTERNED_SPECS  # pylint: disable=global-statement
+
+    if not enabled:
+        _INTERNED_SPECS = None
+    elif _INTERNED_SPECS is None:
+        _INTERNED_SPECS = {}
+
+
+@attr.s(eq=False, frozen=True, slots=True)
+class _Identity:
+    """Wrapper comparing an arbitrary object by identity in a structural key."""
+
+    obj: Any = attr.ib()
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, _Identity) and self.obj is other.obj
+
+    def __hash__(self) -> int:
+        return id(self.obj)
+
+
+def _structural_key(v: Any) -> Hashable:
+    """Return a hashable key which is equal for structurally identical values."""
+    tp = type(v)
+    if tp is float or tp is complex:
+        # Signed zeros are equal but distinguishable and NaNs are never equal, so
+        # compare these by their representation and NaNs by identity
+        return (tp, repr(v)) if v == v else _Identity(v)
+    elif tp in _STRUCTURAL_VALUE_TYPES:
+        return tp, v
+    elif tp is list or tp is tuple:
+        return tp, tuple(_structural_key(e) for e in v)
+    elif tp is dict:
+        return tp, tuple((_structural_key(k), _structural_key(e)) for k, e in v.items())
+    elif tp is set or tp is frozenset:
+        return tp, frozenset(_structural_key(e) for e in v)
+    elif tp is OptionalKey:
+        return tp, _structural_key(v.key)
+    return _Identity(v)
+
+
+SpecFactory = TypeVar("SpecFactory", bound=Callable[..., "Spec"])
+SpecT = TypeVar("SpecT", bound="Spec")
+
+
+def spec_factory(factory: SpecFactory) -> SpecFactory:
+    """
+    Decorate a Spec factory function to record the arguments used to create each Spec,
+    which allows Specs to be pickled, and to intern the Specs it creates while
+    interning is enabled by :py:func:`dataspec.base.set_interning`.
+
+    The decorated function must be importable by its qualified name, since it is
+    pickled by reference.
+    """
+
+    def create(*args, **kwargs) -> "Spec":
+        spec = factory(*args, **kwargs)
+        # Factories may return an existing Spec given as an argument unchanged; Specs
+        # built by other factories are otherwise rebuilt from the outermost call, whose
+        # arguments are more likely to be picklable than the intermediate ones
+        if all(arg is not spec for arg in args):
+            _record_recipe(spec, create_spec, *args, **kwargs)
+        return spec
+
+    @functools.wraps(factory)
+    def create_spec(*args, **kwargs):
+        specs = _INTERNED_SPECS
+        if specs is None:
+            return create(*args, **kwargs)
+
+        key = (
+            create_spec,
+            _structural_key(args),
+            tuple(sorted((k, _structural_key(v)) for k, v in kwargs.items())),
+        )
+        spec = specs.get(key)
+        if spec is None:
+            spec = create(*args, **kwargs)
+            if not _has_own_state(spec):
+                spec = specs.setdefault(key, spec)
+        return spec
+
+    return cast(SpecFactory, create_spec)
+
+
+def _has_own_state(spec: "Spec") -> bool:
+    """Return :py:obj:`True` if ``spec`` keeps mutable state of its own (such as hit
+    counters), which must not be shared with other callers by interning."""
+    from dataspec.cache import CachedSpec  # pylint: disable=import-outside-toplevel
+
+    return isinstance(spec, CachedSpec) or (
+        getattr(getattr(spec, "_validate", None), "adaptive_branches", None)
+        is not None
+    )
+
+
+def _record_recipe(
+    spec: SpecT, f: Callable[..., "Spec"], *args: Any, **kwargs: Any
+) -> SpecT:
+    """Record that ``spec`` was created by calling ``f`` with ``args`` and ``kwargs``,
+    so it can be rebuilt by calling ``f`` again when it is unpickled."""
+    object.__setattr__(spec, "_recipe", (f, args, kwargs))
+    return spec
+
+
+def _rebuild_spec(
+    f: Callable[..., "Spec"], args: Tuple[Any, ...], kwargs: Mapping[str, Any]
+) -> "Spec":
+    return f(*args, **kwargs)
+
+
 @attr.s(auto_attribs=True, frozen=True, slots=True)
 class ValidatorSpec(Spec):
     """Validator Specs yield richly detailed errors from their validation functions and
@@ -368,17 +1040,51 @@ class ValidatorSpec(Spec):
     tag: Tag
     _validate: ValidatorFn
     conformer: Optional[Conformer] = None
+    _conform_or_errors_fn: Optional[ConformOrErrorsFn] = None
+    _default_conformer: Optional[Conformer] = None
 
     def validate(self, v) -> Iterator[ErrorDetails]:
         try:
             yield from _enrich_errors(self._validate(v), self.tag)
         except Exception as e:
-            yield ErrorDetails(
-                message=f"Exception occurred during Validation: {e}",
-                pred=self,
-                value=v,
-                via=[self.tag],
-            )
+            yield self._exception_error(v, e)
+
+    def _exception_error(self, v, e: Exception) -> ErrorDetails:
+        return ErrorDetails(
+            message=f"Exception occurred during Validation: {e}",
+            pred=self,
+            value=v,
+            via=[self.tag],
+        )
+
+    def _check(self, v) -> bool:
+        try:
+            check = getattr(self._validate, "check", None)
+            if check is not None:
+                return check(v)
+            for _ in self._validate(v):
+                return False
+            return True
+        except Exception:  # pylint: disable=broad-except
+            return False
+
+    def conform_or_errors(self, v: Any) -> Tuple[Any, List[ErrorDetails]]:
+        # The single-pass function was built alongside the default conformer, so
+        # it may only be used if that conformer has not since been replaced
+        if (
+            self._conform_or_errors_fn is None
+            or self.conformer is not self._default_conformer
+        ):
+            return super().conform_or_errors(v)
+
+        try:
+            conformed, errors = self._conform_or_errors_fn(v)
+        except Exception as e:
+            return INVALID, [self._exception_error(v, e)]
+
+        if errors:
+            return INVALID, [error.with_details(self.tag) for error in errors]
+        return conformed, errors
 
     @classmethod
     def from_validators(
@@ -397,6 +1103,8 @@ class ValidatorSpec(Spec):
             for pred in preds:
                 yield from pred(v)
 
+        do_validate.validators = preds  # type: ignore
+        do_validate.check = validators_check(preds)  # type: ignore
         return cls(tag, do_validate, conformer=conformer)
 
 
@@ -417,7 +1125,11 @@ class PredicateSpec(Spec):
         try:
             if not self._pred(v):
                 yield ErrorDetails(
-                    message=f"Value '{v}' does not satisfy predicate '{self.tag or self._pred}'",
+                    message=MessageTemplate(
+                        "Value '{value}' does not satisfy predicate '{pred}'",
+                        v,
+                        fmtkwargs={"pred": self.tag or self._pred},
+                    ),
                     pred=self._pred,
                     value=v,
                     via=[self.tag],
@@ -427,8 +1139,121 @@ class PredicateSpec(Spec):
                 message=f"Exception occurred during Validation: {e}", pred=self, value=v
             )
 
+    def _check(self, v) -> bool:
+        try:
+            return bool(self._pred(v))
+        except Exception:  # pylint: disable=broad-except
+            return False
 
-CollSpecKwargs = Mapping[str, Union[bool, int, Type, None]]
+
+def _requires_async(spec: Spec) -> RuntimeError:
+    return RuntimeError(
+        f"Spec '{spec.tag}' has an asynchronous predicate and must be validated "
+        "with Spec.avalidate or conformed with Spec.aconform"
+    )
+
+
+@attr.s(auto_attribs=True, frozen=True, slots=True)
+class AsyncPredicateSpec(Spec):
+    """
+    Async Predicate Specs validate data with a boolean predicate coroutine function.
+
+    Async Predicate Specs (and any Spec containing them) can only be validated and
+    conformed by :py:meth:`dataspec.Spec.avalidate` and
+    :py:meth:`dataspec.Spec.aconform`.
+    """
+
+    tag: Tag
+    _pred: AsyncPredicateFn
+    conformer: Optional[Conformer] = None
+
+    def validate(self, v) -> Iterator[ErrorDetails]:
+        raise _requires_async(self)
+
+    def _check(self, v) -> bool:
+        raise _requires_async(self)
+
+    async def _aerrors(self, v) -> List[ErrorDetails]:
+        try:
+            if await self._pred(v):
+                return []
+            return [
+                ErrorDetails(
+                    message=MessageTemplate(
+                        "Value '{value}' does not satisfy predicate '{pred}'",
+                        v,
+                        fmtkwargs={"pred": self.tag or self._pred},
+                    ),
+                    pred=self._pred,
+                    value=v,
+                    via=[self.tag],
+                )
+            ]
+        except Exception as e:  # pylint: disable=broad-except
+            return [
+                ErrorDetails(
+                    message=f"Exception occurred during Validation: {e}",
+                    pred=self,
+                    value=v,
+                )
+            ]
+
+
+@attr.s(auto_attribs=True, frozen=True, slots=True)
+class AsyncValidatorSpec(Spec):
+    """
+    Async Validator Specs validate data with an asynchronous generator function which
+    yields :py:class:`dataspec.ErrorDetails`.
+
+    Async Validator Specs (and any Spec containing them) can only be validated and
+    conformed by :py:meth:`dataspec.Spec.avalidate` and
+    :py:meth:`dataspec.Spec.aconform`.
+    """
+
+    tag: Tag
+    _validate: AsyncValidatorFn
+    conformer: Optional[Conformer] = None
+
+    def validate(self, v) -> Iterator[ErrorDetails]:
+        raise _requires_async(self)
+
+    def _check(self, v) -> bool:
+        raise _requires_async(self)
+
+    async def _aerrors(self, v) -> List[ErrorDetails]:
+        errors = []
+        try:
+            async for error in self._validate(v):
+                errors.append(error.with_details(self.tag))
+        except Exception as e:  # pylint: disable=broad-except
+            errors.append(
+                ErrorDetails(
+                    message=f"Exception occurred during Validation: {e}",
+                    pred=self,
+                    value=v,
+                    via=[self.tag],
+                )
+            )
+        return errors
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    # TypedDict is only in the typing module from Python 3.8, so it is only used to
+    # check the types of the collection Spec options
+    from typing import TypedDict  # pylint: disable=ungrouped-imports
+
+    class CollSpecKwargs(TypedDict, total=False):
+        allow_str: bool
+        maxlength: Optional[int]
+        minlength: Optional[int]
+        count: Optional[int]
+        kind: Optional[Type]
+        into: Optional[Type]
+        parallel_threshold: Optional[int]
+
+
+else:
+    CollSpecKwargs = Mapping[str, Union[bool, int, Type, None]]
 
 
 @attr.s(auto_attribs=True, frozen=True, slots=True)
@@ -438,6 +1263,9 @@ class CollSpec(Spec):
     conformer: Optional[Conformer] = None
     _out_type: Optional[Type] = None
     _validate_coll: Optional[Spec] = None
+    _default_conformer: Optional[Conformer] = None
+    _post_conformer: Optional[Conformer] = None
+    _parallel_threshold: Optional[int] = None
 
     @classmethod  # noqa: MC0001
     def from_val(
@@ -466,6 +1294,7 @@ class CollSpec(Spec):
         count: Optional[int] = kwargs.get("count", None)
         type_: Optional[Type] = kwargs.get("kind", None)
         out_type: Optional[Type] = kwargs.get("into", None)
+        parallel_threshold: Optional[int] = kwargs.get("parallel_threshold", None)
 
         if not allow_str and type_ is None:
 
@@ -538,6 +1367,7 @@ class CollSpec(Spec):
 
         if type_ and isinstance(type_, type):
 
+            @type_guard(type_)
             @pred_to_validator(
                 f"Collection is not of type {type_}",
                 complement=True,
@@ -548,27 +1378,139 @@ class CollSpec(Spec):
 
             validators.append(coll_is_type)
 
+        if parallel_threshold is not None:
+
+            if not isinstance(parallel_threshold, int):
+                raise TypeError("Collection parallel threshold must be an integer")
+
+            if parallel_threshold < 1:
+                raise ValueError("Collection parallel threshold cannot be less than 1")
+
         if validators:
             validate_coll = ValidatorSpec.from_validators("coll", *validators)
 
+        def conform_chunk(_: int, chunk: Sequence) -> List:
+            return [spec.conform_valid(e) for e in chunk]
+
         def conform_coll(v: Iterable) -> Iterable:
-            return (out_type or type(v))(spec.conform(e) for e in v)  # type: ignore[call-arg]  # noqa
+            elems = _parallel_elems(v, parallel_threshold)
+            if elems is not None:
+                return (out_type or type(v))(_map_chunks(conform_chunk, elems))  # type: ignore[call-arg]  # noqa
+            return (out_type or type(v))(spec.conform_valid(e) for e in v)  # type: ignore[call-arg]  # noqa
 
+        default_conformer = compose_conformers(conform_coll, conformer)
         return cls(
             tag or "coll",
             spec=spec,
-            conformer=compose_conformers(conform_coll, conformer),
+            conformer=default_conformer,
             out_type=out_type,
             validate_coll=validate_coll,
+            default_conformer=default_conformer,
+            post_conformer=conformer,
+            parallel_threshold=parallel_threshold,
         )
 
     def validate(self, v) -> Iterator[ErrorDetails]:
         if self._validate_coll:
             yield from _enrich_errors(self._validate_coll.validate(v), self.tag)
 
+        elems = _parallel_elems(v, self._parallel_threshold)
+        if elems is not None:
+            yield from _map_chunks(self._validate_chunk, elems)
+            return
+
         for i, e in enumerate(v):
             yield from _enrich_errors(self._spec.validate(e), self.tag, i)
 
+    def _validate_chunk(self, start: int, chunk: Sequence) -> List[ErrorDetails]:
+        # Most elements of large collections are valid, so errors are only produced
+        # for elements which fail the cheaper validity check
+        check = self._spec._check  # pylint: disable=protected-access
+        errors: List[ErrorDetails] = []
+        for i, e in enumerate(chunk, start):
+            if not check(e):
+                errors.extend(_enrich_errors(self._spec.validate(e), self.tag, i))
+        return errors
+
+    def _check(self, v) -> bool:
+        # pylint: disable=protected-access
+        if self._validate_coll is not None and not self._validate_coll._check(v):
+            return False
+
+        elems = _parallel_elems(v, self._parallel_threshold)
+        if elems is not None:
+            checks: List[bool] = _map_chunks(self._check_chunk, elems)
+            return all(checks)
+
+        for e in v:
+            if not self._spec._check(e):
+                return False
+        return True
+
+    def _check_chunk(self, _: int, chunk: Sequence) -> List[bool]:
+        check = self._spec._check  # pylint: disable=protected-access
+        for e in chunk:
+            if not check(e):
+                return [False]
+        return [True]
+
+    def _conform_chunk(
+        self, _: int, chunk: Sequence
+    ) -> List[Tuple[Any, List[ErrorDetails]]]:
+        return [self._spec.conform_or_errors(e) for e in chunk]
+
+    def conform_or_errors(self, v: Any) -> Tuple[Any, List[ErrorDetails]]:
+        if self.conformer is not self._default_conformer:
+            return super().conform_or_errors(v)
+
+        errors: List[ErrorDetails] = []
+        if self._validate_coll:
+            errors.extend(_enrich_errors(self._validate_coll.validate(v), self.tag))
+
+        elems = _parallel_elems(v, self._parallel_threshold)
+        results: Iterable[Tuple[Any, List[ErrorDetails]]]
+        if elems is not None:
+            results = _map_chunks(self._conform_chunk, elems)
+        else:
+            results = map(self._spec.conform_or_errors, v)
+
+        conformed = []
+        for i, (conformed_e, e_errors) in enumerate(results):
+            if e_errors:
+                errors.extend(_enrich_errors(e_errors, self.tag, i))
+            else:
+                conformed.append(conformed_e)
+
+        if errors:
+            return INVALID, errors
+
+        conformed_v = (self._out_type or type(v))(conformed)
+        if self._post_conformer is not None:
+            conformed_v = self._post_conformer(conformed_v)
+        return conformed_v, errors
+
+
+def _parallel_elems(v: Any, threshold: Optional[int]) -> Optional[Sequence]:
+    """Return the elements of the collection ``v`` as a sequence if it has at least
+    ``threshold`` elements, which should be validated on the shared thread pool, or
+    :py:obj:`None` otherwise."""
+    if threshold is None:
+        return None
+    try:
+        if len(v) < threshold:
+            return None
+    except TypeError:
+        return None
+    return v if isinstance(v, (list, tuple)) else list(v)
+
+
+def _map_chunks(fn: Callable[[int, Sequence], List[T]], elems: Sequence) -> List[T]:
+    from dataspec.parallel import (  # pylint: disable=import-outside-toplevel
+        map_chunks_in_threads,
+    )
+
+    return map_chunks_in_threads(fn, elems)
+
 
 T_hashable = TypeVar("T_hashable", bound=Hashable)
 
@@ -589,6 +1531,8 @@ class DictSpec(Spec):
     tag: Tag
     _keyspecs: Mapping[Hashable, _KeySpec] = attr.ib(factory=dict)
     conformer: Optional[Conformer] = None
+    _default_conformer: Optional[Conformer] = None
+    _post_conformer: Optional[Conformer] = None
 
     @classmethod
     def from_val(
@@ -613,16 +1557,19 @@ class DictSpec(Spec):
             for k, keyspec in keyspecs.items():
                 if keyspec.is_optional:
                     if k in d:
-                        conformed_d[k] = keyspec.spec.conform(d[k])
+                        conformed_d[k] = keyspec.spec.conform_valid(d[k])
                 else:
-                    conformed_d[k] = keyspec.spec.conform(d[k])
+                    conformed_d[k] = keyspec.spec.conform_valid(d[k])
 
             return conformed_d
 
+        default_conformer = compose_conformers(conform_mapping, conformer)
         return cls(
             tag or "map",
             keyspecs=keyspecs,
-            conformer=compose_conformers(conform_mapping, conformer),
+            conformer=default_conformer,
+            default_conformer=default_conformer,
+            post_conformer=conformer,
         )
 
     def validate(self, d) -> Iterator[ErrorDetails]:  # pylint: disable=arguments-differ
@@ -639,22 +1586,66 @@ class DictSpec(Spec):
                             keyspec.spec.validate(d[k]), self.tag, k
                         )
                     else:
-                        yield ErrorDetails(
-                            message=f"Mapping missing key {k}",
-                            pred=keyspec.spec,
-                            value=d,
-                            via=[self.tag],
-                            path=[k],
-                        )
+                        yield self._missing_key_error(d, k, keyspec)
         except (AttributeError, TypeError):
-            yield ErrorDetails(
-                message="Value is not a mapping type",
-                pred=self,
-                value=d,
-                via=[self.tag],
-            )
+            yield self._not_a_mapping_error(d)
             return
 
+    def _missing_key_error(self, d, k, keyspec: "_KeySpec") -> ErrorDetails:
+        return ErrorDetails(
+            message=f"Mapping missing key {k}",
+            pred=keyspec.spec,
+            value=d,
+            via=[self.tag],
+            path=[k],
+        )
+
+    def _not_a_mapping_error(self, d) -> ErrorDetails:
+        return ErrorDetails(
+            message="Value is not a mapping type", pred=self, value=d, via=[self.tag],
+        )
+
+    def _check(self, d) -> bool:  # pylint: disable=arguments-differ
+        # pylint: disable=protected-access
+        try:
+            for k, keyspec in self._keyspecs.items():
+                if k in d:
+                    if not keyspec.spec._check(d[k]):
+                        return False
+                elif not keyspec.is_optional:
+                    return False
+        except (AttributeError, TypeError):
+            return False
+        return True
+
+    def conform_or_errors(  # pylint: disable=arguments-differ
+        self, d
+    ) -> Tuple[Any, List[ErrorDetails]]:
+        if self.conformer is not self._default_conformer:
+            return super().conform_or_errors(d)
+
+        errors: List[ErrorDetails] = []
+        conformed_d = {}
+        try:
+            for k, keyspec in self._keyspecs.items():
+                if k in d:
+                    conformed_v, v_errors = keyspec.spec.conform_or_errors(d[k])
+                    if v_errors:
+                        errors.extend(_enrich_errors(v_errors, self.tag, k))
+                    else:
+                        conformed_d[k] = conformed_v
+                elif not keyspec.is_optional:
+                    errors.append(self._missing_key_error(d, k, keyspec))
+        except (AttributeError, TypeError):
+            errors.append(self._not_a_mapping_error(d))
+
+        if errors:
+            return INVALID, errors
+
+        if self._post_conformer is not None:
+            return self._post_conformer(conformed_d), errors
+        return conformed_d, errors
+
     # pylint: disable=protected-access
     @classmethod
     def merge(
@@ -679,6 +1670,7 @@ class DictSpec(Spec):
         )
 
 
+@spec_factory
 def kv_spec(
     tag_or_pred: Union[Tag, SpecPredicate],
     *preds: SpecPredicate,
@@ -723,6 +1715,23 @@ def kv_spec(
     keyspec = make_spec(preds[0])
     valspec = make_spec(preds[1])
 
+    def _kv_check(d) -> bool:
+        # pylint: disable=protected-access
+        try:
+            for k, v in d.items():
+                if not keyspec._check(k) or not valspec._check(v):
+                    return False
+        except (AttributeError, TypeError):
+            return False
+        return True
+
+    def _not_a_mapping_error(d) -> ErrorDetails:
+        assert tag is not None
+        return ErrorDetails(
+            message="Value is not a mapping type", pred=_kv_valid, value=d, via=[tag],
+        )
+
+    @with_check(_kv_check)
     def _kv_valid(d) -> Iterator[ErrorDetails]:
         assert tag is not None
 
@@ -731,26 +1740,56 @@ def kv_spec(
                 yield from _enrich_errors(keyspec.validate(k), tag, d)
                 yield from _enrich_errors(valspec.validate(v), tag, k)
         except (AttributeError, TypeError):
-            yield ErrorDetails(
-                message="Value is not a mapping type",
-                pred=_kv_valid,
-                value=d,
-                via=[tag],
-            )
+            yield _not_a_mapping_error(d)
             return
 
+    _kv_valid.combinator = (  # type: ignore
+        "kv",
+        (tag, keyspec, valspec, _not_a_mapping_error),
+        {"conform_keys": conform_keys, "conformer": conformer},
+    )
+
     if conform_keys:
 
         def conform_mapping(d: Mapping) -> Mapping:
-            return {keyspec.conform(k): valspec.conform(v) for k, v in d.items()}
+            return {
+                keyspec.conform_valid(k): valspec.conform_valid(v) for k, v in d.items()
+            }
 
     else:
 
         def conform_mapping(d: Mapping) -> Mapping:
-            return {k: valspec.conform(v) for k, v in d.items()}
+            return {k: valspec.conform_valid(v) for k, v in d.items()}
+
+    def _kv_conform_or_errors(d) -> Tuple[Any, List[ErrorDetails]]:
+        assert tag is not None
+
+        errors: List[ErrorDetails] = []
+        conformed_d = {}
+        try:
+            for k, v in d.items():
+                conformed_k, k_errors = keyspec.conform_or_errors(k)
+                errors.extend(_enrich_errors(k_errors, tag, d))
+                conformed_v, v_errors = valspec.conform_or_errors(v)
+                errors.extend(_enrich_errors(v_errors, tag, k))
+                if not errors:
+                    conformed_d[conformed_k if conform_keys else k] = conformed_v
+        except (AttributeError, TypeError):
+            errors.append(_not_a_mapping_error(d))
 
+        if errors:
+            return INVALID, errors
+        if conformer is not None:
+            return conformer(conformed_d), errors
+        return conformed_d, errors
+
+    default_conformer = compose_conformers(conform_mapping, conformer)
     return ValidatorSpec(
-        tag, _kv_valid, conformer=compose_conformers(conform_mapping, conformer),
+        tag,
+        _kv_valid,
+        conformer=default_conformer,
+        conform_or_errors_fn=_kv_conform_or_errors,
+        default_conformer=default_conformer,
     )
 
 
@@ -796,18 +1835,32 @@ class ObjectSpec(Spec):
             if hasattr(o, k):
                 yield from _enrich_errors(vspec.validate(getattr(o, k)), self.tag, k)
             else:
-                yield ErrorDetails(
-                    message=f"Object missing attribute '{k}'",
-                    pred=vspec,
-                    value=o,
-                    via=[self.tag],
-                    path=[k],
-                )
+                yield self._missing_attr_error(o, k, vspec)
 
         for k, vspec in self._optattrspecs.items():
             if hasattr(o, k):
                 yield from _enrich_errors(vspec.validate(getattr(o, k)), self.tag, k)
 
+    def _missing_attr_error(self, o, k: str, vspec: Spec) -> ErrorDetails:
+        return ErrorDetails(
+            message=f"Object missing attribute '{k}'",
+            pred=vspec,
+            value=o,
+            via=[self.tag],
+            path=[k],
+        )
+
+    def _check(self, o) -> bool:  # pylint: disable=arguments-differ
+        # pylint: disable=protected-access
+        for k, vspec in self._reqattrspecs.items():
+            if not hasattr(o, k) or not vspec._check(getattr(o, k)):
+                return False
+
+        for k, vspec in self._optattrspecs.items():
+            if hasattr(o, k) and not vspec._check(getattr(o, k)):
+                return False
+        return True
+
 
 def _enum_conformer(e: EnumMeta) -> Conformer:
     """Create a conformer for Enum types which accepts Enum instances, Enum values,
@@ -834,12 +1887,19 @@ class SetSpec(Spec):
     def validate(self, v) -> Iterator[ErrorDetails]:
         if v not in self._values:
             yield ErrorDetails(
-                message=f"Value '{v}' not in '{self._values}'",
+                message=MessageTemplate(
+                    "Value '{value}' not in '{values}'",
+                    v,
+                    fmtkwargs={"values": self._values},
+                ),
                 pred=self._values,
                 value=v,
                 via=[self.tag],
             )
 
+    def _check(self, v) -> bool:
+        return v in self._values
+
     @classmethod
     def from_enum(
         cls, tag: Optional[Tag], pred: EnumMeta, conformer: Optional[Conformer] = None
@@ -865,6 +1925,8 @@ class TupleSpec(Spec):
     _specs: Tuple[Spec, ...]
     conformer: Optional[Conformer] = None
     _namedtuple: Optional[Type[NamedTuple]] = None
+    _default_conformer: Optional[Conformer] = None
+    _post_conformer: Optional[Conformer] = None
 
     @classmethod
     def from_val(
@@ -885,34 +1947,85 @@ class TupleSpec(Spec):
 
         def conform_tuple(v) -> Union[Tuple, NamedTuple]:
             return ((namedtuple_type and namedtuple_type._make) or tuple)(
-                spec.conform(v) for spec, v in zip(specs, v)
+                spec.conform_valid(v) for spec, v in zip(specs, v)
             )
 
+        default_conformer = compose_conformers(conform_tuple, conformer)
         return cls(
             tag or "tuple",
             pred=pred,
             specs=specs,
-            conformer=compose_conformers(conform_tuple, conformer),
+            conformer=default_conformer,
             namedtuple=namedtuple_type,  # type: ignore
+            default_conformer=default_conformer,
+            post_conformer=conformer,
         )
 
     def validate(self, t) -> Iterator[ErrorDetails]:  # pylint: disable=arguments-differ
         try:
             if len(t) != len(self._specs):
-                yield ErrorDetails(
-                    message=f"Expected {len(self._specs)} values; found {len(t)}",
-                    pred=self,
-                    value=len(t),
-                    via=[self.tag],
-                )
+                yield self._length_error(t)
                 return
 
             for i, (e_pred, elem) in enumerate(zip(self._specs, t)):
                 yield from _enrich_errors(e_pred.validate(elem), self.tag, i)
         except TypeError:
-            yield ErrorDetails(
-                message=f"Value is not a tuple type", pred=self, value=t, via=[self.tag]
-            )
+            yield self._not_a_tuple_error(t)
+
+    def _length_error(self, t) -> ErrorDetails:
+        return ErrorDetails(
+            message=f"Expected {len(self._specs)} values; found {len(t)}",
+            pred=self,
+            value=len(t),
+            via=[self.tag],
+        )
+
+    def _not_a_tuple_error(self, t) -> ErrorDetails:
+        return ErrorDetails(
+            message="Value is not a tuple type", pred=self, value=t, via=[self.tag]
+        )
+
+    def _check(self, t) -> bool:  # pylint: disable=arguments-differ
+        try:
+            if len(t) != len(self._specs):
+                return False
+
+            for e_pred, elem in zip(self._specs, t):
+                if not e_pred._check(elem):  # pylint: disable=protected-access
+                    return False
+        except TypeError:
+            return False
+        return True
+
+    def conform_or_errors(  # pylint: disable=arguments-differ
+        self, t
+    ) -> Tuple[Any, List[ErrorDetails]]:
+        if self.conformer is not self._default_conformer:
+            return super().conform_or_errors(t)
+
+        errors: List[ErrorDetails] = []
+        conformed = []
+        try:
+            if len(t) != len(self._specs):
+                return INVALID, [self._length_error(t)]
+
+            for i, (e_pred, elem) in enumerate(zip(self._specs, t)):
+                conformed_e, e_errors = e_pred.conform_or_errors(elem)
+                if e_errors:
+                    errors.extend(_enrich_errors(e_errors, self.tag, i))
+                else:
+                    conformed.append(conformed_e)
+        except TypeError:
+            errors.append(self._not_a_tuple_error(t))
+
+        if errors:
+            return INVALID, errors
+
+        make = tuple if self._namedtuple is None else self._namedtuple._make
+        conformed_t: Any = make(conformed)
+        if self._post_conformer is not None:
+            conformed_t = self._post_conformer(conformed_t)
+        return conformed_t, errors
 
 
 def _enrich_errors(
@@ -956,6 +2069,7 @@ def compose_conformers(*conformers: Optional[Conformer]) -> Optional[Conformer]:
     return do_conform
 
 
+@spec_factory
 def all_spec(
     tag_or_pred: Union[Tag, SpecPredicate],
     *preds: SpecPredicate,
@@ -1007,29 +2121,232 @@ def all_spec(
 
     specs = [make_spec(pred) for pred in preds]
 
+    def _all_check(e) -> bool:
+        for spec in specs:
+            if not spec._check(e):  # pylint: disable=protected-access
+                return False
+            e = spec.conform_valid(e)
+        return True
+
+    @with_check(_all_check)
     def _all_valid(e) -> Iterator[ErrorDetails]:
         """Validate e against successive conformations to spec in specs."""
 
         for spec in specs:
-            errors = []
+            failed = False
             for error in spec.validate(e):
-                errors.append(error)
-            if errors:
-                yield from errors
+                failed = True
+                yield error
+            if failed:
                 return
             e = spec.conform_valid(e)
 
+    _all_valid.combinator = ("all", (specs,), {"conformer": conformer})  # type: ignore
+
+    def _all_conform_or_errors(e) -> Tuple[Any, List[ErrorDetails]]:
+        for spec in specs:
+            e, errors = spec.conform_or_errors(e)
+            if errors:
+                return INVALID, errors
+
+        if conformer is not None and not isinstance(e, Invalid):
+            e = conformer(e)
+        return e, []
+
+    default_conformer = compose_conformers(
+        *(spec.conformer for spec in specs), conformer,
+    )
     return ValidatorSpec(
         tag or "all",
         _all_valid,
-        conformer=compose_conformers(*(spec.conformer for spec in specs), conformer,),
+        conformer=default_conformer,
+        conform_or_errors_fn=_all_conform_or_errors,
+        default_conformer=default_conformer,
     )
 
 
+_NUMERIC_TYPES = (bool, int, float, complex)
+
+
+def _type_guard(spec: Spec) -> Optional[Tuple[type, ...]]:
+    """Return a tuple of types of which every value valid for ``spec`` is an instance
+    (as by :py:func:`isinstance`), if ``spec`` begins with a type guard; otherwise
+    return :py:obj:`None`."""
+    if not isinstance(spec, ValidatorSpec):
+        return None
+
+    validate = spec._validate  # pylint: disable=protected-access
+    for validator in getattr(validate, "validators", (validate,)):
+        tp = getattr(validator, "type_guard", None)
+        if tp is not None:
+            return tp if isinstance(tp, tuple) else (tp,)
+
+    combinator = getattr(validate, "combinator", None)
+    if combinator is not None:
+        kind, args, _ = combinator
+        if kind == "all":
+            # Later Specs validate the value conformed by earlier Specs
+            return _type_guard(args[0][0])
+        elif kind == "any":
+            guards = [_type_guard(child) for child in args[0]]
+            if all(guard is not None for guard in guards):
+                return tuple(chain.from_iterable(guards))  # type: ignore[arg-type]
+    return None
+
+
+def _set_types(spec: Spec) -> Optional[FrozenSet[type]]:
+    """Return the set of scalar types which could compare equal to a value of a set
+    Spec, if every value of the set is a scalar; otherwise return :py:obj:`None`."""
+    if not isinstance(spec, SetSpec):
+        return None
+
+    types: Set[type] = set()
+    for v in spec._values:  # pylint: disable=protected-access
+        tp = type(v)
+        if tp not in _STRUCTURAL_VALUE_TYPES:
+            return None
+        # Numbers of different types may compare equal
+        types.update(_NUMERIC_TYPES if tp in _NUMERIC_TYPES else (tp,))
+    return frozenset(types)
+
+
+def _branch_table(specs: Sequence[Spec]) -> Dict[type, Tuple[Spec, ...]]:
+    """
+    Return a mapping of value types to the Specs in ``specs`` which could possibly
+    validate a value of exactly that type, in their original order.
+
+    Specs beginning with a type guard can only validate instances of the guarded
+    types and set Specs of scalar values can only validate scalars of the same types,
+    so such Specs are omitted for value types they cannot validate. Every other Spec
+    is included for every type. Value types which are not in the mapping could be
+    validated by any of the Specs.
+    """
+    guards = [_type_guard(spec) for spec in specs]
+    set_types = [_set_types(spec) for spec in specs]
+
+    types: Set[type] = set()
+    for guard, scalar_types in zip(guards, set_types):
+        types.update(guard or scalar_types or ())
+
+    table = {}
+    for tp in types:
+        candidates = []
+        for spec, guard, scalar_types in zip(specs, guards, set_types):
+            if guard is not None:
+                if not issubclass(tp, guard):
+                    continue
+            elif scalar_types is not None:
+                # Instances of other types may define equality with scalars
+                if tp in _STRUCTURAL_VALUE_TYPES and tp not in scalar_types:
+                    continue
+            candidates.append(spec)
+        if len(candidates) < len(specs):
+            table[tp] = tuple(candidates)
+    return table
+
+
+class BranchInfo(NamedTuple):
+    """Statistics for one constituent Spec of an adaptive
+    :py:meth:`dataspec.SpecAPI.any` Spec, as returned by
+    :py:func:`dataspec.branch_info`.
+
+    ``position`` is the position of the constituent Spec in the order in which the
+    constituent Specs were given."""
+
+    position: int
+    tag: Tag
+    hits: int
+
+
+# Number of checks between each reordering of the branches of an adaptive any Spec
+_REORDER_INTERVAL = 1000
+
+
+class _AdaptiveBranches:
+    """
+    Check values against the constituent Specs of an adaptive ``any`` Spec in
+    descending order of the number of values each Spec has validated.
+
+    Counters are updated without a lock, so they may undercount slightly when a Spec
+    is shared between threads; they only ever affect the order in which Specs are
+    checked and never the result.
+    """
+
+    __slots__ = ("_specs", "_candidates", "_orders", "_default", "_countdown", "hits")
+
+    def __init__(
+        self, specs: Sequence[Spec], branches: Mapping[type, Tuple[Spec, ...]]
+    ):
+        self._specs = specs
+        indices = {id(spec): i for i, spec in enumerate(specs)}
+        self._candidates = {
+            tp: tuple(indices[id(spec)] for spec in candidates)
+            for tp, candidates in branches.items()
+        }
+        self._orders = self._candidates
+        self._default = tuple(range(len(specs)))
+        self._countdown = _REORDER_INTERVAL
+        self.hits = [0] * len(specs)
+
+    def check(self, e) -> bool:
+        self._countdown -= 1
+        if self._countdown <= 0:
+            self._reorder()
+
+        specs = self._specs
+        for i in self._orders.get(type(e), self._default):
+            if specs[i]._check(e):  # pylint: disable=protected-access
+                self.hits[i] += 1
+                return True
+        return False
+
+    def _reorder(self) -> None:
+        self._countdown = _REORDER_INTERVAL
+        hits = self.hits
+
+        def by_hits(indices: Iterable[int]) -> Tuple[int, ...]:
+            return tuple(sorted(indices, key=lambda i: -hits[i]))
+
+        self._default = by_hits(range(len(self._specs)))
+        self._orders = {
+            tp: by_hits(candidates) for tp, candidates in self._candidates.items()
+        }
+
+    def info(self) -> List[BranchInfo]:
+        return [
+            BranchInfo(i, spec.tag, hits)
+            for i, (spec, hits) in enumerate(zip(self._specs, self.hits))
+        ]
+
+
+def branch_info(spec: Spec) -> List[BranchInfo]:
+    """
+    Return a list of :py:class:`dataspec.BranchInfo` for each constituent Spec of the
+    adaptive :py:meth:`dataspec.SpecAPI.any` Spec ``spec``, in the order in which the
+    constituent Specs were given.
+
+    ``hits`` is the number of values which the constituent Spec was the first to
+    validate while checking them against ``spec``.
+
+    :param spec: a Spec created by :py:meth:`dataspec.SpecAPI.any` with
+        ``adaptive=True`` (or a compiled or cached copy of such a Spec)
+    :return: a list of :py:class:`dataspec.BranchInfo`
+    """
+    while getattr(spec, "source", None) is not None:
+        spec = spec.source  # type: ignore[attr-defined]
+
+    branches = getattr(getattr(spec, "_validate", None), "adaptive_branches", None)
+    if branches is None:
+        raise TypeError(f"Spec '{spec.tag}' is not an adaptive 'any' Spec")
+    return branches.info()
+
+
+@spec_factory
 def any_spec(
     tag_or_pred: Union[Tag, SpecPredicate],
     *preds: SpecPredicate,
     tag_conformed: bool = False,
+    adaptive: bool = False,
     conformer: Optional[Conformer] = None,
 ) -> Spec:
     """
@@ -1037,7 +2354,11 @@ def any_spec(
     number of input Specs.
 
     The returned Spec validates input values against the input Specs in the order
-    they are passed into this function.
+    they are passed into this function. Input Specs which begin by checking the type
+    of the input value (such as those created by :py:meth:`dataspec.SpecAPI.str` and
+    :py:meth:`dataspec.SpecAPI.num`) and set Specs of strings, bytes, numbers, or
+    :py:obj:`None` are skipped without being called for values of builtin types they
+    could never validate. Skipping such Specs does not change the result.
 
     If the returned Spec fails to validate the input value, the
     :py:meth:`dataspec.Spec.validate` method will emit a stream of
@@ -1055,6 +2376,15 @@ def any_spec(
     If ``tag_conformed`` is not specified (which is the default), the conformer will
     emit the conformed value directly.
 
+    If ``adaptive`` is :py:obj:`True`, the returned Spec counts the number of values
+    each constituent Spec validates and, every 1000 values, reorders the constituent
+    Specs so that :py:meth:`dataspec.Spec.is_valid` (and the check which precedes
+    collecting errors in :py:meth:`dataspec.Spec.validate`) tries the most frequently
+    successful Specs first. Conformed values and errors are unaffected: conformers
+    always select the first constituent Spec *in the order given* which validates
+    the value and errors are always produced in that order. The counts are available
+    from :py:func:`dataspec.branch_info`.
+
     If no Specs or Spec predicates are given, a :py:class:`ValueError` will be raised.
     If only one Spec or Spec predicate is provided, it will be passed to
     :py:func:`dataspec.s` with the given ``tag`` and ``conformer`` and the value
@@ -1067,6 +2397,8 @@ def any_spec(
     :param tag_conformed: if :py:obj:`True`, the conformed value will be wrapped in a
         2-tuple where the first element is the successful spec and the second element
         is the conformed value; if :py:obj:`False`, return only the conformed value
+    :param adaptive: if :py:obj:`True`, check constituent Specs in descending order
+        of the number of values they have validated
     :param conformer: an optional conformer for the value
     :return: a Spec
     """
@@ -1083,22 +2415,40 @@ def any_spec(
         )
 
     specs = [make_spec(pred) for pred in preds]
+    branches = _branch_table(specs)
+    adaptive_branches = _AdaptiveBranches(specs, branches) if adaptive else None
+
+    _any_check: Callable[[Any], bool]
+    if adaptive_branches is not None:
+        _any_check = adaptive_branches.check
+    else:
 
+        def _any_check(e) -> bool:
+            for spec in branches.get(type(e), specs):
+                if spec._check(e):  # pylint: disable=protected-access
+                    return True
+            return False
+
+    @with_check(_any_check)
     def _any_valid(e) -> Iterator[ErrorDetails]:
-        errors = []
+        # Checking every branch up front allows the errors from each failing branch
+        # to be produced lazily, rather than collecting them all before yielding
+        if _any_check(e):
+            return
+
         for spec in specs:
-            spec_errors = list(spec.validate(e))
-            if spec_errors:
-                errors.extend(spec_errors)
-            else:
-                return
+            yield from spec.validate(e)
 
-        yield from errors
+    _any_valid.combinator = (  # type: ignore
+        "any",
+        (specs,),
+        {"conformer": conformer, "tag_conformed": tag_conformed},
+    )
+    _any_valid.adaptive_branches = adaptive_branches  # type: ignore
 
     def _conform_any(e):
-        for spec in specs:
-            spec_errors = list(spec.validate(e))
-            if spec_errors:
+        for spec in branches.get(type(e), specs):
+            if not spec._check(e):  # pylint: disable=protected-access
                 continue
 
             conformed = spec.conform_valid(e)
@@ -1111,9 +2461,156 @@ def any_spec(
 
         return INVALID
 
-    return ValidatorSpec(tag or "any", _any_valid, conformer=_conform_any)
+    def _any_conform_or_errors(e) -> Tuple[Any, List[ErrorDetails]]:
+        errors = []
+        for spec in specs:
+            conformed, spec_errors = spec.conform_or_errors(e)
+            if spec_errors:
+                errors.extend(spec_errors)
+                continue
+
+            if conformer is not None:
+                conformed = conformer(conformed)
+            if tag_conformed:
+                conformed = (spec.tag, conformed)
+            return conformed, []
+
+        return INVALID, errors
+
+    return ValidatorSpec(
+        tag or "any",
+        _any_valid,
+        conformer=_conform_any,
+        conform_or_errors_fn=_any_conform_or_errors,
+        default_conformer=_conform_any,
+    )
+
+
+@spec_factory
+def union_spec(
+    key: Hashable,
+    variants: Mapping[Hashable, SpecPredicate],
+    tag: Optional[Tag] = None,
+    conformer: Optional[Conformer] = None,
+) -> Spec:
+    """
+    Return a Spec which validates mappings against one of several variant Specs,
+    selected by the value of the discriminator key ``key`` in the mapping.
+
+    Unlike :py:meth:`dataspec.SpecAPI.any`, which tries every constituent Spec in
+    turn, the returned Spec looks up the Spec for the value of ``key`` in ``variants``
+    and validates and conforms the input value against only that Spec. The variant
+    Specs receive the entire input mapping (including the discriminator key).
+
+    If the input value is not a mapping, does not contain ``key``, or contains a value
+    for ``key`` which is not a key in ``variants``, the returned Spec's
+    :py:meth:`dataspec.Spec.validate` method will emit a single
+    :py:class:`dataspec.ErrorDetails` whose ``path`` is ``[key]``. Otherwise, it will
+    emit the errors of the selected variant Spec, if any.
+
+    The conformer for the returned Spec is the conformer of the selected variant Spec.
+    If a ``conformer`` is specified for this Spec, that conformer will be applied after
+    the variant Spec's conformer.
+
+    If no variants are given, a :py:class:`ValueError` will be raised.
+
+    :param key: the mapping key whose value selects the variant Spec
+    :param variants: a mapping of discriminator values to Specs or values which can be
+        converted into Specs
+    :param tag: an optional tag for the resulting spec; default is ``"union"``
+    :param conformer: an optional conformer for the value
+    :return: a Spec
+    """
+    if not variants:
+        raise ValueError("Must provide at least one variant for 'union' Specs")
+
+    tag = tag or "union"
+    specs = {k: make_spec(pred) for k, pred in variants.items()}
+
+    def _variant(d) -> Optional[Spec]:
+        # Check for the key before looking it up, since looking up a missing key in a
+        # defaultdict would add it to the value being validated
+        if not isinstance(d, Mapping) or key not in d:
+            return None
+        try:
+            return specs.get(d[key])
+        except TypeError:
+            return None
+
+    def _variant_error(d) -> ErrorDetails:
+        if not isinstance(d, Mapping):
+            return ErrorDetails(
+                message="Value is not a mapping type", pred=_union_valid, value=d,
+            )
+        if key not in d:
+            return ErrorDetails(
+                message=f"Mapping missing key {key}",
+                pred=_union_valid,
+                value=d,
+                path=[key],
+            )
+        discriminator = d[key]
+        return ErrorDetails(
+            message=MessageTemplate(
+                "Value '{value}' for key {key} not in {allowed}",
+                discriminator,
+                fmtkwargs={"key": key, "allowed": list(specs)},
+            ),
+            pred=_union_valid,
+            value=discriminator,
+            path=[key],
+        )
+
+    def _union_check(d) -> bool:
+        spec = _variant(d)
+        return spec is not None and spec._check(d)  # pylint: disable=protected-access
+
+    @with_check(_union_check)
+    def _union_valid(d) -> Iterator[ErrorDetails]:
+        spec = _variant(d)
+        if spec is None:
+            yield _variant_error(d)
+            return
+        yield from spec.validate(d)
+
+    _union_valid.combinator = (  # type: ignore
+        "union",
+        (specs, _variant, _variant_error),
+        {"conformer": conformer},
+    )
+
+    def _conform_union(d):
+        spec = _variant(d)
+        if spec is None:
+            return INVALID
 
+        conformed = spec.conform_valid(d)
+        if conformer is not None and not isinstance(conformed, Invalid):
+            conformed = conformer(conformed)
+        return conformed
 
+    def _union_conform_or_errors(d) -> Tuple[Any, List[ErrorDetails]]:
+        spec = _variant(d)
+        if spec is None:
+            return INVALID, [_variant_error(d)]
+
+        conformed, errors = spec.conform_or_errors(d)
+        if errors:
+            return INVALID, errors
+        if conformer is not None:
+            conformed = conformer(conformed)
+        return conformed, errors
+
+    return ValidatorSpec(
+        tag,
+        _union_valid,
+        conformer=_conform_union,
+        conform_or_errors_fn=_union_conform_or_errors,
+        default_conformer=_conform_union,
+    )
+
+
+@spec_factory
 def merge_spec(
     tag_or_pred: Union[Tag, SpecPredicate],
     *preds: SpecPredicate,
@@ -1224,28 +2721,118 @@ def pred_to_validator(
     assert "value" not in fmtkwargs, "Key 'value' is not allowed in pred format kwargs"
 
     def to_validator(pred: PredicateFn) -> ValidatorFn:
+        orig_pred = pred
         pred = _complement(pred) if complement else pred
 
         @functools.wraps(pred)
         def validator(v) -> Iterable[ErrorDetails]:
             if pred(v):
                 yield ErrorDetails(
-                    message=message.format(value=convert_value(v), **fmtkwargs),
+                    message=MessageTemplate(
+                        message, v, convert_value=convert_value, fmtkwargs=fmtkwargs
+                    ),
                     pred=pred,
                     value=v,
                 )
 
+        if complement:
+
+            def check(v) -> bool:
+                return bool(orig_pred(v))
+
+        else:
+
+            def check(v) -> bool:
+                return not orig_pred(v)
+
         validator.is_validator_fn = True  # type: ignore
+        # Keep the undecorated predicate around so callers which only need to know
+        # whether a value is valid can skip creating ErrorDetails entirely
+        validator.pred = orig_pred  # type: ignore
+        validator.complement = complement  # type: ignore
+        validator.check = check  # type: ignore
         return validator
 
     return to_validator
 
 
+def type_guard(
+    tp: Union[Type, Tuple[Type, ...]]
+) -> Callable[[ValidatorFn], ValidatorFn]:
+    """
+    Decorator which marks a validator function as checking only that its input value
+    is an instance of ``tp`` (as by :py:func:`isinstance`).
+
+    Validators produced by :py:func:`dataspec.pred_to_validator` are otherwise opaque;
+    the mark allows tools such as :py:meth:`dataspec.Spec.compile` to perform the type
+    check directly rather than calling the validator.
+    """
+
+    def check(v) -> bool:
+        return isinstance(v, tp)
+
+    def mark_type_guard(validator: ValidatorFn) -> ValidatorFn:
+        validator.type_guard = tp  # type: ignore
+        validator.check = check  # type: ignore
+        return validator
+
+    return mark_type_guard
+
+
+def with_check(check: PredicateFn) -> Callable[[ValidatorFn], ValidatorFn]:
+    """
+    Decorator which attaches a boolean ``check`` function to a validator function.
+
+    ``check`` must return :py:obj:`True` for exactly the values for which the validator
+    function yields no :py:class:`dataspec.ErrorDetails`. Validator Specs use the check
+    function to answer :py:meth:`dataspec.Spec.is_valid` without creating generators or
+    error objects. Validators produced by :py:func:`dataspec.pred_to_validator` have a
+    check function attached automatically.
+    """
+
+    def attach_check(validator: ValidatorFn) -> ValidatorFn:
+        validator.check = check  # type: ignore
+        return validator
+
+    return attach_check
+
+
+def validator_check(validate: ValidatorFn) -> PredicateFn:
+    """Return the boolean check function attached to the validator function
+    ``validate`` or a check function which consumes the first error of ``validate``
+    if none is attached."""
+    check = getattr(validate, "check", None)
+    if check is not None:
+        return check
+
+    def check_validator(v) -> bool:
+        for _ in validate(v):
+            return False
+        return True
+
+    return check_validator
+
+
+def validators_check(validators: Iterable[ValidatorFn]) -> PredicateFn:
+    """Return a boolean check function which is :py:obj:`True` for values which pass
+    every one of ``validators``, as by :py:func:`dataspec.base.validator_check`."""
+    checks = [validator_check(validate) for validate in validators]
+
+    def check_all(v) -> bool:
+        for check in checks:
+            if not check(v):
+                return False
+        return True
+
+    return check_all
+
+
 def type_spec(
     tag: Optional[Tag] = None, tp: Type = object, conformer: Optional[Conformer] = None
 ) -> Spec:
     """Return a spec that validates inputs are instances of tp."""
 
+    @type_guard(tp)
     @pred_to_validator(f"Value '{{value}}' is not a {tp.__name__}", complement=True)
     def is_instance_of_type(v: Any) -> bool:
         return isinstance(v, tp)
@@ -1255,6 +2842,42 @@ def type_spec(
     )
 
 
+def _signature_returns_errors(pred: Callable) -> bool:
+    """Return True if ``pred`` is annotated to return ``Iterator[ErrorDetails]``."""
+    try:
+        sig = inspect.signature(pred)
+    except (TypeError, ValueError):
+        # Some builtins may not be inspectable
+        return False
+    return sig.return_annotation is Iterator[ErrorDetails]
+
+
+# Inspecting the signature of a function is one of the most expensive steps of
+# creating a Spec, so the result is cached for each predicate function
+_RETURNS_ERRORS: "weakref.WeakKeyDictionary[Callable, bool]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _returns_errors(pred: Callable) -> bool:
+    """Return True if ``pred`` is annotated to return ``Iterator[ErrorDetails]``,
+    caching the result for predicates which can be weakly referenced."""
+    try:
+        return _RETURNS_ERRORS[pred]
+    except (KeyError, TypeError):
+        pass
+
+    returns_errors = _signature_returns_errors(pred)
+    try:
+        _RETURNS_ERRORS[pred] = returns_errors
+    except TypeError:
+        # Builtin functions cannot be weakly referenced and some callable objects
+        # are not hashable
+        pass
+    return returns_errors
+
+
+@spec_factory
 def make_spec(  # pylint: disable=inconsistent-return-statements  # noqa: MC0001
     tag_or_pred: Union[Tag, SpecPredicate],
     *preds: SpecPredicate,
@@ -1269,6 +2892,12 @@ def make_spec(  # pylint: disable=inconsistent-return-statements  # noqa: MC0001
     yields consecutive ``ErrorDetails`` (in particular, the return annotation should
     be *exactly* ``Iterator[ErrorDetails]`` ).
 
+    Specs may also be created from coroutine functions which take a single argument
+    and return a boolean value and from asynchronous generator functions which take a
+    single argument and yield consecutive ``ErrorDetails``. Such Specs (and any Spec
+    containing them) can only be validated and conformed by
+    :py:meth:`dataspec.Spec.avalidate` and :py:meth:`dataspec.Spec.aconform`.
+
     Specs may be created from Python types, in which case a Spec will be produced
     that performs an :py:func:`isinstance` check. :py:obj:`None` may be provided as
     a shortcut for ``type(None)``. To specify a nilable value, you should use
@@ -1363,15 +2992,15 @@ def make_spec(  # pylint: disable=inconsistent-return-statements  # noqa: MC0001
     elif isinstance(pred, type):
         return type_spec(tag, pred, conformer=conformer)
     elif callable(pred):
-        try:
-            sig: Optional[inspect.Signature] = inspect.signature(pred)
-        except (TypeError, ValueError):
-            # Some builtins may not be inspectable
-            sig = None
-
-        if (
-            sig is not None and sig.return_annotation is Iterator[ErrorDetails]
-        ) or getattr(pred, "is_validator_fn", False):
+        if inspect.isasyncgenfunction(pred):
+            return AsyncValidatorSpec(
+                tag or pred.__name__, cast(AsyncValidatorFn, pred), conformer=conformer
+            )
+        elif inspect.iscoroutinefunction(pred):
+            return AsyncPredicateSpec(
+                tag or pred.__name__, cast(AsyncPredicateFn, pred), conformer=conformer
+            )
+        elif getattr(pred, "is_validator_fn", False) or _returns_errors(pred):
             return ValidatorSpec(
                 tag or pred.__name__, cast(ValidatorFn, pred), conformer=conformer
             )
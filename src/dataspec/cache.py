@@ -0,0 +1,277 @@
+"""
+Memoize the results of validating and conforming values with a Spec.
+
+Many datasets repeat a small number of distinct values (status codes, identifiers,
+dates) many times over. Specs for such values may run regular expressions or parsers
+on each occurrence. A cached Spec remembers whether each recently seen value was
+valid and what it conformed to, evicting the least recently used values once the
+cache is full and, optionally, values which were cached longer ago than a fixed
+time-to-live.
+"""
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import date, datetime, time as dtime, timedelta
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Hashable, Iterator, List, NamedTuple, Optional, Tuple
+
+import attr
+
+from dataspec.base import INVALID, Conformer, ErrorDetails, Invalid, Spec, Tag
+
+# Cache entries are lists of the validity of the value (or None if it is not yet
+# known), its conformed value (or _MISSING if it has not been conformed), and the
+# time at which the entry expires (or None if entries do not expire)
+_VALID = 0
+_CONFORMED = 1
+_EXPIRES = 2
+
+_MISSING = object()
+
+# Conformed values of these types are immutable, so they may be cached and returned to
+# every caller; conformed values of any other type are recomputed for each caller
+_IMMUTABLE_TYPES = frozenset(
+    {
+        bool,
+        bytes,
+        complex,
+        date,
+        datetime,
+        dtime,
+        Decimal,
+        float,
+        int,
+        Invalid,
+        str,
+        timedelta,
+        type(None),
+        uuid.UUID,
+    }
+)
+
+
+class CacheInfo(NamedTuple):
+    """Statistics describing the effectiveness of a :py:class:`CachedSpec` cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+def _is_immutable(v: Any) -> bool:
+    """Return :py:obj:`True` if ``v`` is a value of an immutable type or a tuple or
+    frozenset of such values."""
+    if type(v) in _IMMUTABLE_TYPES or isinstance(v, Enum):
+        return True
+    elif isinstance(v, (tuple, frozenset)):
+        return all(_is_immutable(e) for e in v)
+    return False
+
+
+def _cache_key(v: Any) -> Hashable:
+    """Return the key for the value ``v`` in a Spec cache.
+
+    Values of different types may compare equal (``1 == 1.0 == True``) but be valid for
+    different Specs, so keys include the type of the value and of each element of
+    tuples and frozensets. Values of the same type may also compare equal but conform
+    differently: signed zeros and Decimals with different exponents are keyed by their
+    representation, and datetimes and times by their time zone as well as their value.
+    NaNs never compare equal, so they could never be found in the cache.
+
+    Raise :py:exc:`TypeError` if ``v`` is not hashable or is a NaN."""
+    tp = type(v)
+    if tp is float or tp is complex or tp is Decimal:
+        if v.is_nan() if tp is Decimal else v != v:
+            raise TypeError("NaN values are not cached")
+        return tp, repr(v)
+    elif tp is datetime or tp is dtime:
+        key: Hashable = (tp, v, v.tzinfo)
+    elif isinstance(v, tuple):
+        return tp, tuple(_cache_key(e) for e in v)
+    elif isinstance(v, frozenset):
+        return tp, frozenset(_cache_key(e) for e in v)
+    else:
+        key = (tp, v)
+    hash(key)
+    return key
+
+
+class _LRUCache:
+    """A thread-safe mapping of cache keys to entries with least recently used
+    eviction, which counts cache hits, misses, and evictions."""
+
+    __slots__ = ("maxsize", "ttl", "hits", "misses", "evictions", "_entries", "_lock")
+
+    def __init__(self, maxsize: int, ttl: Optional[float]):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, List[Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, field: int) -> Any:
+        """Return the ``field`` of the entry for ``key`` if it is cached, or
+        ``_MISSING`` otherwise."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[_EXPIRES] is not None and entry[_EXPIRES] <= time.monotonic():
+                    del self._entries[key]
+                elif entry[field] is not _MISSING:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[field]
+            self.misses += 1
+            return _MISSING
+
+    def put(
+        self, key: Hashable, field: int, value: Any, if_valid: bool = False
+    ) -> None:
+        """Set the ``field`` of the entry for ``key``, evicting the least recently used
+        entry if the cache is full.
+
+        If ``if_valid`` is :py:obj:`True`, the field is only set if the entry records
+        that the value is valid."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if if_valid and (entry is None or entry[_VALID] is not True):
+                return
+            if entry is None:
+                expires = None if self.ttl is None else time.monotonic() + self.ttl
+                entry = self._entries[key] = [_MISSING, _MISSING, expires]
+                if len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+            else:
+                self._entries.move_to_end(key)
+            entry[field] = value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                self.hits, self.misses, self.evictions, self.maxsize, len(self._entries)
+            )
+
+
+def _new_cache(spec: "CachedSpec") -> _LRUCache:
+    return _LRUCache(spec.maxsize, spec.ttl)
+
+
+@attr.s(auto_attribs=True, frozen=True, slots=True)
+class CachedSpec(Spec):
+    """
+    Cached Specs memoize whether values are valid for their source Spec and the
+    values they conform to.
+
+    Only hashable values other than NaNs are cached; any other value is validated and
+    conformed by the source Spec every time. Values are assumed not to change while
+    they are cached, so cached Specs should not be used to validate mutable objects
+    which are hashable by identity.
+
+    Conformed values are only cached if they are immutable (such as strings, numbers,
+    dates, UUIDs, enum members, and tuples of such values), since every caller
+    receives the same cached object; conformed values of any other type (such as
+    lists or dicts) are conformed by the source Spec for each call. Errors are always
+    produced by the source Spec, since :py:class:`dataspec.ErrorDetails` instances are
+    mutable.
+    """
+
+    source: Spec
+    maxsize: int = 1024
+    ttl: Optional[float] = None
+    _cache: _LRUCache = attr.ib(
+        init=False, default=attr.Factory(_new_cache, takes_self=True), repr=False
+    )
+
+    def __attrs_post_init__(self):
+        if self.maxsize < 1:
+            raise ValueError("Cache maxsize must be at least 1")
+        if self.ttl is not None and self.ttl <= 0:
+            raise ValueError("Cache ttl must be positive")
+
+    @property
+    def tag(self) -> Tag:
+        return self.source.tag
+
+    @property
+    def conformer(self) -> Optional[Conformer]:
+        return self.source.conformer
+
+    def cache_info(self) -> CacheInfo:
+        """Return the number of cache hits, misses, and evictions for this Spec along
+        with the maximum and current size of its cache."""
+        return self._cache.info()
+
+    def cache_clear(self) -> None:
+        """Clear this Spec's cache and reset its statistics."""
+        self._cache.clear()
+
+    def validate(self, v) -> Iterator[ErrorDetails]:
+        if not self._check(v):
+            yield from self.source.validate(v)
+
+    def _check(self, v) -> bool:
+        try:
+            key = _cache_key(v)
+        except TypeError:
+            return self.source._check(v)  # pylint: disable=protected-access
+
+        valid = self._cache.get(key, _VALID)
+        if valid is _MISSING:
+            valid = self.source._check(v)  # pylint: disable=protected-access
+            self._cache.put(key, _VALID, valid)
+        return valid
+
+    def conform(self, v):
+        try:
+            key = _cache_key(v)
+        except TypeError:
+            return self.source.conform(v)
+
+        conformed = self._cache.get(key, _CONFORMED)
+        if conformed is _MISSING:
+            conformed = self.source.conform(v)
+            if _is_immutable(conformed):
+                self._cache.put(key, _CONFORMED, conformed)
+        return conformed
+
+    def conform_valid(self, v):
+        try:
+            key = _cache_key(v)
+        except TypeError:
+            return self.source.conform_valid(v)
+
+        conformed = self._cache.get(key, _CONFORMED)
+        if conformed is _MISSING:
+            conformed = self.source.conform_valid(v)
+            # conform reads the same entry, so only cache the results for values which
+            # are known to be valid
+            if _is_immutable(conformed):
+                self._cache.put(key, _CONFORMED, conformed, if_valid=True)
+        return conformed
+
+    def conform_or_errors(self, v) -> Tuple[Any, List[ErrorDetails]]:
+        conformed = self.conform(v)
+        if conformed is INVALID:
+            return self.source.conform_or_errors(v)
+        return conformed, []
+
+    def cached(self, maxsize: int = 1024, ttl: Optional[float] = None) -> "CachedSpec":
+        return self.source.cached(maxsize=maxsize, ttl=ttl)
+
+    def with_conformer(self, conformer: Optional[Conformer]) -> Spec:
+        return self.source.with_conformer(conformer).cached(self.maxsize, self.ttl)
+
+    def with_tag(self, tag: Tag) -> Spec:
+        return self.source.with_tag(tag).cached(self.maxsize, self.ttl)
@@ -0,0 +1,401 @@
+"""
+Compile Spec trees into flat, specialized Python functions.
+
+The interpreted Spec tree checks every value through several layers of generators,
+closures, and method calls. The compiler in this module walks a Spec tree once and
+generates Python source for two functions -- one which answers whether a value is
+valid and one which conforms a value already known to be valid -- with type checks,
+set membership checks, collection length checks, and mapping and tuple traversal
+written out inline.
+
+Compiled Specs only ever use the generated code to answer yes or no questions and to
+conform valid values. Whenever a value is invalid, the original Spec tree is
+consulted to produce its :py:class:`dataspec.ErrorDetails`, so compiled and
+interpreted Specs produce exactly the same errors. Conformers are only called once
+a value is known to be valid, just as they are by interpreted Specs.
+"""
+import contextlib
+import itertools
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import attr
+
+from dataspec.base import (
+    INVALID,
+    CollSpec,
+    Conformer,
+    DictSpec,
+    ErrorDetails,
+    ObjectSpec,
+    PredicateSpec,
+    SetSpec,
+    Spec,
+    Tag,
+    TupleSpec,
+    ValidatorFn,
+    ValidatorSpec,
+)
+
+# CPython refuses to compile functions with more than 20 statically nested blocks,
+# so subtrees nested more deeply than this are compiled into their own functions
+_MAX_BLOCK_DEPTH = 12
+
+_MISSING = object()
+
+
+class _FunctionBuilder:
+    """Accumulate the lines of a single generated function."""
+
+    __slots__ = ("_lines", "_indent", "depth")
+
+    def __init__(self, name: str, arg: str):
+        self._lines = [f"def {name}({arg}):"]
+        self._indent = 1
+        self.depth = 0
+
+    def emit(self, line: str) -> None:
+        self._lines.append(f"{'    ' * self._indent}{line}")
+
+    @contextlib.contextmanager
+    def block(self, line: str) -> Iterator[None]:
+        self.emit(line)
+        self._indent += 1
+        self.depth += 1
+        try:
+            yield
+        finally:
+            self._indent -= 1
+            self.depth -= 1
+
+    @property
+    def source(self) -> str:
+        return "\n".join(self._lines)
+
+
+class _Compiler:
+    """Generate the source for validity and conform functions for a Spec tree."""
+
+    def __init__(self) -> None:
+        self._namespace: Dict[str, Any] = {"_MISSING": _MISSING}
+        self._constants: Dict[int, str] = {}
+        self._sources: List[str] = []
+        self._counter = itertools.count()
+
+    def _name(self, prefix: str) -> str:
+        return f"{prefix}{next(self._counter)}"
+
+    def _const(self, value: Any, prefix: str = "c") -> str:
+        """Return a global name in the generated module bound to ``value``."""
+        try:
+            return self._constants[id(value)]
+        except KeyError:
+            name = self._name(prefix)
+            self._namespace[name] = value
+            self._constants[id(value)] = name
+            return name
+
+    def _literal(self, value: Any) -> str:
+        """Return source for a mapping key or attribute name, preferring literals."""
+        if type(value) in (str, int):
+            return repr(value)
+        return self._const(value, "k")
+
+    def compile(self, spec: Spec) -> Tuple[Callable[[Any], bool], Callable[[Any], Any]]:
+        is_valid_name = self._function(spec, conform=False)
+        conform_valid_name = self._function(spec, conform=True)
+        exec("\n\n".join(self._sources), self._namespace)  # pylint: disable=exec-used
+        return self._namespace[is_valid_name], self._namespace[conform_valid_name]
+
+    def _function(self, spec: Spec, conform: bool) -> str:
+        name = self._name("conform_valid_" if conform else "is_valid_")
+        fn = _FunctionBuilder(name, "v")
+        if conform:
+            fn.emit(f"return {self._conform_valid(fn, spec, 'v')}")
+        else:
+            self._check(fn, spec, "v", "return False")
+            fn.emit("return True")
+        self._sources.append(fn.source)
+        return name
+
+    def _nested(
+        self, fn: _FunctionBuilder, spec: Spec, x: str, fail: Optional[str]
+    ) -> Optional[str]:
+        """Call out to a separately generated function for ``spec`` if the current
+        function is already too deeply nested to inline it.
+
+        The nested function conforms ``x`` if ``fail`` is :py:obj:`None` and checks
+        ``x`` otherwise."""
+        if fn.depth < _MAX_BLOCK_DEPTH:
+            return None
+
+        name = self._function(spec, conform=fail is None)
+        if fail is None:
+            y = self._name("y")
+            fn.emit(f"{y} = {name}({x})")
+            return y
+        fn.emit(f"if not {name}({x}): {fail}")
+        return x
+
+    # Validity checks
+
+    def _check(self, fn: _FunctionBuilder, spec: Spec, x: str, fail: str) -> None:
+        """Emit statements which execute ``fail`` if ``x`` is not valid for ``spec``."""
+        if isinstance(spec, CompiledSpec):
+            spec = spec.source
+        if self._nested(fn, spec, x, fail) is not None:
+            return
+
+        if isinstance(spec, SetSpec):
+            fn.emit(f"if {x} not in {self._const(spec._values, 's')}: {fail}")
+        elif isinstance(spec, PredicateSpec):
+            fn.emit(f"if not {self._const(spec._pred, 'p')}({x}): {fail}")
+        elif isinstance(spec, ValidatorSpec):
+            self._check_validator(fn, spec._validate, x, fail)
+        elif isinstance(spec, DictSpec):
+            self._check_dict(fn, spec, x, fail)
+        elif isinstance(spec, CollSpec):
+            self._check_coll(fn, spec, x, fail)
+        elif isinstance(spec, TupleSpec):
+            self._check_tuple(fn, spec, x, fail)
+        elif isinstance(spec, ObjectSpec):
+            self._check_obj(fn, spec, x, fail)
+        else:
+            fn.emit(f"if not {self._const(spec._check, 'f')}({x}): {fail}")
+
+    def _check_validator(
+        self, fn: _FunctionBuilder, validate: ValidatorFn, x: str, fail: str
+    ) -> None:
+        validators = getattr(validate, "validators", None)
+        if validators is not None:
+            for validator in validators:
+                self._check_validator(fn, validator, x, fail)
+            return
+
+        type_guard = getattr(validate, "type_guard", None)
+        pred = getattr(validate, "pred", None)
+        check = getattr(validate, "check", None)
+        if type_guard is not None:
+            fn.emit(f"if not isinstance({x}, {self._const(type_guard, 't')}): {fail}")
+        elif pred is not None:
+            negate = "not " if getattr(validate, "complement", False) else ""
+            fn.emit(f"if {negate}{self._const(pred, 'p')}({x}): {fail}")
+        elif check is not None:
+            fn.emit(f"if not {self._const(check, 'p')}({x}): {fail}")
+        else:
+            with fn.block(f"for _ in {self._const(validate, 'f')}({x}):"):
+                fn.emit(fail)
+
+    def _check_dict(
+        self, fn: _FunctionBuilder, spec: DictSpec, x: str, fail: str
+    ) -> None:
+        for k, keyspec in spec._keyspecs.items():
+            key = self._literal(k)
+            xk = self._name("x")
+            if keyspec.is_optional:
+                with fn.block(f"if {key} in {x}:"):
+                    fn.emit(f"{xk} = {x}[{key}]")
+                    self._check(fn, keyspec.spec, xk, fail)
+            else:
+                fn.emit(f"if {key} not in {x}: {fail}")
+                fn.emit(f"{xk} = {x}[{key}]")
+                self._check(fn, keyspec.spec, xk, fail)
+
+    def _check_coll(
+        self, fn: _FunctionBuilder, spec: CollSpec, x: str, fail: str
+    ) -> None:
+        # Large collections are validated in chunks on the shared thread pool
+        if spec._parallel_threshold is not None:
+            fn.emit(f"if not {self._const(spec._check, 'f')}({x}): {fail}")
+            return
+
+        if spec._validate_coll is not None:
+            self._check(fn, spec._validate_coll, x, fail)
+        e = self._name("x")
+        with fn.block(f"for {e} in {x}:"):
+            self._check(fn, spec._spec, e, fail)
+
+    def _unpack_tuple(
+        self, fn: _FunctionBuilder, spec: TupleSpec, x: str, fail: Optional[str]
+    ) -> List[str]:
+        if fail is not None:
+            fn.emit(f"if len({x}) != {len(spec._specs)}: {fail}")
+        elems = [self._name("x") for _ in spec._specs]
+        if elems:
+            fn.emit(f"{', '.join(elems)}, = {x}")
+        return elems
+
+    def _check_tuple(
+        self, fn: _FunctionBuilder, spec: TupleSpec, x: str, fail: str
+    ) -> None:
+        for e_spec, e in zip(spec._specs, self._unpack_tuple(fn, spec, x, fail)):
+            self._check(fn, e_spec, e, fail)
+
+    def _check_obj(
+        self, fn: _FunctionBuilder, spec: ObjectSpec, x: str, fail: str
+    ) -> None:
+        for k, vspec in spec._reqattrspecs.items():
+            xk = self._name("x")
+            fn.emit(f"{xk} = getattr({x}, {self._literal(k)}, _MISSING)")
+            fn.emit(f"if {xk} is _MISSING: {fail}")
+            self._check(fn, vspec, xk, fail)
+
+        for k, vspec in spec._optattrspecs.items():
+            xk = self._name("x")
+            fn.emit(f"{xk} = getattr({x}, {self._literal(k)}, _MISSING)")
+            with fn.block(f"if {xk} is not _MISSING:"):
+                self._check(fn, vspec, xk, fail)
+
+    # Conformation
+
+    def _conform_valid(self, fn: _FunctionBuilder, spec: Spec, x: str) -> str:
+        """Emit statements which conform ``x``, which must be valid for ``spec``, and
+        return an expression for the conformed value."""
+        if isinstance(spec, CompiledSpec):
+            spec = spec.source
+        nested = self._nested(fn, spec, x, None)
+        if nested is not None:
+            return nested
+
+        # Specs whose default conformer has been replaced conform the input value
+        # directly, rather than conforming their children
+        if (
+            isinstance(spec, (DictSpec, CollSpec, TupleSpec))
+            and spec.conformer is spec._default_conformer
+            and getattr(spec, "_parallel_threshold", None) is None
+        ):
+            if isinstance(spec, DictSpec):
+                y = self._conform_dict(fn, spec, x)
+            elif isinstance(spec, CollSpec):
+                y = self._conform_coll(fn, spec, x)
+            else:
+                y = self._conform_tuple(fn, spec, x)
+            return self._apply(fn, spec._post_conformer, y)
+
+        return self._apply(fn, spec.conformer, x)
+
+    def _apply(
+        self, fn: _FunctionBuilder, conformer: Optional[Conformer], x: str
+    ) -> str:
+        if conformer is None:
+            return x
+        y = self._name("y")
+        fn.emit(f"{y} = {self._const(conformer, 'conformer')}({x})")
+        return y
+
+    def _conform_dict(self, fn: _FunctionBuilder, spec: DictSpec, x: str) -> str:
+        d = self._name("y")
+        fn.emit(f"{d} = {{}}")
+        for k, keyspec in spec._keyspecs.items():
+            key = self._literal(k)
+            xk = self._name("x")
+            if keyspec.is_optional:
+                with fn.block(f"if {key} in {x}:"):
+                    fn.emit(f"{xk} = {x}[{key}]")
+                    yk = self._conform_valid(fn, keyspec.spec, xk)
+                    fn.emit(f"{d}[{key}] = {yk}")
+            else:
+                fn.emit(f"{xk} = {x}[{key}]")
+                yk = self._conform_valid(fn, keyspec.spec, xk)
+                fn.emit(f"{d}[{key}] = {yk}")
+        return d
+
+    def _conform_coll(self, fn: _FunctionBuilder, spec: CollSpec, x: str) -> str:
+        elems = self._name("y")
+        fn.emit(f"{elems} = []")
+        e = self._name("x")
+        with fn.block(f"for {e} in {x}:"):
+            ye = self._conform_valid(fn, spec._spec, e)
+            fn.emit(f"{elems}.append({ye})")
+
+        out_type = (
+            f"type({x})"
+            if spec._out_type is None
+            else self._const(spec._out_type, "type_")
+        )
+        y = self._name("y")
+        fn.emit(f"{y} = {out_type}({elems})")
+        return y
+
+    def _conform_tuple(self, fn: _FunctionBuilder, spec: TupleSpec, x: str) -> str:
+        conformed = [
+            self._conform_valid(fn, e_spec, e)
+            for e_spec, e in zip(spec._specs, self._unpack_tuple(fn, spec, x, None))
+        ]
+        elems = f"({', '.join(conformed)}{',' if conformed else ''})"
+        y = self._name("y")
+        if spec._namedtuple is not None:
+            fn.emit(f"{y} = {self._const(spec._namedtuple, 'nt')}._make({elems})")
+        else:
+            fn.emit(f"{y} = {elems}")
+        return y
+
+
+@attr.s(auto_attribs=True, frozen=True, slots=True)
+class CompiledSpec(Spec):
+    """
+    Compiled Specs validate and conform values using functions generated from the
+    tree of their source Spec.
+
+    Errors are always produced by the source Spec, so the ``validate`` family of
+    methods is only faster than the source Spec for valid inputs. Spec trees which
+    cannot be compiled (such as trees nested too deeply for the compiler to recurse
+    through) are validated and conformed by the source Spec instead.
+    """
+
+    source: Spec
+    _is_valid: Callable[[Any], bool] = attr.ib(repr=False)
+    _conform_valid: Callable[[Any], Any] = attr.ib(repr=False)
+
+    @classmethod
+    def from_spec(cls, spec: Spec) -> "CompiledSpec":
+        if isinstance(spec, CompiledSpec):
+            return spec
+        try:
+            is_valid, conform_valid = _Compiler().compile(spec)
+        except (RecursionError, SyntaxError):
+            is_valid = spec._check  # pylint: disable=protected-access
+            conform_valid = spec.conform_valid
+        return cls(spec, is_valid, conform_valid)
+
+    @property
+    def tag(self) -> Tag:
+        return self.source.tag
+
+    @property
+    def conformer(self) -> Optional[Conformer]:
+        return self.source.conformer
+
+    def validate(self, v) -> Iterator[ErrorDetails]:
+        if not self._check(v):
+            yield from self.source.validate(v)
+
+    def _check(self, v) -> bool:
+        # Exceptions are rare enough that the source Spec can decide how to report
+        # them, which keeps the generated code free of exception handlers
+        try:
+            return self._is_valid(v)
+        except Exception:  # pylint: disable=broad-except
+            return self.source._check(v)  # pylint: disable=protected-access
+
+    def conform(self, v):
+        if not self._check(v):
+            return INVALID
+        return self._conform_valid(v)
+
+    def conform_valid(self, v):
+        return self._conform_valid(v)
+
+    def conform_or_errors(self, v) -> Tuple[Any, List[ErrorDetails]]:
+        conformed = self.conform(v)
+        if conformed is INVALID:
+            return self.source.conform_or_errors(v)
+        return conformed, []
+
+    def compile(self) -> "CompiledSpec":
+        return self
+
+    def with_conformer(self, conformer: Optional[Conformer]) -> Spec:
+        return self.source.with_conformer(conformer).compile()
+
+    def with_tag(self, tag: Tag) -> Spec:
+        return self.source.with_tag(tag).compile()
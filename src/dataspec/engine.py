@@ -0,0 +1,546 @@
+"""
+An iterative validation engine for Spec trees.
+
+:py:meth:`dataspec.Spec.validate` is implemented by each Spec in terms of the
+``validate`` methods of its children, so every level of a nested value adds another
+generator which each error must pass through and another Python stack frame. The
+engine in this module instead walks a Spec tree and its input value using an explicit
+stack of work frames. Errors are produced directly from the frame which creates them
+and share the chain of enclosing Spec levels with their siblings.
+
+The engine understands mapping, collection, tuple, and object Specs along with the
+Specs produced by :py:meth:`dataspec.SpecAPI.all`, :py:meth:`dataspec.SpecAPI.any`,
+:py:meth:`dataspec.SpecAPI.kv`, :py:meth:`dataspec.SpecAPI.nilable`,
+:py:meth:`dataspec.SpecAPI.blankable`, and :py:meth:`dataspec.SpecAPI.union`. Any
+other Spec is validated by calling its own ``validate`` method, except for compiled
+and cached Specs, which are validated by walking the Spec they wrap. The engine
+produces the same sequence of :py:class:`dataspec.ErrorDetails` as
+:py:meth:`dataspec.Spec.validate`, including for exceptions raised during validation,
+which are propagated through the work stack just as they would be propagated through
+the equivalent generators.
+"""
+# pylint: disable=protected-access
+from collections import deque
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from dataspec.base import (
+    NO_ERROR_PATH,
+    CollSpec,
+    DictSpec,
+    ErrorDetails,
+    ObjectSpec,
+    Spec,
+    Tag,
+    TupleSpec,
+    ValidatorSpec,
+    _ErrorFrame,
+)
+from dataspec.cache import CachedSpec
+from dataspec.compiler import CompiledSpec
+
+ErrorSink = Callable[[ErrorDetails], None]
+
+# Returned from a frame step to indicate that the frame has more work to do, but
+# has no child frame to push onto the stack
+_CONTINUE = object()
+
+
+class _Frame:
+    """
+    Frames hold the state of the validation of one value against one Spec.
+
+    Errors emitted by a frame (or any of its children) are passed to ``sink``.
+    ``parents`` is the chain of Spec levels enclosing the frame, which is attached
+    to every error the frame creates.
+    """
+
+    __slots__ = ("parents", "sink")
+
+    # Exception types which are caught by this frame, ending the frame's validation
+    catches: Union[type, tuple] = ()
+
+    def __init__(self, parents: Optional[_ErrorFrame], sink: ErrorSink):
+        self.parents = parents
+        self.sink = sink
+
+    def emit(self, error: ErrorDetails) -> None:
+        self.sink(error._with_parents(self.parents))
+
+    def step(self) -> Any:
+        """Perform the next unit of work for this frame, returning a child frame to
+        push onto the stack, ``_CONTINUE`` if the frame has more work, or
+        :py:obj:`None` if the frame is finished."""
+        raise NotImplementedError
+
+    def handle(self, e: Exception) -> None:
+        """Handle an exception of one of the types in ``catches`` raised by this frame
+        or one of its children."""
+
+
+class _LeafFrame(_Frame):
+    __slots__ = ("_errors",)
+
+    def __init__(
+        self, spec: Spec, v: Any, parents: Optional[_ErrorFrame], sink: ErrorSink
+    ):
+        super().__init__(parents, sink)
+        self._errors = spec.validate(v)
+
+    def step(self) -> Any:
+        error = next(self._errors, None)
+        if error is None:
+            return None
+        self.emit(error)
+        return _CONTINUE
+
+
+class _DictFrame(_Frame):
+    __slots__ = ("_spec", "_d", "_keyspecs")
+
+    catches = (AttributeError, TypeError)
+
+    def __init__(
+        self, spec: DictSpec, d: Any, parents: Optional[_ErrorFrame], sink: ErrorSink
+    ):
+        super().__init__(parents, sink)
+        self._spec = spec
+        self._d = d
+        self._keyspecs = iter(spec._keyspecs.items())
+
+    def step(self) -> Any:
+        d = self._d
+        for k, keyspec in self._keyspecs:
+            if k in d:
+                return _frame_for(
+                    keyspec.spec,
+                    d[k],
+                    _ErrorFrame(self._spec.tag, k, self.parents),
+                    self.sink,
+                )
+            if not keyspec.is_optional:
+                self.emit(self._spec._missing_key_error(d, k, keyspec))
+                return _CONTINUE
+        return None
+
+    def handle(self, e: Exception) -> None:
+        self.emit(self._spec._not_a_mapping_error(self._d))
+
+
+class _CollFrame(_Frame):
+    __slots__ = ("_spec", "_v", "_validated_coll", "_elems")
+
+    def __init__(
+        self, spec: CollSpec, v: Any, parents: Optional[_ErrorFrame], sink: ErrorSink
+    ):
+        super().__init__(parents, sink)
+        self._spec = spec
+        self._v = v
+        self._validated_coll = False
+        self._elems: Optional[Iterator] = None
+
+    def step(self) -> Any:
+        if not self._validated_coll:
+            self._validated_coll = True
+            if self._spec._validate_coll is not None:
+                return _frame_for(
+                    self._spec._validate_coll,
+                    self._v,
+                    _ErrorFrame(self._spec.tag, NO_ERROR_PATH, self.parents),
+                    self.sink,
+                )
+
+        if self._elems is None:
+            self._elems = enumerate(self._v)
+
+        for i, e in self._elems:
+            return _frame_for(
+                self._spec._spec,
+                e,
+                _ErrorFrame(self._spec.tag, i, self.parents),
+                self.sink,
+            )
+        return None
+
+
+class _TupleFrame(_Frame):
+    __slots__ = ("_spec", "_t", "_elems")
+
+    catches = TypeError
+
+    def __init__(
+        self, spec: TupleSpec, t: Any, parents: Optional[_ErrorFrame], sink: ErrorSink
+    ):
+        super().__init__(parents, sink)
+        self._spec = spec
+        self._t = t
+        self._elems: Optional[Iterator] = None
+
+    def step(self) -> Any:
+        if self._elems is None:
+            if len(self._t) != len(self._spec._specs):
+                self.emit(self._spec._length_error(self._t))
+                return None
+            self._elems = enumerate(zip(self._spec._specs, self._t))
+
+        for i, (e_spec, elem) in self._elems:
+            return _frame_for(
+                e_spec, elem, _ErrorFrame(self._spec.tag, i, self.parents), self.sink
+            )
+        return None
+
+    def handle(self, e: Exception) -> None:
+        self.emit(self._spec._not_a_tuple_error(self._t))
+
+
+class _ObjectFrame(_Frame):
+    __slots__ = ("_spec", "_o", "_reqattrs", "_optattrs")
+
+    def __init__(
+        self, spec: ObjectSpec, o: Any, parents: Optional[_ErrorFrame], sink: ErrorSink
+    ):
+        super().__init__(parents, sink)
+        self._spec = spec
+        self._o = o
+        self._reqattrs = iter(spec._reqattrspecs.items())
+        self._optattrs = iter(spec._optattrspecs.items())
+
+    def step(self) -> Any:
+        o = self._o
+        for k, vspec in self._reqattrs:
+            if hasattr(o, k):
+                return self._attr_frame(k, vspec)
+            self.emit(self._spec._missing_attr_error(o, k, vspec))
+            return _CONTINUE
+
+        for k, vspec in self._optattrs:
+            if hasattr(o, k):
+                return self._attr_frame(k, vspec)
+        return None
+
+    def _attr_frame(self, k: str, vspec: Spec) -> _Frame:
+        return _frame_for(
+            vspec,
+            getattr(self._o, k),
+            _ErrorFrame(self._spec.tag, k, self.parents),
+            self.sink,
+        )
+
+
+class _ValidatorFrame(_Frame):
+    """Frame for Validator Specs whose validator function combines other Specs."""
+
+    __slots__ = ("_spec", "_v", "_combinator")
+
+    catches = Exception
+
+    def __init__(
+        self,
+        spec: ValidatorSpec,
+        v: Any,
+        combinator: tuple,
+        parents: Optional[_ErrorFrame],
+        sink: ErrorSink,
+    ):
+        super().__init__(parents, sink)
+        self._spec = spec
+        self._v = v
+        self._combinator: Optional[tuple] = combinator
+
+    def step(self) -> Any:
+        if self._combinator is None:
+            return None
+
+        kind, args, _ = self._combinator
+        self._combinator = None
+        parents = _ErrorFrame(self._spec.tag, NO_ERROR_PATH, self.parents)
+        return _COMBINATOR_FRAMES[kind](self._v, *args, parents, self.sink)
+
+    def handle(self, e: Exception) -> None:
+        self.emit(self._spec._exception_error(self._v, e))
+
+
+class _KVFrame(_Frame):
+    __slots__ = (
+        "_tag",
+        "_keyspec",
+        "_valspec",
+        "_not_a_mapping",
+        "_d",
+        "_items",
+        "_pending",
+    )
+
+    catches = (AttributeError, TypeError)
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        d: Any,
+        tag: Tag,
+        keyspec: Spec,
+        valspec: Spec,
+        not_a_mapping: Callable[[Any], ErrorDetails],
+        parents: Optional[_ErrorFrame],
+        sink: ErrorSink,
+    ):
+        super().__init__(parents, sink)
+        self._tag = tag
+        self._keyspec = keyspec
+        self._valspec = valspec
+        self._not_a_mapping = not_a_mapping
+        self._d = d
+        self._items: Optional[Iterator] = None
+        self._pending: Optional[tuple] = None
+
+    def step(self) -> Any:
+        if self._items is None:
+            self._items = iter(self._d.items())
+
+        # Keys and values are validated alternately, so the value of each pair is
+        # held until its key has been validated
+        if self._pending is not None:
+            k, v = self._pending
+            self._pending = None
+            return _frame_for(
+                self._valspec, v, _ErrorFrame(self._tag, k, self.parents), self.sink
+            )
+
+        for k, v in self._items:
+            self._pending = (k, v)
+            return _frame_for(
+                self._keyspec,
+                k,
+                _ErrorFrame(self._tag, self._d, self.parents),
+                self.sink,
+            )
+        return None
+
+    def handle(self, e: Exception) -> None:
+        self.emit(self._not_a_mapping(self._d))
+
+
+class _AllFrame(_Frame):
+    __slots__ = ("_e", "_specs", "_current", "_failed")
+
+    def __init__(
+        self,
+        e: Any,
+        specs: Sequence[Spec],
+        parents: Optional[_ErrorFrame],
+        sink: ErrorSink,
+    ):
+        super().__init__(parents, sink)
+        self._e = e
+        self._specs = iter(specs)
+        self._current: Optional[Spec] = None
+        self._failed = False
+
+    def _receive(self, error: ErrorDetails) -> None:
+        self._failed = True
+        self.sink(error)
+
+    def step(self) -> Any:
+        if self._current is not None:
+            if self._failed:
+                return None
+            self._e = self._current.conform_valid(self._e)
+
+        self._current = next(self._specs, None)
+        if self._current is None:
+            return None
+        return _frame_for(self._current, self._e, self.parents, self._receive)
+
+
+class _AnyFrame(_Frame):
+    __slots__ = ("_e", "_specs", "_started", "_branch_errors", "_errors")
+
+    def __init__(
+        self,
+        e: Any,
+        specs: Sequence[Spec],
+        parents: Optional[_ErrorFrame],
+        sink: ErrorSink,
+    ):
+        super().__init__(parents, sink)
+        self._e = e
+        self._specs = iter(specs)
+        self._started = False
+        self._branch_errors: List[ErrorDetails] = []
+        self._errors: List[ErrorDetails] = []
+
+    def step(self) -> Any:
+        # Errors from a branch can only be emitted once every branch has failed
+        if self._started:
+            if not self._branch_errors:
+                return None
+            self._errors.extend(self._branch_errors)
+            self._branch_errors = []
+        self._started = True
+
+        spec = next(self._specs, None)
+        if spec is None:
+            for error in self._errors:
+                self.sink(error)
+            return None
+        return _frame_for(spec, self._e, self.parents, self._branch_errors.append)
+
+
+class _OrFrame(_Frame):
+    """Frame for nilable and blankable Specs, which accept a sentinel value or any
+    value valid for their inner Spec."""
+
+    __slots__ = ("_e", "_spec", "_accepts", "_error", "_started", "_failed")
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        e: Any,
+        spec: Spec,
+        accepts: Callable[[Any], bool],
+        error: Callable[[Any], ErrorDetails],
+        parents: Optional[_ErrorFrame],
+        sink: ErrorSink,
+    ):
+        super().__init__(parents, sink)
+        self._e = e
+        self._spec = spec
+        self._accepts = accepts
+        self._error = error
+        self._started = False
+        self._failed = False
+
+    def _receive(self, error: ErrorDetails) -> None:
+        self._failed = True
+        self.sink(error)
+
+    def step(self) -> Any:
+        if self._started:
+            if self._failed:
+                self.emit(self._error(self._e))
+            return None
+
+        self._started = True
+        if self._accepts(self._e):
+            return None
+        return _frame_for(self._spec, self._e, self.parents, self._receive)
+
+
+class _UnionFrame(_Frame):
+    """Frame for union Specs, which validate a value against the single variant Spec
+    selected by its discriminator key."""
+
+    __slots__ = ("_e", "_variant", "_variant_error", "_started")
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        e: Any,
+        specs: Mapping[Any, Spec],
+        variant: Callable[[Any], Optional[Spec]],
+        variant_error: Callable[[Any], ErrorDetails],
+        parents: Optional[_ErrorFrame],
+        sink: ErrorSink,
+    ):
+        super().__init__(parents, sink)
+        self._e = e
+        self._variant = variant
+        self._variant_error = variant_error
+        self._started = False
+
+    def step(self) -> Any:
+        if self._started:
+            return None
+
+        self._started = True
+        spec = self._variant(self._e)
+        if spec is None:
+            self.emit(self._variant_error(self._e))
+            return None
+        return _frame_for(spec, self._e, self.parents, self.sink)
+
+
+# Validator functions which combine other Specs have a ``combinator`` attribute of
+# the kind of combination, the arguments for its frame, and the options used to
+# conform values (which are not needed for validation)
+_COMBINATOR_FRAMES = {
+    "all": _AllFrame,
+    "any": _AnyFrame,
+    "kv": _KVFrame,
+    "or": _OrFrame,
+    "union": _UnionFrame,
+}
+
+
+def _frame_for(
+    spec: Spec, v: Any, parents: Optional[_ErrorFrame], sink: ErrorSink
+) -> _Frame:
+    """Return a new frame to validate ``v`` against ``spec``."""
+    spec_type = type(spec)
+    while spec_type is CompiledSpec or spec_type is CachedSpec:
+        spec = spec.source  # type: ignore[attr-defined]
+        spec_type = type(spec)
+
+    if spec_type is DictSpec:
+        return _DictFrame(spec, v, parents, sink)  # type: ignore[arg-type]
+    elif spec_type is CollSpec:
+        return _CollFrame(spec, v, parents, sink)  # type: ignore[arg-type]
+    elif spec_type is TupleSpec:
+        return _TupleFrame(spec, v, parents, sink)  # type: ignore[arg-type]
+    elif spec_type is ObjectSpec:
+        return _ObjectFrame(spec, v, parents, sink)  # type: ignore[arg-type]
+    elif spec_type is ValidatorSpec:
+        validate = spec._validate  # type: ignore[attr-defined]
+        combinator = getattr(validate, "combinator", None)
+        if combinator is not None:
+            return _ValidatorFrame(
+                spec, v, combinator, parents, sink  # type: ignore[arg-type]
+            )
+    return _LeafFrame(spec, v, parents, sink)
+
+
+def iter_errors(spec: Spec, v: Any) -> Iterator[ErrorDetails]:
+    """
+    Validate the value ``v`` against ``spec``, yielding successive Spec failures as
+    :py:class:`dataspec.ErrorDetails` instances, if any.
+
+    This function produces the same errors in the same order as
+    :py:meth:`dataspec.Spec.validate`, but does not use recursion or create
+    generators for the Specs it understands, so it can validate values nested much
+    more deeply than Python's recursion limit would otherwise allow.
+
+    :param spec: a Spec
+    :param v: a value to validate
+    :return: an iterator of Spec failures as :py:class:`dataspec.ErrorDetails`
+        instances, if any
+    """
+    errors: Deque[ErrorDetails] = deque()
+    stack = [_frame_for(spec, v, None, errors.append)]
+
+    while stack:
+        try:
+            child = stack[-1].step()
+        except Exception as e:  # pylint: disable=broad-except
+            # Unwind the stack to the nearest frame which would have caught the
+            # exception; that frame reports the error and finishes
+            while stack:
+                frame = stack.pop()
+                if isinstance(e, frame.catches):
+                    frame.handle(e)
+                    break
+            else:
+                raise
+        else:
+            if child is None:
+                stack.pop()
+            elif child is not _CONTINUE:
+                stack.append(child)
+
+        while errors:
+            yield errors.popleft()
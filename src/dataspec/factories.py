@@ -1,9 +1,9 @@
+import importlib.util
 import re
 import sys
 import threading
 import uuid
 from datetime import date, datetime, time
-from email.headerregistry import Address as EmailAddress
 from functools import partial
 from typing import (
     AbstractSet,
@@ -12,8 +12,8 @@ from typing import (
     Iterator,
     List,
     Mapping,
-    MutableMapping,
     Optional,
+    TYPE_CHECKING,
     Pattern,
     Set,
     Tuple,
@@ -31,6 +31,7 @@ from dataspec.base import (
     Conformer,
     ErrorDetails,
     Invalid,
+    MessageTemplate,
     ObjectSpec,
     ObjectSpecKey,
     OptionalKey,
@@ -44,10 +45,18 @@ from dataspec.base import (
     compose_conformers,
     make_spec,
     pred_to_validator,
+    spec_factory,
     tag_maybe,
+    type_guard,
+    validators_check,
+    with_check,
 )
 
+if TYPE_CHECKING:
+    from phonenumbers import PhoneNumber
 
+
+@spec_factory
 def blankable_spec(
     tag_or_pred: Union[Tag, SpecPredicate],
     *preds: SpecPredicate,
@@ -78,32 +87,65 @@ def blankable_spec(
 
     spec = make_spec(cast("SpecPredicate", preds[0]))
 
+    def is_blank(e) -> bool:
+        return e == ""
+
+    def not_blank_error(e) -> ErrorDetails:
+        return ErrorDetails(
+            message=MessageTemplate("Value '{value}' is not blank", e),
+            pred=blank_or_pred,
+            value=e,
+        )
+
     # Use a custom validator function here so user-provided Spec still includes that
     # Spec's tag in its ErrorDetails, but we only include the "blankable" tag in the
     # ErrorDetails if the value is not blank
+    def blank_or_check(e) -> bool:
+        return is_blank(e) or spec._check(e)  # pylint: disable=protected-access
+
+    @with_check(blank_or_check)
     def blank_or_pred(e) -> Iterator[ErrorDetails]:
-        if e == "":
+        if is_blank(e) or spec._check(e):  # pylint: disable=protected-access
             return
 
-        spec_errors = list(spec.validate(e))
-        if spec_errors:
-            yield from spec_errors
-            yield ErrorDetails(
-                message=f"Value '{e}' is not blank", pred=blank_or_pred, value=e,
-            )
+        yield from spec.validate(e)
+        yield not_blank_error(e)
+
+    blank_or_pred.combinator = (  # type: ignore
+        "or",
+        (spec, is_blank, not_blank_error),
+        {"conformer": conformer},
+    )
 
     def conform_blankable(e):
         if e == "":
             return e
-        return spec.conform(e)
+        return spec.conform_valid(e)
+
+    def blank_or_conform(e) -> Tuple[Any, List[ErrorDetails]]:
+        if e == "":
+            conformed = e
+        else:
+            conformed, errors = spec.conform_or_errors(e)
+            if errors:
+                errors.append(not_blank_error(e))
+                return INVALID, errors
 
+        if conformer is not None and not isinstance(conformed, Invalid):
+            conformed = conformer(conformed)
+        return conformed, []
+
+    default_conformer = compose_conformers(conform_blankable, conformer)
     return ValidatorSpec(
         tag or "blankable",
         blank_or_pred,
-        conformer=compose_conformers(conform_blankable, conformer),
+        conformer=default_conformer,
+        conform_or_errors_fn=blank_or_conform,
+        default_conformer=default_conformer,
     )
 
 
+@spec_factory
 def bool_spec(
     tag: Tag = "bool",
     allowed_values: Optional[Set[bool]] = None,
@@ -120,6 +162,7 @@ def bool_spec(
 
     assert allowed_values is None or all(isinstance(e, bool) for e in allowed_values)
 
+    @type_guard(bool)
     @pred_to_validator("Value '{value}' is not boolean", complement=True)
     def is_bool(v) -> bool:
         return isinstance(v, bool)
@@ -129,7 +172,9 @@ def bool_spec(
     if allowed_values is not None:
 
         @pred_to_validator(
-            f"Value '{{value}}' not in {allowed_values}", complement=True
+            "Value '{value}' not in {allowed_values}",
+            complement=True,
+            allowed_values=allowed_values,
         )
         def is_allowed_bool_type(v) -> bool:
             return v in allowed_values  # type: ignore
@@ -139,6 +184,7 @@ def bool_spec(
     return ValidatorSpec.from_validators(tag, *validators, conformer=conformer)
 
 
+@spec_factory
 def bytes_spec(  # noqa: MC0001  # pylint: disable=too-many-arguments
     tag: Tag = "bytes",
     type_: Tuple[Union[Type[bytes], Type[bytearray]], ...] = (bytes, bytearray),
@@ -186,6 +232,7 @@ def bytes_spec(  # noqa: MC0001  # pylint: disable=too-many-arguments
     :return: a Spec which validates bytes and bytearrays
     """
 
+    @type_guard(type_)
     @pred_to_validator(f"Value '{{value}}' is not a {type_}", complement=True)
     def is_bytes(s: Any) -> bool:
         return isinstance(s, type_)
@@ -262,6 +309,7 @@ def bytes_spec(  # noqa: MC0001  # pylint: disable=too-many-arguments
     return ValidatorSpec.from_validators(tag, *validators, conformer=conformer)
 
 
+@spec_factory
 def default_spec(
     tag_or_pred: Union[Tag, SpecPredicate],
     *preds: SpecPredicate,
@@ -303,6 +351,7 @@ def default_spec(
     )
 
 
+@spec_factory
 def every_spec(tag: Tag = "every", conformer: Optional[Conformer] = None) -> Spec:
     """
     Return a Spec which validates every possible value.
@@ -403,6 +452,7 @@ def _make_datetime_spec_factory(  # noqa: MC0001
 
         strptime = datetime.strptime  # type: ignore
 
+    @spec_factory
     def _datetime_spec_factory(  # pylint: disable=too-many-arguments
         tag: Tag = type_.__name__,
         format_: Optional[str] = None,
@@ -411,6 +461,7 @@ def _make_datetime_spec_factory(  # noqa: MC0001
         is_aware: Optional[bool] = None,
         conformer: Optional[Conformer] = None,
     ) -> Spec:
+        @type_guard(type_)
         @pred_to_validator(f"Value '{{value}}' is not {type_}", complement=True)
         def is_datetime_type(v) -> bool:
             return isinstance(v, type_)
@@ -470,6 +521,16 @@ def _make_datetime_spec_factory(  # noqa: MC0001
                 except (TypeError, ValueError):
                     return INVALID
 
+            check_datetime = validators_check(validators)
+
+            def check_datetime_str(s: str) -> bool:
+                try:
+                    dt = strptime(s, format_)  # type: ignore
+                except (TypeError, ValueError):
+                    return False
+                return check_datetime(dt)
+
+            @with_check(check_datetime_str)
             def validate_datetime_str(s: str) -> Iterator[ErrorDetails]:
                 try:
                     dt = strptime(s, format_)  # type: ignore
@@ -500,7 +561,11 @@ def _make_datetime_spec_factory(  # noqa: MC0001
         else:
             return ValidatorSpec.from_validators(tag, *validators, conformer=conformer)
 
+    # Factories are pickled by reference along with the Specs they create, so each
+    # must be named for the module attribute it is assigned to
     _datetime_spec_factory.__doc__ = docstring
+    _datetime_spec_factory.__name__ = f"{type_.__name__}_spec"
+    _datetime_spec_factory.__qualname__ = f"{type_.__name__}_spec"
     return _datetime_spec_factory
 
 
@@ -508,12 +573,11 @@ datetime_spec = _make_datetime_spec_factory(datetime)
 date_spec = _make_datetime_spec_factory(date)
 time_spec = _make_datetime_spec_factory(time)
 
-try:
-    from dateutil.parser import parse as parse_date, isoparse as parse_isodate
-except ImportError:
-    pass
-else:
+# Optional dependencies are only imported once a Spec which requires them is created,
+# since importing them accounts for a significant share of the time to import dataspec
+if importlib.util.find_spec("dateutil") is not None:
 
+    @spec_factory
     def datetime_str_spec(  # pylint: disable=too-many-arguments
         tag: Tag = "datetime_str",
         iso_only: bool = False,
@@ -558,7 +622,10 @@ else:
             :py:func:`dateutil.parser.parse` will be used
         :return: a Spec which validates strings containing date/time strings
         """
+        # pylint: disable=import-outside-toplevel
+        from dateutil.parser import parse as parse_date, isoparse as parse_isodate
 
+        @type_guard(str)
         @pred_to_validator("Value '{value}' is not type 'str'", complement=True)
         def is_str(x: Any) -> bool:
             return isinstance(x, str)
@@ -566,6 +633,14 @@ else:
         dt_spec = datetime_spec(before=before, after=after, is_aware=is_aware)
         parse_date_str = parse_isodate if iso_only else parse_date
 
+        def check_str_contains_datetime(s: str) -> bool:
+            try:
+                parsed_dt = parse_date_str(s)  # type: ignore
+            except (OverflowError, ValueError):
+                return False
+            return dt_spec.is_valid(parsed_dt)
+
+        @with_check(check_str_contains_datetime)
         def str_contains_datetime(s: str) -> Iterator[ErrorDetails]:
             try:
                 parsed_dt = parse_date_str(s)  # type: ignore
@@ -586,6 +661,7 @@ else:
         )
 
 
+@spec_factory
 def dict_tag_spec(
     tag_or_pred: Union[Tag, SpecPredicate],
     *preds: SpecPredicate,
@@ -684,11 +760,13 @@ def _obj_attr_validator(  # pylint: disable=too-many-arguments
     if exact_attr is not exact_attr_ignore:
 
         @pred_to_validator(
-            f"{object_name} attribute '{attr}' value '{{value}}' is not '{exact_attr}'",
+            f"{object_name} attribute '{attr}' value '{{value}}' is not "
+            "'{exact_attr}'",
             complement=True,
             convert_value=get_obj_attr,
+            exact_attr=exact_attr,
         )
-        def obj_attr_equals(v: EmailAddress) -> bool:
+        def obj_attr_equals(v: Any) -> bool:
             return get_obj_attr(v) == exact_attr
 
         return obj_attr_equals
@@ -709,11 +787,12 @@ def _obj_attr_validator(  # pylint: disable=too-many-arguments
 
         @pred_to_validator(
             f"{object_name} attribute '{attr}' value '{{value}}' does not "
-            f"match regex '{regex_attr}'",
+            "match regex '{regex_attr}'",
             complement=True,
             convert_value=get_obj_attr,
+            regex_attr=regex_attr,
         )
-        def obj_attr_matches_regex(v: EmailAddress) -> bool:
+        def obj_attr_matches_regex(v: Any) -> bool:
             return bool(re.fullmatch(pattern, get_obj_attr(v)))
 
         return obj_attr_matches_regex
@@ -726,11 +805,12 @@ def _obj_attr_validator(  # pylint: disable=too-many-arguments
             )
 
         @pred_to_validator(
-            f"{object_name} attribute '{attr}' value '{{value}}' not in {in_attr}",
+            f"{object_name} attribute '{attr}' value '{{value}}' not in {{in_attr}}",
             complement=True,
             convert_value=get_obj_attr,
+            in_attr=in_attr,
         )
-        def obj_attr_is_allowed_value(v: EmailAddress) -> bool:
+        def obj_attr_is_allowed_value(v: Any) -> bool:
             return get_obj_attr(v) in in_attr
 
         return obj_attr_is_allowed_value
@@ -738,6 +818,7 @@ def _obj_attr_validator(  # pylint: disable=too-many-arguments
         return None
 
 
+@spec_factory
 def email_spec(
     tag: Tag = "email", conformer: Optional[Conformer] = None, **kwargs
 ) -> Spec:
@@ -782,7 +863,10 @@ def email_spec(
     :param conformer: an optional conformer for the value
     :return: a Spec which can validate that a string contains an email address
     """
+    # pylint: disable=import-outside-toplevel
+    from email.headerregistry import Address as EmailAddress
 
+    @type_guard(str)
     @pred_to_validator(f"Value '{{value}}' is not type 'str'", complement=True)
     def is_str(x: Any) -> bool:
         return isinstance(x, str)
@@ -818,6 +902,16 @@ def email_spec(
         for validate in child_validators:
             yield from validate(p)
 
+    check_email = validators_check(child_validators)
+
+    def check_str_contains_email(s: str) -> bool:
+        try:
+            addr = EmailAddress(addr_spec=s)
+        except (TypeError, ValueError):
+            return False
+        return check_email(addr)
+
+    @with_check(check_str_contains_email)
     def str_contains_email(s: str) -> Iterator[ErrorDetails]:
         try:
             addr = EmailAddress(addr_spec=s)
@@ -835,6 +929,7 @@ def email_spec(
     )
 
 
+@spec_factory
 def nilable_spec(
     tag_or_pred: Union[Tag, SpecPredicate],
     *preds: SpecPredicate,
@@ -864,32 +959,65 @@ def nilable_spec(
 
     spec = make_spec(cast("SpecPredicate", preds[0]))
 
+    def is_nil(e) -> bool:
+        return e is None
+
+    def not_nil_error(e) -> ErrorDetails:
+        return ErrorDetails(
+            message=MessageTemplate("Value '{value}' is not None", e),
+            pred=nil_or_pred,
+            value=e,
+        )
+
     # Use a custom validator function here so user-provided Spec still includes that
     # Spec's tag in its ErrorDetails, but we only include the "nilable" tag in the
     # ErrorDetails if the value is not None
+    def nil_or_check(e) -> bool:
+        return is_nil(e) or spec._check(e)  # pylint: disable=protected-access
+
+    @with_check(nil_or_check)
     def nil_or_pred(e) -> Iterator[ErrorDetails]:
-        if e is None:
+        if is_nil(e) or spec._check(e):  # pylint: disable=protected-access
             return
 
-        spec_errors = list(spec.validate(e))
-        if spec_errors:
-            yield from spec_errors
-            yield ErrorDetails(
-                message=f"Value '{e}' is not None", pred=nil_or_pred, value=e,
-            )
+        yield from spec.validate(e)
+        yield not_nil_error(e)
+
+    nil_or_pred.combinator = (  # type: ignore
+        "or",
+        (spec, is_nil, not_nil_error),
+        {"conformer": conformer},
+    )
 
     def conform_nilable(e):
         if e is None:
             return e
-        return spec.conform(e)
+        return spec.conform_valid(e)
 
+    def nil_or_conform(e) -> Tuple[Any, List[ErrorDetails]]:
+        if e is None:
+            conformed = e
+        else:
+            conformed, errors = spec.conform_or_errors(e)
+            if errors:
+                errors.append(not_nil_error(e))
+                return INVALID, errors
+
+        if conformer is not None and not isinstance(conformed, Invalid):
+            conformed = conformer(conformed)
+        return conformed, []
+
+    default_conformer = compose_conformers(conform_nilable, conformer)
     return ValidatorSpec(
         tag or "nilable",
         nil_or_pred,
-        conformer=compose_conformers(conform_nilable, conformer),
+        conformer=default_conformer,
+        conform_or_errors_fn=nil_or_conform,
+        default_conformer=default_conformer,
     )
 
 
+@spec_factory
 def num_spec(
     tag: Tag = "num",
     type_: Union[Type, Tuple[Type, ...]] = (float, int),
@@ -921,6 +1049,7 @@ def num_spec(
     :return: a Spec which validates numeric values
     """
 
+    @type_guard(type_)
     @pred_to_validator(f"Value '{{value}}' is not type {type_}", complement=True)
     def is_numeric_type(x: Any) -> bool:
         return isinstance(x, type_)
@@ -950,6 +1079,7 @@ def num_spec(
     return ValidatorSpec.from_validators(tag, *validators, conformer=conformer)
 
 
+@spec_factory
 def obj_spec(
     tag_or_pred: Union[Tag, SpecPredicate],
     *preds: SpecPredicate,
@@ -1000,11 +1130,20 @@ def opt_key(k: T) -> OptionalKey[T]:
     return OptionalKey(k)
 
 
-try:  # noqa: MC0001
-    import phonenumbers
-except ImportError:
-    pass
-else:
+if importlib.util.find_spec("phonenumbers") is not None:  # noqa: MC0001
+
+    # The phonenumbers module, once it has been imported by _import_phonenumbers
+    _PHONENUMBERS: Any = None
+
+    def _import_phonenumbers() -> Any:
+        """Import phonenumbers the first time it is needed, returning the module."""
+        global _PHONENUMBERS  # pylint: disable=global-statement
+
+        if _PHONENUMBERS is None:
+            import phonenumbers  # pylint: disable=import-outside-toplevel
+
+            _PHONENUMBERS = phonenumbers
+        return _PHONENUMBERS
 
     def conform_phonenumber(
         s: str, region: Optional[str] = None
@@ -1012,6 +1151,8 @@ else:
         """Return a string containing a telephone number in E.164 format or return
         the special value :py:obj:``dataspec.base.INVALID`` if the input string does
         not contain a telephone number."""
+        phonenumbers = _PHONENUMBERS or _import_phonenumbers()
+
         try:
             p = phonenumbers.parse(s, region=region)
         except phonenumbers.NumberParseException:
@@ -1019,6 +1160,7 @@ else:
         else:
             return phonenumbers.format_number(p, phonenumbers.PhoneNumberFormat.E164)
 
+    @spec_factory
     def phonenumber_spec(
         tag: Tag = "phonenumber_str",
         region: Optional[str] = None,
@@ -1066,9 +1208,11 @@ else:
             passed a :py:class:`phonenumbers.PhoneNumber` object, rather than a string
         :return: a Spec which validates strings containing telephone numbers
         """
+        phonenumbers = _import_phonenumbers()
 
         default_conformer = conform_phonenumber
 
+        @type_guard(str)
         @pred_to_validator("Value '{value}' is not type 'str'", complement=True)
         def is_str(x: Any) -> bool:
             return isinstance(x, str)
@@ -1091,7 +1235,7 @@ else:
                     phonenumbers.region_codes_for_country_code(p.country_code)
                 ),
             )
-            def validate_phonenumber_region(p: phonenumbers.PhoneNumber) -> bool:
+            def validate_phonenumber_region(p: "PhoneNumber") -> bool:
                 return p.country_code == country_code
 
             validators.append(validate_phonenumber_region)
@@ -1103,7 +1247,7 @@ else:
             @pred_to_validator(
                 "Parsed telephone number '{value}' is not possible", complement=True
             )
-            def validate_phonenumber_is_possible(p: phonenumbers.PhoneNumber) -> bool:
+            def validate_phonenumber_is_possible(p: "PhoneNumber") -> bool:
                 return phonenumbers.is_possible_number(p)
 
             validators.append(validate_phonenumber_is_possible)
@@ -1113,15 +1257,25 @@ else:
             @pred_to_validator(
                 "Parsed telephone number '{value}' is not valid", complement=True
             )
-            def validate_phonenumber_is_valid(p: phonenumbers.PhoneNumber) -> bool:
+            def validate_phonenumber_is_valid(p: "PhoneNumber") -> bool:
                 return phonenumbers.is_valid_number(p)
 
             validators.append(validate_phonenumber_is_valid)
 
-        def validate_phonenumber(p: phonenumbers.PhoneNumber) -> Iterator[ErrorDetails]:
+        def validate_phonenumber(p: "PhoneNumber") -> Iterator[ErrorDetails]:
             for validate in validators:
                 yield from validate(p)
 
+        check_phonenumber = validators_check(validators)
+
+        def check_str_contains_phonenumber(s: str) -> bool:
+            try:
+                p = phonenumbers.parse(s, region=region)
+            except phonenumbers.NumberParseException:
+                return False
+            return check_phonenumber(p)
+
+        @with_check(check_str_contains_phonenumber)
         def str_contains_phonenumber(s: str) -> Iterator[ErrorDetails]:
             try:
                 p = phonenumbers.parse(s, region=region)
@@ -1148,8 +1302,12 @@ class StrFormat:
     conformer: Optional[Conformer] = None
 
 
-_STR_FORMATS: MutableMapping[str, StrFormat] = {}
-_STR_FORMAT_LOCK = threading.Lock()
+# Formats are looked up far more often than they are registered, so the registry is
+# never modified in place. Registering a format replaces the registry with an updated
+# copy, which allows formats to be looked up without taking a lock; the lock only
+# prevents concurrent registrations from losing each other's formats.
+_STR_FORMATS: Mapping[str, StrFormat] = {}
+_STR_FORMATS_WRITE_LOCK = threading.Lock()
 
 
 def register_str_format(
@@ -1162,14 +1320,30 @@ def register_str_format(
     """
 
     def create_str_format(f: ValidatorFn) -> ValidatorFn:
-        with _STR_FORMAT_LOCK:
-            _STR_FORMATS[tag] = StrFormat(f, conformer=conformer)
+        global _STR_FORMATS  # pylint: disable=global-statement
+        with _STR_FORMATS_WRITE_LOCK:
+            _STR_FORMATS = {**_STR_FORMATS, tag: StrFormat(f, conformer=conformer)}
         return f
 
     return create_str_format
 
 
+def _parses_with(parse: Callable[[str], Any]) -> Callable[[str], bool]:
+    """Return a check function for string format validators which is True if
+    ``parse`` does not raise a :py:class:`ValueError` for the input string."""
+
+    def check_parses(s: str) -> bool:
+        try:
+            parse(s)
+        except ValueError:
+            return False
+        return True
+
+    return check_parses
+
+
 @register_str_format("uuid", conformer=uuid.UUID)
+@with_check(_parses_with(uuid.UUID))
 def _str_is_uuid(s: str) -> Iterator[ErrorDetails]:
     try:
         uuid.UUID(s)
@@ -1182,6 +1356,7 @@ def _str_is_uuid(s: str) -> Iterator[ErrorDetails]:
 if sys.version_info >= (3, 7):
 
     @register_str_format("iso-date", conformer=date.fromisoformat)
+    @with_check(_parses_with(date.fromisoformat))
     def _str_is_iso_date(s: str) -> Iterator[ErrorDetails]:
         try:
             date.fromisoformat(s)
@@ -1193,6 +1368,7 @@ if sys.version_info >= (3, 7):
             )
 
     @register_str_format("iso-datetime", conformer=datetime.fromisoformat)
+    @with_check(_parses_with(datetime.fromisoformat))
     def _str_is_iso_datetime(s: str) -> Iterator[ErrorDetails]:
         try:
             datetime.fromisoformat(s)
@@ -1204,6 +1380,7 @@ if sys.version_info >= (3, 7):
             )
 
     @register_str_format("iso-time", conformer=time.fromisoformat)
+    @with_check(_parses_with(time.fromisoformat))
     def _str_is_iso_time(s: str) -> Iterator[ErrorDetails]:
         try:
             time.fromisoformat(s)
@@ -1228,6 +1405,7 @@ else:
             return None
 
     @register_str_format("iso-date", conformer=_str_to_iso_date)
+    @with_check(lambda s: _str_to_iso_date(s) is not None)
     def _str_is_iso_date(s: str) -> Iterator[ErrorDetails]:
         d = _str_to_iso_date(s)
         if d is None:
@@ -1238,6 +1416,7 @@ else:
             )
 
 
+@spec_factory
 def str_spec(  # noqa: MC0001  # pylint: disable=too-many-arguments
     tag: Tag = "str",
     length: Optional[int] = None,
@@ -1311,6 +1490,7 @@ def str_spec(  # noqa: MC0001  # pylint: disable=too-many-arguments
     :return: a Spec which validates strings
     """
 
+    @type_guard(str)
     @pred_to_validator("Value '{value}' is not a string", complement=True)
     def is_str(s: Any) -> bool:
         return isinstance(s, str)
@@ -1386,12 +1566,9 @@ def str_spec(  # noqa: MC0001  # pylint: disable=too-many-arguments
 
         validators.append(str_matches_regex)
     elif regex is None and format_ is not None and conform_format is None:
-        with _STR_FORMAT_LOCK:
-            validators.append(_STR_FORMATS[format_].validate)
+        validators.append(_STR_FORMATS[format_].validate)
     elif regex is None and format_ is None and conform_format is not None:
-        with _STR_FORMAT_LOCK:
-            fmt = _STR_FORMATS[conform_format]
-
+        fmt = _STR_FORMATS[conform_format]
         conformer = compose_conformers(fmt.conformer, conformer)
         validators.append(fmt.validate)
     elif sum(int(v is not None) for v in [regex, format_, conform_format]) > 1:
@@ -1418,6 +1595,7 @@ _URL_RESULT_FIELDS = frozenset(
 _URL_DISALLOWED_REGEX_FIELDS = frozenset({"port"})
 
 
+@spec_factory
 def url_str_spec(
     tag: Tag = "url_str",
     query: Optional[SpecPredicate] = None,
@@ -1497,6 +1675,7 @@ def url_str_spec(
     :return: a Spec which can validate that a string contains a URL
     """
 
+    @type_guard(str)
     @pred_to_validator("Value '{value}' is not a string", complement=True)
     def is_str(s: Any) -> bool:
         return isinstance(s, str)
@@ -1551,6 +1730,18 @@ def url_str_spec(
             query_dict = parse_qs(v.query)
             yield from query_spec.validate(query_dict)
 
+    check_parse_result = validators_check(child_validators)
+
+    def check_url(s: str) -> bool:
+        try:
+            url = urlparse(s)
+        except ValueError:
+            return False
+        return check_parse_result(url) and (
+            query_spec is None or query_spec.is_valid(parse_qs(url.query))
+        )
+
+    @with_check(check_url)
     def validate_url(s: str) -> Iterator[ErrorDetails]:
         try:
             url = urlparse(s)
@@ -1568,6 +1759,7 @@ def url_str_spec(
     return ValidatorSpec.from_validators(tag, *validators, conformer=conformer)
 
 
+@spec_factory
 def uuid_spec(
     tag: Tag = "uuid",
     versions: Optional[Set[int]] = None,
@@ -1590,6 +1782,7 @@ def uuid_spec(
     :return: a Spec which validates UUIDs
     """
 
+    @type_guard(uuid.UUID)
     @pred_to_validator("Value '{value}' is not a UUID", complement=True)
     def is_uuid(v: Any) -> bool:
         return isinstance(v, uuid.UUID)
@@ -1608,7 +1801,9 @@ def uuid_spec(
         validators.append(uuid_is_rfc_4122)
 
         @pred_to_validator(
-            f"UUID '{{value}}' is not in versions {versions}", complement=True
+            "UUID '{value}' is not in versions {versions}",
+            complement=True,
+            versions=versions,
         )
         def uuid_is_version(v: uuid.UUID) -> bool:
             return v.version in versions  # type: ignore
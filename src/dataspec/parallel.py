@@ -0,0 +1,215 @@
+"""
+Conform batches of values using a pool of worker processes and validate the elements
+of large collections using a shared pool of threads.
+
+Each worker process holds a compiled copy of the Spec, which is pickled once in the
+parent process and handed to each worker when it starts rather than with every chunk
+of values. Specs created by the :py:data:`dataspec.s` factories are pickled as the
+arguments they were created from, so the Spec is sent the same way whichever start
+method the pool uses. Workers only report whether each value was valid and the
+conformed values; errors for invalid values are produced in the parent process by the
+original Spec, since :py:class:`dataspec.ErrorDetails` instances often refer to
+functions which cannot be pickled.
+
+Collection Specs created with the ``"parallel_threshold"`` option divide collections
+with at least that many elements into chunks which are validated on a thread pool
+shared by every such Spec. Threads only validate elements concurrently where the
+predicates release the GIL (or on free-threaded builds of CPython). Chunks which are
+themselves being validated on the pool validate their nested collections in the same
+thread, so threads in the pool never wait for each other.
+"""
+import multiprocessing
+import os
+import pickle
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from dataspec.base import INVALID, BatchResult, Spec
+
+T = TypeVar("T")
+
+# The Spec used by the current worker process, set by the pool initializer
+_WORKER_SPEC: Optional[Spec] = None
+
+# The thread pool shared by collection Specs, created when it is first needed
+_THREAD_POOL: Optional[ThreadPoolExecutor] = None
+_THREAD_POOL_LOCK = threading.Lock()
+_THREAD_POOL_WORKERS = os.cpu_count() or 1
+
+# Each thread pool worker divides a collection into this many chunks per worker, so
+# that workers which finish their chunks early can pick up more work
+_CHUNKS_PER_WORKER = 4
+
+_in_thread_pool = threading.local()
+
+
+def _init_worker(pickled_spec: bytes) -> None:
+    global _WORKER_SPEC  # pylint: disable=global-statement
+    _WORKER_SPEC = pickle.loads(pickled_spec).compile()
+
+
+def _conform_chunk(chunk: List[Any]) -> List[Tuple[bool, Any]]:
+    """Conform each value in ``chunk``, returning a tuple of whether each value was
+    valid and its conformed value (or :py:obj:`None` if it was invalid).
+
+    :py:obj:`dataspec.INVALID` is a singleton which would not survive being sent back
+    to the parent process, so invalid values are flagged instead."""
+    assert _WORKER_SPEC is not None, "Worker process has not been initialized"
+    conform = _WORKER_SPEC.conform
+    results = []
+    for v in chunk:
+        conformed = conform(v)
+        results.append((False, None) if conformed is INVALID else (True, conformed))
+    return results
+
+
+def _chunks(vs: Iterable[Any], chunksize: int) -> Iterator[List[Any]]:
+    it = iter(vs)
+    while True:
+        chunk = list(islice(it, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def conform_many_in_processes(
+    spec: Spec,
+    vs: Iterable[Any],
+    workers: Optional[int] = None,
+    chunksize: int = 1000,
+    mp_context: Optional[Any] = None,
+) -> Iterator[BatchResult]:
+    """
+    Validate and conform each value in the iterable ``vs`` using a pool of worker
+    processes, yielding a :py:class:`dataspec.BatchResult` for every value in the order
+    of ``vs``.
+
+    Values are sent to workers in chunks of ``chunksize`` values. At most two chunks
+    per worker are in flight at any time, so ``vs`` may be a generator over an
+    arbitrarily large input. The pool is shut down once every result has been consumed
+    or the returned iterator is closed.
+
+    The Spec is pickled before the pool is started, so a Spec which cannot be pickled
+    fails immediately in the calling process under every start method.
+
+    :param spec: the Spec to conform values with; must be picklable
+    :param vs: an iterable of values to validate and conform; each value and its
+        conformed value must be picklable
+    :param workers: the number of worker processes; defaults to the number of CPUs
+    :param chunksize: the number of values sent to a worker at a time
+    :param mp_context: the :py:mod:`multiprocessing` context used to start the pool;
+        defaults to :py:func:`multiprocessing.get_context` with the default start
+        method
+    :return: an iterator of :py:class:`dataspec.BatchResult` instances
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+    if mp_context is None:
+        mp_context = multiprocessing.get_context()
+    pickled_spec = pickle.dumps(spec)
+    return _conform_chunks(
+        spec, pickled_spec, _chunks(vs, chunksize), workers, mp_context
+    )
+
+
+def _conform_chunks(
+    spec: Spec,
+    pickled_spec: bytes,
+    chunks: Iterator[List[Any]],
+    workers: int,
+    mp_context: Any,
+) -> Iterator[BatchResult]:
+    conform_or_errors = spec.conform_or_errors
+    index = 0
+
+    with mp_context.Pool(
+        processes=workers, initializer=_init_worker, initargs=(pickled_spec,)
+    ) as pool:
+        pending: Deque[Tuple[List[Any], Any]] = deque()
+
+        while True:
+            for chunk in chunks:
+                pending.append((chunk, pool.apply_async(_conform_chunk, (chunk,))))
+                if len(pending) >= 2 * workers:
+                    break
+
+            if not pending:
+                return
+
+            chunk, result = pending.popleft()
+            for v, (is_valid, conformed) in zip(chunk, result.get()):
+                if is_valid:
+                    yield BatchResult(index, conformed, [])
+                else:
+                    yield BatchResult(index, *conform_or_errors(v))
+                index += 1
+
+
+def _thread_pool() -> ThreadPoolExecutor:
+    global _THREAD_POOL  # pylint: disable=global-statement
+    pool = _THREAD_POOL
+    if pool is None:
+        with _THREAD_POOL_LOCK:
+            pool = _THREAD_POOL
+            if pool is None:
+                pool = _THREAD_POOL = ThreadPoolExecutor(
+                    max_workers=_THREAD_POOL_WORKERS,
+                    thread_name_prefix="dataspec",
+                    initializer=_init_thread,
+                )
+    return pool
+
+
+def _init_thread() -> None:
+    _in_thread_pool.active = True
+
+
+def map_chunks_in_threads(
+    fn: Callable[[int, Sequence[Any]], List[T]], elems: Sequence[Any]
+) -> List[T]:
+    """
+    Call ``fn`` with the index of the first element and the elements of successive
+    chunks of ``elems`` on the shared thread pool, returning the concatenation of the
+    results for each chunk in the order of ``elems``.
+
+    If called from a thread in the shared pool, every chunk is processed by the
+    calling thread.
+
+    :param fn: a function returning a list of results for a chunk of elements
+    :param elems: a sequence of elements
+    :return: the results of every chunk, in order
+    """
+    chunksize = max(1, -(-len(elems) // (_THREAD_POOL_WORKERS * _CHUNKS_PER_WORKER)))
+    starts = range(0, len(elems), chunksize)
+
+    if getattr(_in_thread_pool, "active", False):
+        chunks = [fn(start, elems[start : start + chunksize]) for start in starts]
+    else:
+        pool = _thread_pool()
+        futures = [
+            pool.submit(fn, start, elems[start : start + chunksize]) for start in starts
+        ]
+        chunks = [future.result() for future in futures]
+
+    results: List[T] = []
+    for chunk in chunks:
+        results.extend(chunk)
+    return results
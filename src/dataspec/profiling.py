@@ -0,0 +1,203 @@
+"""
+Count calls, time, and failures for each Spec in a Spec tree.
+
+Validation endpoints which check values against many tagged Specs can be slow for
+reasons which are hard to pin on any single Spec. A :py:class:`Profiler` records how
+many times each Spec validated (:py:meth:`dataspec.Spec.validate`), checked
+(:py:meth:`dataspec.Spec.is_valid`), or conformed (:py:meth:`dataspec.Spec.conform`
+and :py:meth:`dataspec.Spec.conform_or_errors`) a value, the time spent doing so both
+including (cumulative time) and excluding (self time) the time spent in child Specs,
+and how many of those values were invalid. Statistics are kept for the tags of the
+Specs from the outermost Spec to the Spec which was called (its ``via``, as in
+:py:attr:`dataspec.ErrorDetails.via`), and can be summarized by tag. Statistics are not
+kept by the location of values within the outermost value (the ``path`` of
+:py:class:`dataspec.ErrorDetails`), so every element of a collection is counted
+together.
+
+Profilers are tracers (see :py:mod:`dataspec.tracing`), so Spec methods are only
+instrumented while a profiler is enabled and Specs run exactly as fast as they
+otherwise would while no profiler is enabled.
+"""
+import threading
+from itertools import islice
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from dataspec.base import Tag
+from dataspec.tracing import Frame, Tracer, add_tracer, remove_tracer
+
+_SORT_KEYS = frozenset({"calls", "cumtime", "selftime", "failures"})
+
+# Counters are kept as lists of the number of calls, cumulative time, self time, and
+# failures so they can be updated in place
+_CALLS = 0
+_CUMTIME = 1
+_SELFTIME = 2
+_FAILURES = 3
+
+
+class ProfileStats(NamedTuple):
+    """Statistics for one operation of the Specs with one ``via`` or tag.
+
+    ``via`` is the tuple of tags of the Specs from the outermost Spec to the Spec
+    itself, or :py:obj:`None` for statistics summarized by tag."""
+
+    tag: Tag
+    via: Optional[Tuple[Tag, ...]]
+    op: str
+    calls: int
+    cumtime: float
+    selftime: float
+    failures: int
+
+
+class _ThreadCounters(threading.local):
+    def __init__(self, profiler: "Profiler"):
+        super().__init__()
+        self.counters: Dict[Tuple[Tuple[Tag, ...], str], List[Any]] = {}
+        with profiler._lock:  # pylint: disable=protected-access
+            profiler._counters.append(self.counters)  # pylint: disable=protected-access
+
+
+class Profiler(Tracer):
+    """
+    Profilers record calls, time, and failures for each chain of Spec tags while they
+    are enabled.
+
+    Profilers are enabled for the duration of a ``with`` block, or between calls to
+    :py:meth:`Profiler.enable` and :py:meth:`Profiler.disable`. Statistics from each
+    period a profiler is enabled are added together until :py:meth:`Profiler.clear` is
+    called.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: List[Dict[Tuple[Tuple[Tag, ...], str], List[Any]]] = []
+        self._thread = _ThreadCounters(self)
+        self._enabled = False
+
+    def __enter__(self) -> "Profiler":
+        self.enable()
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.disable()
+
+    def enable(self) -> None:
+        """Start profiling every Spec."""
+        self._enabled = True
+        add_tracer(self)
+
+    def disable(self) -> None:
+        """Stop profiling, restoring the original Spec methods if nothing else is
+        tracing Specs."""
+        self._enabled = False
+        remove_tracer(self)
+
+    @property
+    def enabled(self) -> bool:
+        """Return :py:obj:`True` if this profiler is enabled."""
+        return self._enabled
+
+    def clear(self) -> None:
+        """Discard every statistic recorded by this profiler."""
+        with self._lock:
+            for counters in self._counters:
+                counters.clear()
+
+    def exit(self, frame: Frame, valid: bool) -> None:
+        key = (frame.via, frame.op)
+        counters = self._thread.counters.get(key)
+        if counters is None:
+            counters = self._thread.counters[key] = [0, 0.0, 0.0, 0]
+        counters[_CALLS] += 1
+        counters[_CUMTIME] += frame.elapsed
+        counters[_SELFTIME] += frame.elapsed - frame.child_time
+        counters[_FAILURES] += not valid
+
+    def stats(self, by: str = "via") -> List[ProfileStats]:
+        """
+        Return the statistics recorded by this profiler, in no particular order.
+
+        Statistics are returned for each chain of tags if ``by`` is ``"via"``, or
+        summed over every chain ending in the same tag if ``by`` is ``"tag"``. Time
+        spent in Specs called (directly or indirectly) by a Spec with the same tag is
+        only counted once towards the cumulative time of that tag.
+
+        :param by: either ``"via"`` or ``"tag"``
+        :return: a list of :py:class:`ProfileStats`
+        """
+        if by not in {"via", "tag"}:
+            raise ValueError("Profile statistics may only be grouped by via or tag")
+
+        totals: Dict[Tuple[Any, str], List[Any]] = {}
+        with self._lock:
+            for counters in self._counters:
+                for (via, op), (calls, cumtime, selftime, failures) in list(
+                    counters.items()
+                ):
+                    if by == "tag":
+                        key: Tuple[Any, str] = (via[-1], op)
+                        if via[-1] in islice(via, len(via) - 1):
+                            cumtime = 0.0
+                    else:
+                        key = (via, op)
+                    total = totals.get(key)
+                    if total is None:
+                        total = totals[key] = [0, 0.0, 0.0, 0]
+                    total[_CALLS] += calls
+                    total[_CUMTIME] += cumtime
+                    total[_SELFTIME] += selftime
+                    total[_FAILURES] += failures
+
+        return [
+            ProfileStats(key, None, op, *total)
+            if by == "tag"
+            else ProfileStats(key[-1], key, op, *total)
+            for (key, op), total in totals.items()
+        ]
+
+    def report(
+        self, by: str = "via", sort: str = "cumtime", limit: Optional[int] = None
+    ) -> str:
+        """
+        Return a table of the statistics recorded by this profiler, sorted in
+        descending order of the statistic named by ``sort``.
+
+        :param by: either ``"via"`` or ``"tag"``, as for :py:meth:`Profiler.stats`
+        :param sort: one of ``"calls"``, ``"cumtime"``, ``"selftime"``, or
+            ``"failures"``
+        :param limit: if given, the maximum number of rows to include
+        :return: the report as a string
+        """
+        if sort not in _SORT_KEYS:
+            raise ValueError(f"Cannot sort profile statistics by '{sort}'")
+
+        rows = sorted(self.stats(by), key=lambda st: getattr(st, sort), reverse=True)
+        lines = [
+            f"{'calls':>10} {'cumtime':>10} {'selftime':>10} {'failures':>10}  "
+            f"{'op':<8}  {by}"
+        ]
+        for st in islice(rows, limit):
+            name = st.tag if st.via is None else "/".join(map(str, st.via))
+            lines.append(
+                f"{st.calls:>10} {st.cumtime:>10.6f} {st.selftime:>10.6f} "
+                f"{st.failures:>10}  {st.op:<8}  {name}"
+            )
+        return "\n".join(lines)
+
+
+def profile() -> Profiler:
+    """
+    Return a new :py:class:`Profiler`, which records the number of calls, cumulative
+    time, self time, and failures for every chain of Spec tags while it is enabled.
+
+    Profilers may be used as context managers, which enable the profiler for the
+    duration of the ``with`` block::
+
+        with dataspec.profile() as profiler:
+            spec.conform(v)
+        print(profiler.report())
+
+    :return: a new, disabled :py:class:`Profiler`
+    """
+    return Profiler()
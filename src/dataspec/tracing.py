@@ -0,0 +1,320 @@
+"""
+Observe each Spec as it validates, checks, or conforms a value.
+
+Tracers are notified when a Spec starts validating (:py:meth:`dataspec.Spec.validate`),
+checking (:py:meth:`dataspec.Spec.is_valid`), or conforming
+(:py:meth:`dataspec.Spec.conform` and :py:meth:`dataspec.Spec.conform_or_errors`) a
+value and again when it finishes, along with the tags of the Specs from the outermost
+Spec to that Spec (its ``via``, as in :py:attr:`dataspec.ErrorDetails.via`) and
+whether the value was valid. Tracers are not told where in the value a Spec is (the
+``path`` of :py:class:`dataspec.ErrorDetails`), since Specs do not report the key or
+index of the value they pass to each of their children. Calls which a Spec makes to
+its own methods (such as :py:meth:`dataspec.Spec.conform` calling
+:py:meth:`dataspec.Spec.is_valid`) are part of the outer call and are not reported
+separately.
+
+Tracing works by replacing the validation methods of every Spec class with
+instrumented versions while at least one tracer (such as the hooks installed by
+:py:func:`set_trace_hooks` or a :py:class:`dataspec.profiling.Profiler`) is active and
+restoring the originals once none are, so Specs run exactly as fast as they otherwise
+would while nothing is being traced. Spec classes created while tracing is active
+(such as those in modules which are only imported when first used) are instrumented as
+they are created. Specs created by
+:py:meth:`dataspec.Spec.compile` validate their children in generated code, so only
+the compiled Spec itself is traced. Elements of collections validated on the shared
+thread pool (see the ``"parallel_threshold"`` collection Spec option) are traced with
+``via`` starting at the element Spec.
+"""
+import functools
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Type
+
+from dataspec.base import INVALID, ErrorDetails, Spec, Tag
+
+# The Spec methods which are instrumented while any tracer is active, along with the
+# name of the operation each is reported as and a function which returns True if the
+# method's result indicates the value was invalid
+_TRACED_METHODS: Dict[str, Tuple[str, Callable[[Any], bool]]] = {
+    "_check": ("is_valid", lambda valid: not valid),
+    "conform": ("conform", lambda conformed: conformed is INVALID),
+    "conform_valid": ("conform", lambda conformed: conformed is INVALID),
+    "conform_or_errors": ("conform", lambda result: bool(result[1])),
+}
+
+# Tracers are notified far more often than they are added or removed, so the tuple of
+# active tracers is replaced rather than modified when tracers are added or removed
+_TRACERS: Tuple["Tracer", ...] = ()
+_TRACERS_LOCK = threading.Lock()
+_ORIGINAL_METHODS: List[Tuple[type, str, Any]] = []
+
+OnEnter = Callable[[Tag, Tuple[Tag, ...], str], None]
+OnExit = Callable[[Tag, Tuple[Tag, ...], str, bool, float], None]
+
+
+class Frame:
+    """
+    A call to one of a Spec's validation methods.
+
+    :py:attr:`elapsed` is the time spent in the call so far, including the time spent
+    in calls to the Specs it called (which is also recorded in
+    :py:attr:`child_time`), but excluding the time a Spec's
+    :py:meth:`dataspec.Spec.validate` iterator spent waiting for its caller to ask for
+    the next error.
+    """
+
+    __slots__ = ("spec", "via", "op", "elapsed", "child_time")
+
+    def __init__(self, spec: Spec, via: Tuple[Tag, ...], op: str):
+        self.spec = spec
+        self.via = via
+        self.op = op
+        self.elapsed = 0.0
+        self.child_time = 0.0
+
+
+class Tracer:
+    """The base class of objects notified of every traced call."""
+
+    def enter(self, frame: Frame) -> None:
+        """Called before ``frame.spec`` starts validating a value."""
+
+    def exit(self, frame: Frame, valid: bool) -> None:
+        """Called after ``frame.spec`` finished validating a value, or raised an
+        exception (in which case ``valid`` is :py:obj:`False`)."""
+
+
+class _ThreadState(threading.local):
+    def __init__(self) -> None:
+        super().__init__()
+        self.stack: List[Frame] = []
+
+
+_state = _ThreadState()
+
+
+def add_tracer(tracer: Tracer) -> None:
+    """Start notifying ``tracer`` of every traced call, instrumenting the Spec classes
+    if no other tracer is active."""
+    global _TRACERS  # pylint: disable=global-statement
+    with _TRACERS_LOCK:
+        if tracer in _TRACERS:
+            return
+        if not _TRACERS:
+            _instrument()
+        _TRACERS = _TRACERS + (tracer,)
+
+
+def remove_tracer(tracer: Tracer) -> None:
+    """Stop notifying ``tracer``, restoring the original Spec methods if no other
+    tracer is active."""
+    global _TRACERS  # pylint: disable=global-statement
+    with _TRACERS_LOCK:
+        if tracer not in _TRACERS:
+            return
+        _TRACERS = tuple(t for t in _TRACERS if t is not tracer)
+        if not _TRACERS:
+            _restore()
+
+
+def _spec_classes() -> Iterator[type]:
+    seen = set()
+    pending = [Spec]
+    while pending:
+        cls = pending.pop()
+        if cls in seen:
+            continue
+        seen.add(cls)
+        yield cls
+        pending.extend(cls.__subclasses__())
+
+
+def _instrument() -> None:
+    for cls in _spec_classes():
+        _instrument_class(cls)
+    # Instrument Spec classes created while tracing is active as they are created
+    original = vars(Spec).get("__init_subclass__")
+    _ORIGINAL_METHODS.append((Spec, "__init_subclass__", original))
+    setattr(Spec, "__init_subclass__", classmethod(_init_subclass))
+
+
+def _instrument_class(cls: type) -> None:
+    for name, method in list(vars(cls).items()):
+        # Slotted attrs classes are copies of the class they were created from, so
+        # their methods may already be instrumented
+        method = getattr(method, "_traced_method", method)
+        if name == "validate":
+            wrapper = _trace_validate(method)
+        elif name in _TRACED_METHODS:
+            wrapper = _trace(method, *_TRACED_METHODS[name])
+        else:
+            continue
+        wrapper._traced_method = method
+        _ORIGINAL_METHODS.append((cls, name, method))
+        setattr(cls, name, wrapper)
+
+
+def _init_subclass(cls: Type[Spec], **kwargs: Any) -> None:
+    super(Spec, cls).__init_subclass__(**kwargs)
+    with _TRACERS_LOCK:
+        if _TRACERS:
+            _instrument_class(cls)
+
+
+def _restore() -> None:
+    for cls, name, method in reversed(_ORIGINAL_METHODS):
+        if method is None:
+            delattr(cls, name)
+        else:
+            setattr(cls, name, method)
+    _ORIGINAL_METHODS.clear()
+
+
+def _new_frame(stack: List[Frame], spec: Spec, op: str) -> Optional[Frame]:
+    """Return a frame for a call to ``spec``, or :py:obj:`None` if ``spec`` is calling
+    one of its own methods."""
+    if stack:
+        parent = stack[-1]
+        if parent.spec is spec:
+            return None
+        return Frame(spec, parent.via + (spec.tag,), op)
+    return Frame(spec, (spec.tag,), op)
+
+
+def _pop(stack: List[Frame], frame: Frame, elapsed: float) -> None:
+    stack.pop()
+    frame.elapsed += elapsed
+    if stack:
+        stack[-1].child_time += elapsed
+
+
+def _exit(frame: Frame, valid: bool) -> None:
+    for tracer in _TRACERS:
+        tracer.exit(frame, valid)
+
+
+def _trace(method, op: str, failed: Callable[[Any], bool]):
+    @functools.wraps(method)
+    def traced(spec, v):
+        stack = _state.stack
+        frame = _new_frame(stack, spec, op)
+        if frame is None:
+            return method(spec, v)
+
+        for tracer in _TRACERS:
+            tracer.enter(frame)
+        stack.append(frame)
+        start = time.perf_counter()
+        try:
+            result = method(spec, v)
+        except BaseException:
+            _pop(stack, frame, time.perf_counter() - start)
+            _exit(frame, False)
+            raise
+        _pop(stack, frame, time.perf_counter() - start)
+        _exit(frame, not failed(result))
+        return result
+
+    return traced
+
+
+def _trace_validate(method):
+    @functools.wraps(method)
+    def traced(spec, v):
+        frame = _new_frame(_state.stack, spec, "validate")
+        if frame is None:
+            return method(spec, v)
+        return _trace_errors(frame, method(spec, v))
+
+    return traced
+
+
+def _trace_errors(
+    frame: Frame, errors: Iterator[ErrorDetails]
+) -> Iterator[ErrorDetails]:
+    # Errors are produced lazily, so the frame is only on the stack while the next
+    # error is being produced and the call ends once the iterator is exhausted or
+    # closed. Closing the wrapped iterator first ensures any calls it has started end
+    # before this one.
+    for tracer in _TRACERS:
+        tracer.enter(frame)
+    valid = True
+    try:
+        while True:
+            stack = _state.stack
+            stack.append(frame)
+            start = time.perf_counter()
+            try:
+                error = next(errors)
+            except StopIteration:
+                return
+            except BaseException:
+                valid = False
+                raise
+            finally:
+                _pop(stack, frame, time.perf_counter() - start)
+            valid = False
+            yield error
+    finally:
+        getattr(errors, "close", lambda: None)()
+        _exit(frame, valid)
+
+
+class _TraceHooks(Tracer):
+    __slots__ = ("on_enter", "on_exit")
+
+    def __init__(self, on_enter: Optional[OnEnter], on_exit: Optional[OnExit]):
+        self.on_enter = on_enter
+        self.on_exit = on_exit
+
+    def enter(self, frame: Frame) -> None:
+        if self.on_enter is not None:
+            self.on_enter(frame.spec.tag, frame.via, frame.op)
+
+    def exit(self, frame: Frame, valid: bool) -> None:
+        if self.on_exit is not None:
+            self.on_exit(frame.spec.tag, frame.via, frame.op, valid, frame.elapsed)
+
+
+_HOOKS: Optional[_TraceHooks] = None
+
+
+def set_trace_hooks(
+    on_enter: Optional[OnEnter] = None, on_exit: Optional[OnExit] = None
+) -> None:
+    """
+    Install functions which are called as each Spec starts and finishes validating,
+    checking, or conforming a value, replacing any hooks installed previously.
+
+    ``on_enter`` is called with the tag of the Spec, the tuple of tags of the Specs
+    from the outermost Spec to that Spec (as in :py:attr:`dataspec.ErrorDetails.via`),
+    and the name of the operation (``"validate"``,
+    ``"is_valid"``, or ``"conform"``). ``on_exit`` is called with the same arguments
+    followed by :py:obj:`True` if the value was valid (or :py:obj:`False` if it was
+    invalid or the Spec raised an exception) and the number of seconds the Spec spent
+    on the value, including the time spent in the Specs it called. Calls to
+    ``on_exit`` are nested within the calls to ``on_enter`` for the same Spec in the
+    same way the Spec calls are nested.
+
+    Calling ``set_trace_hooks()`` with no hooks removes the installed hooks. Spec
+    methods are only instrumented while hooks (or a
+    :py:class:`dataspec.profiling.Profiler`) are installed, so Specs run as fast as
+    they otherwise would once the hooks are removed.
+
+    :param on_enter: a function called as each Spec starts validating a value
+    :param on_exit: a function called as each Spec finishes validating a value
+    :return: :py:obj:`None`
+    """
+    global _HOOKS  # pylint: disable=global-statement
+    with _TRACERS_LOCK:
+        hooks, _HOOKS = _HOOKS, None
+    if hooks is not None:
+        remove_tracer(hooks)
+
+    if on_enter is None and on_exit is None:
+        return
+
+    hooks = _TraceHooks(on_enter, on_exit)
+    with _TRACERS_LOCK:
+        _HOOKS = hooks
+    add_tracer(hooks)
@@ -0,0 +1,31 @@
+import functools
+from typing import Callable, Optional
+
+import pytest
+
+
+@pytest.fixture
+def calls() -> list:
+    return []
+
+
+@pytest.fixture
+def counted(calls: list) -> Callable:
+    """
+    Return a function which wraps a predicate, appending to ``calls`` every time the
+    wrapped predicate is called.
+
+    The value passed to the predicate is appended unless a ``label`` is given, in
+    which case the label is appended instead. The wrapper takes the name of the
+    predicate, so errors from it have the same ``via`` as errors from the predicate.
+    """
+
+    def counted(pred: Callable, label: Optional[str] = None) -> Callable:
+        @functools.wraps(pred)
+        def check(v) -> bool:
+            calls.append(v if label is None else label)
+            return pred(v)
+
+        return check
+
+    return counted
@@ -1,4 +1,6 @@
 import re
+import subprocess
+import sys
 from typing import Iterator
 
 import pytest
@@ -156,3 +158,39 @@ class TestFunctionSpecs:
 
         with pytest.raises(ValidationError):
             add("hi ", "there")
+
+
+class TestImport:
+    @staticmethod
+    def run_python(*args: str) -> str:
+        return subprocess.run(
+            [sys.executable, *args],
+            check=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            universal_newlines=True,
+        ).stdout
+
+    def test_import_does_not_load_optional_dependencies(self):
+        loaded = self.run_python(
+            "-c",
+            "import sys, dataspec; "
+            "print(sorted({'dateutil', 'email.headerregistry', 'phonenumbers'} "
+            "& set(sys.modules)))",
+        )
+        assert "[]" == loaded.strip()
+
+    def test_prebaked_specs_created_on_first_access(self):
+        loaded = self.run_python(
+            "-c",
+            "import sys; from dataspec import s; "
+            "print('email.headerregistry' in sys.modules); "
+            "print(s.is_email.is_valid('me@example.com')); "
+            "print('email.headerregistry' in sys.modules)",
+        )
+        assert ["False", "True", "True"] == loaded.split()
+
+    def test_prebaked_specs_are_singletons(self):
+        assert s.is_str is s.is_str
+        assert s.is_str.is_valid("a")
+        assert not s.is_str.is_valid(1)
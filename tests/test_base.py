@@ -1,15 +1,38 @@
+import asyncio
+import inspect
+import multiprocessing
+import pickle
 import random
 import re
 import sys
+import threading
 import uuid
-from datetime import date
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
 from enum import Enum
-from typing import Optional, Type
+from types import SimpleNamespace
+from typing import AsyncIterator, Iterator, Optional, Type
 
 import attr
 import pytest
 
-from dataspec import INVALID, Spec, ValidationError, s
+from dataspec import (
+    INVALID,
+    BranchInfo,
+    ErrorDetails,
+    Spec,
+    ValidationError,
+    branch_info,
+    pred_to_validator,
+    profile,
+    s,
+    set_interning,
+    set_trace_hooks,
+)
+from dataspec.base import PredicateSpec, ValidatorSpec
+from dataspec.cache import CachedSpec
+from dataspec.compiler import CompiledSpec
 
 
 class TestCollSpecValidation:
@@ -248,6 +271,88 @@ class TestCollSpecConformation:
         assert {"CA", "GA", "IL", "NY"} == conformed
 
 
+class TestParallelCollSpec:
+    @pytest.fixture
+    def threads(self) -> set:
+        return set()
+
+    @pytest.fixture
+    def is_short(self, threads: set):
+        def is_short(v) -> bool:
+            threads.add(threading.current_thread().name)
+            return len(v) < 3
+
+        return is_short
+
+    @pytest.fixture
+    def make_spec(self, is_short):
+        def make_spec(**kwargs) -> Spec:
+            return s(
+                [
+                    s.all(s.str(conformer=str.upper), is_short),
+                    {"into": tuple, "maxlength": 500, **kwargs},
+                ]
+            )
+
+        return make_spec
+
+    @pytest.mark.parametrize(
+        "v",
+        [
+            [],
+            ["a", "bc"] * 60,
+            ["a", "bcd", 3, None, "ef"] * 20,
+            tuple(f"{i}" for i in range(101)),
+            {f"{i}" for i in range(100)},
+            ["a"] * 501,
+            "a string",
+        ],
+    )
+    def test_same_as_sequential(self, make_spec, v):
+        spec = make_spec()
+        parallel_spec = make_spec(parallel_threshold=10)
+
+        assert spec.is_valid(v) == parallel_spec.is_valid(v)
+        assert [e.as_map() for e in spec.validate_all(v)] == [
+            e.as_map() for e in parallel_spec.validate_all(v)
+        ]
+        assert spec.conform(v) == parallel_spec.conform(v)
+        assert spec.compile().conform(v) == parallel_spec.compile().conform(v)
+
+        conformed, errors = spec.conform_or_errors(v)
+        parallel_conformed, parallel_errors = parallel_spec.conform_or_errors(v)
+        assert conformed == parallel_conformed
+        assert [e.as_map() for e in errors] == [e.as_map() for e in parallel_errors]
+
+    def test_threshold(self, make_spec, threads: set):
+        spec = make_spec(parallel_threshold=100)
+
+        assert spec.is_valid(["a"] * 99)
+        assert {threading.current_thread().name} == threads
+
+        assert spec.is_valid(["a"] * 100)
+        assert any(name.startswith("dataspec") for name in threads)
+
+    def test_iterators_are_validated_sequentially(self, is_short, threads: set):
+        spec = s([is_short, {"parallel_threshold": 1}])
+        assert spec.is_valid(iter(["a"] * 100))
+        assert {threading.current_thread().name} == threads
+
+    def test_nested_collections(self):
+        spec = s([[int, {"parallel_threshold": 2}], {"parallel_threshold": 2}])
+        assert spec.is_valid([[1, 2, 3]] * 100)
+        assert [[99, 1]] == [
+            e.path for e in spec.validate_all([[1, 2, 3]] * 99 + [[1, "2"]])
+        ]
+
+    @pytest.mark.parametrize(
+        "threshold,exc", [("100", TypeError), (0, ValueError), (-1, ValueError)]
+    )
+    def test_threshold_validation(self, threshold, exc):
+        with pytest.raises(exc):
+            s([int, {"parallel_threshold": threshold}])
+
+
 class TestDictSpecValidation:
     @pytest.mark.parametrize(
         "pred", [{"id": str, s.opt("id"): int}, {s.opt("id"): int, "id": str},]
@@ -1038,6 +1143,287 @@ class TestAnySpecWithOuterConformation:
         assert INVALID is tag_spec.conform_valid(v)
 
 
+class TestAnySpecTypeDispatch:
+    @pytest.fixture
+    def spec(self, counted) -> Spec:
+        return s.any(
+            s.all(s.str(), counted(lambda _: True, "str")),
+            s.all(s.num(), counted(lambda _: True, "num")),
+            {None},
+            s.all(s.uuid(), counted(lambda _: True, "uuid")),
+        )
+
+    @pytest.mark.parametrize(
+        "v,expected_calls",
+        [
+            ("a", ["str"]),
+            (1, ["num"]),
+            (1.5, ["num"]),
+            (True, ["num"]),
+            (None, []),
+            (uuid.uuid4(), ["uuid"]),
+        ],
+    )
+    def test_only_candidate_branches_are_checked(
+        self, spec: Spec, calls: list, v, expected_calls
+    ):
+        assert spec.is_valid(v)
+        assert expected_calls == calls
+
+        calls.clear()
+        assert v == spec.conform(v)
+        assert expected_calls * 2 == calls
+
+    @pytest.mark.parametrize("v", [b"a", (), frozenset(), object()])
+    def test_other_types(self, spec: Spec, calls: list, v):
+        assert not spec.is_valid(v)
+        assert INVALID is spec.conform(v)
+        assert 4 == len(spec.validate_all(v))
+        assert [] == calls
+
+    def test_conforms_with_first_valid_branch(self):
+        spec = s.any(
+            s.num("num", conformer=lambda v: ("num", v)),
+            {1, 2},
+            s.str("str"),
+            s.all(int, lambda v: v > 0, conformer=lambda v: ("pos", v)),
+            tag_conformed=True,
+        )
+        assert ("num", ("num", 1)) == spec.conform(1)
+        assert ("num", ("num", True)) == spec.conform(True)
+        assert ("str", "1") == spec.conform("1")
+
+    @pytest.mark.parametrize("v", [1, 1.0, True])
+    def test_set_branches_match_equal_numbers(self, v):
+        spec = s.any(s.str(), {1, "b"})
+        assert spec.is_valid(v)
+        assert v == spec.conform(v)
+
+    def test_set_branches_match_objects_equal_to_scalars(self):
+        class AlwaysEqual:
+            def __eq__(self, other):
+                return True
+
+            def __hash__(self):
+                return hash("a")
+
+        spec = s.any(s.all(AlwaysEqual, lambda _: False), {"a"})
+        assert spec.is_valid(AlwaysEqual())
+
+
+class TestAnySpecAdaptive:
+    @pytest.fixture
+    def spec(self, counted, monkeypatch) -> Spec:
+        monkeypatch.setattr("dataspec.base._REORDER_INTERVAL", 10)
+        return s.any(
+            s.all("upper", s.str(), counted(str.isupper, "upper"), conformer=str.lower),
+            s.all("digit", s.str(), counted(str.isdigit, "digit"), conformer=int),
+            s.all("alnum", s.str(), counted(str.isalnum, "alnum")),
+            adaptive=True,
+        )
+
+    def test_branch_info(self, spec: Spec):
+        assert [
+            BranchInfo(0, "upper", 0),
+            BranchInfo(1, "digit", 0),
+            BranchInfo(2, "alnum", 0),
+        ] == branch_info(spec)
+
+        for v in ["ABC", "123", "abc1", "abc2", "!"]:
+            spec.is_valid(v)
+
+        assert [0, 1, 2] == [info.position for info in branch_info(spec)]
+        assert [1, 1, 2] == [info.hits for info in branch_info(spec)]
+
+    def test_most_frequent_branch_is_checked_first(self, spec: Spec, calls: list):
+        for _ in range(10):
+            assert spec.is_valid("abc")
+
+        calls.clear()
+        assert spec.is_valid("abc")
+        assert ["alnum"] == calls
+
+        calls.clear()
+        assert spec.is_valid("ABC")
+        assert ["alnum"] == calls
+
+        calls.clear()
+        assert not spec.is_valid("!")
+        assert ["alnum", "upper", "digit"] == calls
+
+    @pytest.mark.parametrize(
+        "v,conformed", [("ABC", "abc"), ("123", 123), ("abc", "abc"), ("!", INVALID)]
+    )
+    def test_conforms_with_first_declared_valid_branch(
+        self, spec: Spec, v, conformed
+    ):
+        for _ in range(20):
+            spec.is_valid("abc")
+
+        assert conformed == spec.conform(v)
+        assert bool(spec.validate_all(v)) is (conformed is INVALID)
+        assert (conformed is INVALID) is (not spec.is_valid(v))
+
+    def test_errors_are_in_declared_order(self, spec: Spec):
+        for _ in range(20):
+            spec.is_valid("abc")
+
+        assert ["upper", "digit", "alnum"] == [
+            e.via[1] for e in spec.validate_all("!")
+        ]
+
+    def test_compiled_and_cached_specs(self, spec: Spec):
+        for wrapped in (spec.compile(), spec.cached()):
+            assert wrapped.is_valid("abc")
+        assert 2 == branch_info(spec)[2].hits
+        assert branch_info(spec) == branch_info(spec.compile())
+
+    @pytest.mark.parametrize(
+        "spec", [s.any(s.str(), s.num()), s.all(s.str(), s.num()), s.str()]
+    )
+    def test_branch_info_requires_adaptive_any_spec(self, spec: Spec):
+        with pytest.raises(TypeError):
+            branch_info(spec)
+
+
+class TestUnionSpecConstruction:
+    def test_union_spec_must_have_variants(self):
+        with pytest.raises(ValueError):
+            s.union("type", {})
+
+    def test_union_spec_tag(self):
+        assert "union" == s.union("type", {"a": dict}).tag
+        assert "event" == s.union("type", {"a": dict}, tag="event").tag
+
+
+class TestUnionSpecValidation:
+    @pytest.fixture
+    def spec(self, counted) -> Spec:
+        return s.union(
+            "type",
+            {
+                "claim": {
+                    "type": {"claim"},
+                    "amount": s("amount", counted(lambda v: v >= 0, "amount")),
+                },
+                "eligibility": {
+                    "type": {"eligibility"},
+                    "member": s(
+                        "member", counted(lambda v: v.startswith("M"), "member")
+                    ),
+                },
+            },
+        )
+
+    @pytest.mark.parametrize(
+        "v",
+        [
+            {"type": "claim", "amount": 3},
+            {"type": "eligibility", "member": "M1"},
+            {"type": "eligibility", "member": "M1", "amount": -1},
+        ],
+    )
+    def test_union_validation(self, spec: Spec, v):
+        assert spec.is_valid(v)
+        assert [] == spec.validate_all(v)
+
+    def test_only_selected_variant_is_validated(self, spec: Spec, calls: list):
+        assert spec.is_valid({"type": "eligibility", "member": "M1"})
+        assert ["member"] == calls
+
+        calls.clear()
+        assert not spec.is_valid({"type": "claim", "amount": -1})
+        assert ["amount"] == calls
+
+    def test_variant_errors(self, spec: Spec):
+        errors = spec.validate_all({"type": "claim", "amount": -1})
+        assert 1 == len(errors)
+        assert ["amount"] == errors[0].path
+        assert ["union", "map", "amount"] == errors[0].via
+
+    @pytest.mark.parametrize(
+        "v,path,value",
+        [
+            ({"type": "unknown", "amount": 3}, ["type"], "unknown"),
+            ({"type": ["claim"]}, ["type"], ["claim"]),
+            ({"amount": 3}, ["type"], {"amount": 3}),
+            (None, [], None),
+            (5, [], 5),
+            ("claim", [], "claim"),
+            (["type"], [], ["type"]),
+        ],
+    )
+    def test_discriminator_errors(self, spec: Spec, v, path, value):
+        assert not spec.is_valid(v)
+        errors = spec.validate_all(v)
+        assert 1 == len(errors)
+        assert path == errors[0].path
+        assert ["union"] == errors[0].via
+        assert value == errors[0].value
+
+    def test_unknown_discriminator_message(self, spec: Spec):
+        (error,) = spec.validate_all({"type": "unknown"})
+        assert (
+            "Value 'unknown' for key type not in ['claim', 'eligibility']"
+            == error.message
+        )
+
+    def test_not_a_mapping_message(self, spec: Spec):
+        (error,) = spec.validate_all("claim")
+        assert "Value is not a mapping type" == error.message
+
+    def test_defaultdict_is_not_modified(self, spec: Spec):
+        v: defaultdict = defaultdict(int)
+        assert not spec.is_valid(v)
+        assert not spec.compile().is_valid(v)
+        assert INVALID is spec.conform(v)
+        assert ["type"] == [e.path[0] for e in spec.validate_all(v)]
+        assert ["type"] == [e.path[0] for e in run(spec.avalidate(v))]
+        assert {} == v
+
+
+class TestUnionSpecConformation:
+    @pytest.fixture
+    def spec(self) -> Spec:
+        return s.union(
+            "type",
+            {
+                "a": {"type": {"a"}, "value": s.str(regex=r"\d+", conformer=int)},
+                "b": {"type": {"b"}, s.opt("value"): s.num()},
+            },
+            conformer=lambda v: {**v, "conformed": True},
+        )
+
+    @pytest.mark.parametrize(
+        "expected,v",
+        [
+            ({"type": "a", "value": 5, "conformed": True}, {"type": "a", "value": "5"}),
+            ({"type": "b", "conformed": True}, {"type": "b", "extra": 1}),
+        ],
+    )
+    def test_conformation(self, spec: Spec, expected, v):
+        assert expected == spec.conform(v)
+        assert (expected, []) == spec.conform_or_errors(v)
+        assert expected == spec.compile().conform(v)
+
+    @pytest.mark.parametrize(
+        "v",
+        [
+            None,
+            {},
+            {"type": "c"},
+            {"type": "a", "value": 5},
+            {"type": "b", "value": "5"},
+        ],
+    )
+    def test_conformation_failure(self, spec: Spec, v):
+        assert INVALID is spec.conform(v)
+        assert INVALID is spec.compile().conform(v)
+        conformed, errors = spec.conform_or_errors(v)
+        assert INVALID is conformed
+        assert spec.validate_all(v) == errors
+
+
 class TestMergeSpecConstruction:
     def test_merge_spec_must_have_pred(self):
         with pytest.raises(TypeError):
@@ -1187,3 +1573,1480 @@ class TestTypeSpec:
         spec = s(tp)
         vals = filter(lambda v: not isinstance(v, tp), python_vals)
         assert all(not spec.is_valid(v) for v in vals)
+
+
+class TestConformOrErrors:
+    @pytest.fixture
+    def nested_spec(self, counted) -> Spec:
+        def is_int(v) -> bool:
+            return isinstance(v, int)
+
+        return s(
+            "doc",
+            {
+                "id": s.str(conform_format="uuid"),
+                "rows": [
+                    s("row", (counted(is_int), s.nilable(s.str(conformer=str.upper))))
+                ],
+                s.opt("tags"): s.kv(str, s.all(int, lambda v: v > 0)),
+                "kind": s.any(s.num(), s.blankable(s.str(regex=r"[a-z]+"))),
+                s.opt("event"): s.union(
+                    "type", {"a": {"type": str, "rows": [int]}, "b": {"type": str}}
+                ),
+            },
+        )
+
+    @pytest.mark.parametrize(
+        "v",
+        [
+            {
+                "id": "c5a28680-986f-4f0d-8187-80d1fbe22059",
+                "rows": [(1, "a"), (2, None)],
+                "tags": {"a": 1},
+                "kind": "",
+            },
+            {"id": "c5a28680-986f-4f0d-8187-80d1fbe22059", "rows": [], "kind": 3,},
+        ],
+    )
+    def test_conform_or_errors_matches_conform(self, nested_spec: Spec, v):
+        conformed, errors = nested_spec.conform_or_errors(v)
+        assert [] == errors
+        assert nested_spec.conform(v) == conformed
+
+    @pytest.mark.parametrize(
+        "v",
+        [
+            None,
+            {},
+            {"id": "not-a-uuid", "rows": [(1, 2), ("2", None)], "kind": "A"},
+            {
+                "id": "c5a28680-986f-4f0d-8187-80d1fbe22059",
+                "rows": [(1,)],
+                "tags": {"a": -1, 1: 1},
+                "kind": None,
+            },
+        ],
+    )
+    def test_conform_or_errors_failure(self, nested_spec: Spec, v):
+        conformed, errors = nested_spec.conform_or_errors(v)
+        assert INVALID is conformed
+        assert [e.as_map() for e in nested_spec.validate_all(v)] == [
+            e.as_map() for e in errors
+        ]
+
+    def test_conform_or_errors_visits_values_once(self, nested_spec: Spec, calls):
+        nested_spec.conform_or_errors(
+            {
+                "id": "c5a28680-986f-4f0d-8187-80d1fbe22059",
+                "rows": [(1, "a"), (2, None), (3, "c")],
+                "kind": 1,
+            }
+        )
+        assert [1, 2, 3] == calls
+
+    def test_conform_or_errors_with_replaced_conformer(self):
+        spec = s({"a": s.str(conformer=str.upper)}).with_conformer(len)
+        assert (1, []) == spec.conform_or_errors({"a": "b"})
+
+        spec = s.nilable(s.str(conformer=str.upper)).with_conformer(str)
+        assert ("None", []) == spec.conform_or_errors(None)
+        assert ("b", []) == spec.conform_or_errors("b")
+
+
+class TestCompile:
+    class Point:
+        def __init__(self, x, y=None):
+            self.x = x
+            if y is not None:
+                self.y = y
+
+    @pytest.fixture
+    def source_spec(self) -> Spec:
+        return s(
+            "doc",
+            {
+                "id": s.str(conform_format="uuid"),
+                "rows": [
+                    s("row", (int, s.nilable(s.str(conformer=str.upper)))),
+                    {"kind": list, "maxlength": 3},
+                ],
+                s.opt("tags"): s.kv(str, s.all(int, lambda v: v > 0)),
+                s.opt("color"): {"red", "green"},
+                s.opt("point"): s.obj({"x": s.num(min_=0), s.opt("y"): int}),
+                "kind": s.any(s.num(), s.blankable(s.str(regex=r"[a-z]+"))),
+            },
+        )
+
+    @pytest.fixture
+    def compiled_spec(self, source_spec: Spec) -> Spec:
+        return source_spec.compile()
+
+    @pytest.mark.parametrize(
+        "v",
+        [
+            {
+                "id": "c5a28680-986f-4f0d-8187-80d1fbe22059",
+                "rows": [(1, "a"), (2, None)],
+                "tags": {"a": 1},
+                "color": "red",
+                "point": Point(1),
+                "kind": "",
+            },
+            {
+                "id": "c5a28680-986f-4f0d-8187-80d1fbe22059",
+                "rows": [],
+                "point": Point(1.5, 3),
+                "kind": 3,
+            },
+        ],
+    )
+    def test_compiled_valid(self, source_spec: Spec, compiled_spec: Spec, v):
+        assert compiled_spec.is_valid(v)
+        assert [] == compiled_spec.validate_all(v)
+        assert source_spec.conform(v) == compiled_spec.conform(v)
+        assert source_spec.conform_or_errors(v) == compiled_spec.conform_or_errors(v)
+
+    @pytest.mark.parametrize(
+        "v",
+        [
+            None,
+            {},
+            [("a", 1)],
+            {"id": "not-a-uuid", "rows": [(1, 2), ("2", None)], "kind": "A"},
+            {
+                "id": "c5a28680-986f-4f0d-8187-80d1fbe22059",
+                "rows": ((1, "a"),),
+                "kind": 1,
+            },
+            {
+                "id": "c5a28680-986f-4f0d-8187-80d1fbe22059",
+                "rows": [(1,), (1, "a"), (1, "a"), (1, "a")],
+                "tags": {"a": -1, 1: 1},
+                "color": "blue",
+                "point": Point(-1, "2"),
+                "kind": None,
+            },
+        ],
+    )
+    def test_compiled_invalid(self, source_spec: Spec, compiled_spec: Spec, v):
+        assert not compiled_spec.is_valid(v)
+        assert INVALID is compiled_spec.conform(v)
+        assert [e.as_map() for e in source_spec.validate_all(v)] == [
+            e.as_map() for e in compiled_spec.validate_all(v)
+        ]
+
+    def test_compiled_deeply_nested(self):
+        spec = int
+        for _ in range(30):
+            spec = s({"a": [spec]})
+        compiled = s(spec).compile()
+
+        v = 1
+        for _ in range(30):
+            v = {"a": [v]}
+        assert compiled.is_valid(v)
+        assert v == compiled.conform(v)
+
+    def test_compiled_with_replaced_conformer(self):
+        compiled = s({"a": s.str(conformer=str.upper)}).with_conformer(len).compile()
+        assert 1 == compiled.conform({"a": "b"})
+
+        compiled = compiled.with_conformer(None)
+        assert {"a": "b"} == compiled.conform({"a": "b"})
+
+    def test_compiled_conformer_may_return_invalid(self):
+        compiled = s.str(conformer=lambda _: INVALID).compile()
+        assert compiled.is_valid("a")
+        assert INVALID is compiled.conform("a")
+
+    def test_compiled_conformer_exceptions_propagate(self, calls: list):
+        def fail(v):
+            calls.append(v)
+            raise ValueError(v)
+
+        compiled = s({"a": s.str(conformer=fail), "b": int}).compile()
+        with pytest.raises(ValueError):
+            compiled.conform({"a": "x", "b": 1})
+        assert ["x"] == calls
+
+        assert INVALID is compiled.conform({"a": "x", "b": "1"})
+        assert ["x"] == calls
+
+    def test_compiled_falls_back_when_code_generation_fails(self, monkeypatch):
+        def compile_fails(self, spec):
+            raise RecursionError()
+
+        monkeypatch.setattr("dataspec.compiler._Compiler.compile", compile_fails)
+        compiled = s({"a": s.str(conformer=str.upper)}).compile()
+        assert compiled.is_valid({"a": "b"})
+        assert {"a": "B"} == compiled.conform({"a": "b"})
+        assert INVALID is compiled.conform({"a": 1})
+
+    def test_compiled_tag_and_compile(self, compiled_spec: Spec):
+        assert "doc" == compiled_spec.tag
+        assert compiled_spec is compiled_spec.compile()
+        assert "doc2" == compiled_spec.with_tag("doc2").tag
+
+
+class TestIsValidFastPath:
+    class Point:
+        def __init__(self, x):
+            self.x = x
+
+    @pytest.mark.parametrize(
+        "spec",
+        [
+            s.str(minlength=2, regex=r"[a-z]+"),
+            s.str(format_="uuid"),
+            s.num(min_=0, max_=10),
+            s.nilable(s.str()),
+            s.blankable(s.num()),
+            s.all(s.str(), lambda v: v.startswith("a")),
+            s.any(s.num(), s.str(regex=r"[a-z]+"), None),
+            s.kv(str, int),
+            s({"a": int, s.opt("b"): [str, {"kind": list, "maxlength": 1}]}),
+            s((int, {"a", "b"})),
+            s.obj({"x": int}),
+            s.email(domain="example.com"),
+            s.url(scheme="https"),
+        ],
+    )
+    @pytest.mark.parametrize(
+        "v",
+        [
+            None,
+            "",
+            "a",
+            "abc",
+            "AB",
+            1,
+            -1,
+            11,
+            "c5a28680-986f-4f0d-8187-80d1fbe22059",
+            "me@example.com",
+            "https://example.com",
+            {"a": 1},
+            {"a": 1, "b": ["c"]},
+            {"a": 1, "b": ["c", "d"]},
+            {"a": 1, "b": ("c",)},
+            {"a": "1"},
+            [1, 2],
+            [1, 2, 3],
+            (1, "a"),
+            (1, "c"),
+            Point(1),
+            Point("1"),
+        ],
+    )
+    def test_is_valid_matches_validate(self, spec: Spec, v):
+        assert spec.is_valid(v) is (not spec.validate_all(v))
+
+    def test_is_valid_does_not_create_errors(self):
+        converted = []
+
+        @pred_to_validator(
+            "Value '{value}' is negative",
+            convert_value=lambda v: converted.append(v) or v,
+        )
+        def is_negative(v) -> bool:
+            return v < 0
+
+        spec = s({"a": [s.all(int, is_negative)], s.opt("b"): s.nilable(is_negative)})
+        assert spec.is_valid({"a": [1, 2], "b": None})
+        assert not spec.is_valid({"a": [1, -2], "b": -1})
+        assert [] == converted
+
+        errors = spec.validate_all({"a": [1, -2]})
+        assert 1 == len(errors)
+        assert [] == converted
+        assert "Value '-2' is negative" == errors[0].message
+        assert [-2] == converted
+
+    def test_is_valid_for_validator_without_check(self):
+        def is_even(v) -> Iterator[ErrorDetails]:
+            if v % 2:
+                yield ErrorDetails(message="odd", pred=is_even, value=v)
+
+        spec = s(is_even)
+        assert spec.is_valid(2)
+        assert not spec.is_valid(3)
+        assert not spec.is_valid("a")
+
+
+class TestValidateAllLimits:
+    @pytest.fixture
+    def is_counted_int(self, counted):
+        def is_counted_int(v) -> bool:
+            return isinstance(v, int)
+
+        return counted(is_counted_int)
+
+    @pytest.fixture
+    def values(self) -> list:
+        return [str(i) for i in range(200)]
+
+    @pytest.mark.parametrize("max_errors", [1, 3, 199])
+    def test_coll_max_errors(self, is_counted_int, calls, values, max_errors):
+        spec = s([is_counted_int])
+        errors = spec.validate_all(values, max_errors=max_errors)
+        assert max_errors == len(errors)
+        assert max_errors == len(calls)
+        assert [e.path for e in errors] == [[i] for i in range(max_errors)]
+
+    def test_dict_max_errors(self, is_counted_int, calls):
+        spec = s({"a": is_counted_int, "b": is_counted_int, "c": is_counted_int})
+        assert 2 == len(spec.validate_all({"a": "a", "b": "b", "c": "c"}, max_errors=2))
+        assert ["a", "b"] == calls
+
+    def test_kv_fail_fast(self, is_counted_int, calls):
+        spec = s.kv(str, is_counted_int)
+        errors = spec.validate_all({"a": "a", "b": "b", "c": "c"}, fail_fast=True)
+        assert 1 == len(errors)
+        assert ["a"] == calls
+
+    def test_any_max_errors(self, is_counted_int, calls, values):
+        spec = s.any(s([is_counted_int]), s([str, {"maxlength": 2}]))
+        errors = spec.validate_all(values, max_errors=2)
+        assert 2 == len(errors)
+        assert [["any", "coll", "is_counted_int"]] * 2 == [e.via for e in errors]
+        assert ["0", "0", "1"] == calls
+
+    def test_all_fail_fast(self, is_counted_int, calls, values):
+        spec = s.all(s([str]), s([is_counted_int]))
+        assert 1 == len(spec.validate_all(values, fail_fast=True))
+        assert ["0"] == calls
+
+    def test_validate_ex_limits(self, values):
+        with pytest.raises(ValidationError) as e:
+            s([int]).validate_ex(values, max_errors=5)
+        assert 5 == len(e.value.errors)
+
+    def test_limits_do_not_change_errors(self):
+        spec = s.nilable(s({"a": [int], "b": s.any(int, s.blankable(s.str()))}))
+        v = {"a": ["1", 2, "3"], "b": None}
+        errors = spec.validate_all(v)
+        for max_errors in range(1, len(errors) + 2):
+            assert [e.as_map() for e in errors[:max_errors]] == [
+                e.as_map() for e in spec.validate_all(v, max_errors=max_errors)
+            ]
+
+    def test_max_errors_must_be_positive(self):
+        with pytest.raises(ValueError):
+            s([int]).validate_all([], max_errors=0)
+
+
+class TestLazyErrorMessages:
+    class Unprintable:
+        def __init__(self):
+            self.formatted = 0
+
+        def __format__(self, format_spec):
+            self.formatted += 1
+            return "unprintable"
+
+    @pytest.mark.parametrize(
+        "spec,message",
+        [
+            (s(lambda v: False), "Value 'unprintable' does not satisfy predicate"),
+            (s({1, 2}), "Value 'unprintable' not in"),
+            (s.str(), "Value 'unprintable' is not a string"),
+            (s.nilable(s.str()), "Value 'unprintable' is not None"),
+            (s.blankable(s.str()), "Value 'unprintable' is not blank"),
+        ],
+    )
+    def test_message_rendered_on_access(self, spec: Spec, message: str):
+        v = self.Unprintable()
+        errors = spec.validate_all(v)
+        assert 0 == v.formatted
+
+        assert errors[-1].message.startswith(message)
+        assert 1 == v.formatted
+        assert errors[-1].message.startswith(message)
+        assert 1 == v.formatted
+
+    def test_as_map_renders_message(self):
+        error = s({1, 2}).validate_all(3)[0]
+        assert "Value '3' not in '{1, 2}'" == error.as_map()["message"]
+
+    def test_rendered_message_equality_and_repr(self):
+        lazy = s({1, 2}).validate_all(3)[0]
+        eager = ErrorDetails(
+            message="Value '3' not in '{1, 2}'", pred={1, 2}, value=3, via=["set"],
+        )
+        assert eager == lazy
+        assert repr(eager) == repr(lazy)
+        assert repr(lazy).startswith("ErrorDetails(message=\"Value '3' not in")
+
+    def test_unrenderable_template(self):
+        @pred_to_validator("Value '{value}' is not in {1}")
+        def is_negative(v) -> bool:
+            return v < 0
+
+        error = s(is_negative).validate_all(-1)[0]
+        assert "Value '{value}' is not in {1}" == error.message
+        assert "Value '{value}' is not in {1}" == error.as_map()["message"]
+
+    def test_message_setter(self):
+        v = self.Unprintable()
+        error = s.str().validate_all(v)[0]
+        error.message = "Value is not a string"
+        assert "Value is not a string" == error.message
+        assert 0 == v.formatted
+
+    def test_asdict_fields(self):
+        error = s({"a": {1, 2}}).validate_all({"a": 3})[0]
+        assert {
+            "message": "Value '3' not in '{1, 2}'",
+            "pred": {1, 2},
+            "value": 3,
+            "via": ["map", "set"],
+            "path": ["a"],
+        } == attr.asdict(error, retain_collection_types=True)
+        assert error == attr.evolve(error)
+        assert error == pickle.loads(pickle.dumps(error))
+
+
+class TestErrorDetailsPaths:
+    def test_with_details(self):
+        error = ErrorDetails(message="bad", pred=int, value="a", via=["int"])
+        error.with_details("coll", 1).with_details("map", "a")
+        assert ["map", "coll", "int"] == error.via
+        assert ["a", 1] == error.path
+
+        error.with_details("nilable").with_details("outer", 0)
+        assert ["outer", "nilable", "map", "coll", "int"] == error.via
+        assert [0, "a", 1] == error.path
+
+    def test_set_paths(self):
+        error = ErrorDetails(message="bad", pred=int, value="a")
+        error.with_details("coll", 1)
+        error.path = ["x"]
+        assert ["x"] == error.path
+        assert ["coll"] == error.via
+
+    def test_equality_with_pending_details(self):
+        error = ErrorDetails(message="bad", pred=int, value="a", via=["int"])
+        error.with_details("coll", 1)
+        assert (
+            ErrorDetails(
+                message="bad", pred=int, value="a", via=["coll", "int"], path=[1]
+            )
+            == error
+        )
+
+    def test_deeply_nested_paths(self):
+        spec = int
+        v = "a"
+        for i in range(100):
+            spec = s(f"level{i}", {"a": spec}) if i % 2 else s(f"level{i}", [spec])
+            v = {"a": v} if i % 2 else [v]
+
+        error = s(spec).validate_all(v)[0]
+        assert [f"level{i}" for i in reversed(range(100))] + ["is_int"] == error.via
+        assert [0 if i % 2 == 0 else "a" for i in reversed(range(100))] == error.path
+
+
+class TestIterativeValidation:
+    @pytest.fixture
+    def nested_spec(self) -> Spec:
+        return s(
+            "doc",
+            {
+                "id": s.str(conform_format="uuid"),
+                "rows": [s("row", (int, s.nilable(s.str(regex=r"[a-z]+"))))],
+                s.opt("tags"): s.kv(str, s.all(int, lambda v: v > 0)),
+                "kind": s.any(s.num(), s.blankable(s.str(regex=r"[a-z]+"))),
+            },
+        )
+
+    @pytest.mark.parametrize(
+        "v",
+        [
+            None,
+            {},
+            {
+                "id": "c5a28680-986f-4f0d-8187-80d1fbe22059",
+                "rows": [(1, "a"), (2, None)],
+                "tags": {"a": 1},
+                "kind": "",
+            },
+            {"id": "not-a-uuid", "rows": [(1, 2), ("2", None)], "kind": "A"},
+            {"id": 3, "rows": 4, "tags": [], "kind": None},
+            {
+                "id": "c5a28680-986f-4f0d-8187-80d1fbe22059",
+                "rows": [],
+                "kind": 1,
+                "event": {"type": "a", "rows": [1, "2"]},
+            },
+            {
+                "id": "c5a28680-986f-4f0d-8187-80d1fbe22059",
+                "rows": [],
+                "kind": 1,
+                "event": {"type": "c"},
+            },
+            {
+                "id": "c5a28680-986f-4f0d-8187-80d1fbe22059",
+                "rows": [(1,), None, (1, "A")],
+                "tags": {"a": -1, 1: 1, "b": "c"},
+                "kind": None,
+            },
+        ],
+    )
+    def test_iterative_matches_recursive(self, nested_spec: Spec, v):
+        assert [e.as_map() for e in nested_spec.validate_all(v)] == [
+            e.as_map() for e in nested_spec.validate_all(v, iterative=True)
+        ]
+
+    @pytest.mark.parametrize(
+        "wrap", [Spec.compile, Spec.cached, lambda spec: spec.compile().cached()]
+    )
+    def test_iterative_wrapped_spec(self, nested_spec: Spec, wrap):
+        v = {"id": "not-a-uuid", "rows": [(1, 2)], "kind": "A"}
+        assert [e.as_map() for e in nested_spec.validate_all(v)] == [
+            e.as_map() for e in wrap(nested_spec).validate_all(v, iterative=True)
+        ]
+
+    def test_iterative_limits(self, nested_spec: Spec):
+        v = {"id": "not-a-uuid", "rows": [(1, 2), ("2", None)], "kind": "A"}
+        assert nested_spec.validate_all(v, max_errors=2) == nested_spec.validate_all(
+            v, max_errors=2, iterative=True
+        )
+        assert 1 == len(nested_spec.validate_all(v, fail_fast=True, iterative=True))
+
+        with pytest.raises(ValidationError):
+            nested_spec.validate_ex(v, iterative=True)
+
+    def test_iterative_propagates_uncaught_exceptions(self):
+        spec = s([s.obj({"a": [int]})])
+        with pytest.raises(TypeError):
+            spec.validate_all([SimpleNamespace(a=1)])
+        with pytest.raises(TypeError):
+            spec.validate_all([SimpleNamespace(a=1)], iterative=True)
+
+    def test_deeply_nested_values(self):
+        depth = 10_000
+        spec = int
+        v = "a"
+        for _ in range(depth):
+            spec = s([spec])
+            v = [v]
+        spec = s(spec)
+
+        with pytest.raises(RecursionError):
+            spec.validate_all(v)
+
+        errors = spec.validate_all(v, iterative=True)
+        assert 1 == len(errors)
+        assert [0] * depth == errors[0].path
+        assert "is_int" == errors[0].via[-1]
+
+    def test_deeply_nested_cached_specs(self):
+        depth = 10_000
+        spec = int
+        v = "a"
+        for _ in range(depth):
+            spec = s([spec]).cached()
+            v = [v]
+
+        errors = spec.validate_all(v, iterative=True)
+        assert 1 == len(errors)
+        assert [0] * depth == errors[0].path
+
+
+class TestInterning:
+    @pytest.fixture(autouse=True)
+    def interning(self) -> Iterator[None]:
+        set_interning(True)
+        try:
+            yield
+        finally:
+            set_interning(False)
+
+    @pytest.mark.parametrize(
+        "make",
+        [
+            lambda: s(str),
+            lambda: s("tagged", {1, 2, 3}),
+            lambda: s([s.str(maxlength=64), {"kind": list}]),
+            lambda: s((int, s.nilable(s.num(min_=0)))),
+            lambda: s.any(s.num(), s.blankable(s.str(regex=r"[a-z]+"))),
+            lambda: s.all(s.str(), s.str(conform_format="uuid")),
+            lambda: s.kv(str, int),
+            lambda: s.bool(allowed_values={True}),
+            lambda: s.inst(format_="%Y-%m-%d"),
+            lambda: s.obj({"name": str, s.opt("age"): int}),
+            lambda: s.url(hostname_regex=r"(www\.)?example\.com"),
+            lambda: s(
+                "doc",
+                {"id": s.uuid(), s.opt("tags"): [str], "rows": [{"n": s.num(min_=0)}]},
+            ),
+        ],
+    )
+    def test_structurally_identical_specs_are_shared(self, make):
+        spec = make()
+        assert spec is make()
+
+    def test_nested_specs_are_shared(self):
+        spec = s({"a": {"b": s.str(maxlength=64)}, "c": {"b": s.str(maxlength=64)}})
+        assert spec._keyspecs["a"].spec is spec._keyspecs["c"].spec
+
+    @pytest.mark.parametrize(
+        "make,make_other",
+        [
+            (lambda: s.num(min_=1), lambda: s.num(min_=True)),
+            (lambda: s.num(min_=1), lambda: s.num(min_=1.0)),
+            (lambda: s({0.0}), lambda: s({-0.0})),
+            (lambda: s.num(max_=0.0), lambda: s.num(max_=-0.0)),
+            (lambda: s({complex(0, 0.0)}), lambda: s({complex(0, -0.0)})),
+            (lambda: s({float("nan")}), lambda: s({float("nan")})),
+            (lambda: s.str(maxlength=64), lambda: s.str("str", maxlength=64)),
+            (lambda: s([str]), lambda: s((str,))),
+            (lambda: s({"a": str, "b": str}), lambda: s({"b": str, "a": str})),
+            (lambda: s({"a": str}), lambda: s({s.opt("a"): str})),
+            (lambda: s.str(conformer=str.upper), lambda: s.str(conformer=str.lower)),
+            (lambda: s.date(), lambda: s.time()),
+        ],
+    )
+    def test_distinct_specs_are_not_shared(self, make, make_other):
+        assert make() is not make_other()
+
+    def test_arguments_compared_by_identity(self):
+        def is_positive(v) -> bool:
+            return v > 0
+
+        def is_also_positive(v) -> bool:
+            return v > 0
+
+        assert s(is_positive) is s(is_positive)
+        assert s(is_positive) is not s(is_also_positive)
+
+    def test_specs_with_state_are_not_shared(self):
+        spec = s.any(s.str(), s.num(), adaptive=True)
+        other = s.any(s.str(), s.num(), adaptive=True)
+        assert spec is not other
+
+        spec.is_valid(1)
+        assert [0, 1] == [info.hits for info in branch_info(spec)]
+        assert [0, 0] == [info.hits for info in branch_info(other)]
+
+        cached = s.str().cached()
+        assert s(cached) is cached
+        assert s([cached]) is s([cached])
+        assert s([cached]) is not s([s.str().cached()])
+
+    def test_disable_interning(self):
+        spec = s.str(maxlength=64)
+        set_interning(False)
+        assert spec is not s.str(maxlength=64)
+        assert s.str(maxlength=64) is not s.str(maxlength=64)
+
+        set_interning(True)
+        assert spec is not s.str(maxlength=64)
+        assert s.str(maxlength=64) is s.str(maxlength=64)
+        assert spec.is_valid("a")
+
+
+class TestCachedSpec:
+    @pytest.fixture
+    def spec(self, counted) -> Spec:
+        def is_code(v) -> bool:
+            return isinstance(v, str) and v.isupper()
+
+        return s("code", counted(is_code), conformer=str.lower)
+
+    def test_is_valid(self, spec: Spec, calls):
+        cached = spec.cached()
+        assert cached.is_valid("A")
+        assert cached.is_valid("A")
+        assert not cached.is_valid("a")
+        assert not cached.is_valid("a")
+        assert ["A", "a"] == calls
+        assert (2, 2, 0, 1024, 2) == cached.cache_info()
+
+    def test_conform(self, spec: Spec, calls):
+        cached = spec.cached()
+        assert "a" == cached.conform("A")
+        assert "a" == cached.conform("A")
+        assert INVALID is cached.conform("a")
+        assert INVALID is cached.conform("a")
+        assert ["A", "a"] == calls
+        assert ("a", []) == cached.conform_or_errors("A")
+
+    def test_conform_valid_does_not_cache_invalid_values(self):
+        cached = s.num(min_=0).cached()
+        assert -1 == cached.conform_valid(-1)
+        assert INVALID is cached.conform(-1)
+        assert not cached.is_valid(-1)
+
+        assert 1 == cached.conform_valid(1)
+        assert cached.is_valid(1)
+        assert 1 == cached.conform_valid(1)
+        assert 1 == cached.conform_valid(1)
+        assert 1 == cached.cache_info().hits
+
+    def test_mutable_conformed_values_are_not_shared(self, calls):
+        cached = s.str(conformer=lambda v: calls.append(v) or [v]).cached()
+        conformed = cached.conform("a")
+        conformed.append("z")
+        assert ["a"] == cached.conform("a")
+        assert ["a", "a"] == calls
+
+    @pytest.mark.parametrize(
+        "conformer,v",
+        [
+            (int, "1"),
+            (lambda v: (v, int(v)), "1"),
+            (lambda v: frozenset({v}), "1"),
+            (uuid.UUID, "c5a28680-986f-4f0d-8187-80d1fbe22059"),
+            (date.fromisoformat, "2020-01-01"),
+        ],
+    )
+    def test_immutable_conformed_values_are_shared(self, calls, conformer, v):
+        cached = s.str(conformer=lambda v: calls.append(v) or conformer(v)).cached()
+        assert cached.conform(v) is cached.conform(v)
+        assert [v] == calls
+
+    def test_validate(self, spec: Spec):
+        cached = spec.cached()
+        assert [] == cached.validate_all("A")
+        assert spec.validate_all("a") == cached.validate_all("a")
+        assert spec.validate_all("a") == cached.validate_all("a")
+
+    def test_keys_include_types(self):
+        cached = s(int).cached()
+        assert cached.is_valid(1)
+        assert not cached.is_valid(1.0)
+
+        cached = s((int,)).cached()
+        assert cached.is_valid((1,))
+        assert not cached.is_valid((1.0,))
+
+    @pytest.mark.parametrize(
+        "first,second",
+        [
+            (0.0, -0.0),
+            (complex(0.0, 0.0), complex(0.0, -0.0)),
+            (Decimal("1.0"), Decimal("1.00")),
+            ((0.0,), (-0.0,)),
+            (
+                datetime(2020, 1, 1, 12, tzinfo=timezone.utc),
+                datetime(2020, 1, 1, 7, tzinfo=timezone(timedelta(hours=-5))),
+            ),
+        ],
+    )
+    def test_equal_but_distinguishable_values(self, first, second):
+        cached = s(lambda _: True, conformer=repr).cached()
+        assert first == second
+        assert repr(first) == cached.conform(first)
+        assert repr(second) == cached.conform(second)
+        assert 0 == cached.cache_info().hits
+
+    @pytest.mark.parametrize("nan", [float("nan"), Decimal("NaN"), (float("nan"),)])
+    def test_nans_are_not_cached(self, nan):
+        cached = s(lambda _: True).cached()
+        for _ in range(3):
+            assert cached.is_valid(nan)
+        info = cached.cache_info()
+        assert (0, 0, 0) == (info.hits, info.misses, info.currsize)
+
+    def test_unhashable_values_are_not_cached(self, spec: Spec, calls):
+        cached = s([spec]).cached()
+        assert cached.is_valid(["A"])
+        assert cached.is_valid(["A"])
+        assert ["a"] == cached.conform(["A"])
+        assert ["A", "A", "A"] == calls
+        assert (0, 0, 0, 1024, 0) == cached.cache_info()
+
+    def test_lru_eviction(self, spec: Spec, calls):
+        cached = spec.cached(maxsize=2)
+        for v in ["A", "B", "A", "C", "A", "B"]:
+            assert cached.is_valid(v)
+        assert ["A", "B", "C", "B"] == calls
+        assert (2, 4, 2, 2, 2) == cached.cache_info()
+
+    def test_ttl(self, spec: Spec, calls, monkeypatch):
+        now = 100.0
+        monkeypatch.setattr("dataspec.cache.time.monotonic", lambda: now)
+
+        cached = spec.cached(ttl=10)
+        assert cached.is_valid("A")
+        now = 109.0
+        assert cached.is_valid("A")
+        now = 110.0
+        assert cached.is_valid("A")
+        assert ["A", "A"] == calls
+
+    def test_cache_clear(self, spec: Spec, calls):
+        cached = spec.cached()
+        assert cached.is_valid("A")
+        cached.cache_clear()
+        assert (0, 0, 0, 1024, 0) == cached.cache_info()
+        assert cached.is_valid("A")
+        assert ["A", "A"] == calls
+
+    @pytest.mark.parametrize("maxsize,ttl", [(0, None), (-1, None), (1, 0), (1, -1)])
+    def test_invalid_cache_parameters(self, spec: Spec, maxsize, ttl):
+        with pytest.raises(ValueError):
+            spec.cached(maxsize=maxsize, ttl=ttl)
+
+    def test_nested_cached_spec(self, spec: Spec, calls):
+        outer = s({"code": spec.cached()})
+        assert {"code": "a"} == outer.conform({"code": "A"})
+        assert {"code": "a"} == outer.conform({"code": "A"})
+        assert ["A"] == calls
+
+    def test_derived_specs_are_cached(self, spec: Spec):
+        cached = spec.cached(maxsize=8, ttl=60)
+        tagged = cached.with_tag("other")
+        assert "other" == tagged.tag
+        assert (8, 60) == (tagged.maxsize, tagged.ttl)
+
+        conformed = cached.with_conformer(None)
+        assert "A" == conformed.conform("A")
+        assert 8 == conformed.cache_info().maxsize
+
+
+class TestPredicateClassification:
+    def test_classification_is_cached(self, monkeypatch):
+        def is_positive(v) -> bool:
+            return v > 0
+
+        def validate_positive(v) -> Iterator[ErrorDetails]:
+            if v <= 0:
+                yield ErrorDetails(message="bad", pred=validate_positive, value=v)
+
+        calls = []
+        signature = inspect.signature
+        monkeypatch.setattr(
+            inspect, "signature", lambda f: calls.append(f) or signature(f)
+        )
+
+        for _ in range(3):
+            assert isinstance(s(is_positive), PredicateSpec)
+            assert isinstance(s(validate_positive), ValidatorSpec)
+        assert [is_positive, validate_positive] == calls
+
+    def test_uncacheable_predicates(self):
+        class Unhashable:
+            __hash__ = None
+
+            def __call__(self, v) -> bool:
+                return bool(v)
+
+        spec = s("callable", callable)
+        assert spec.is_valid(len)
+        assert not spec.is_valid(1)
+
+        spec = s("unhashable", Unhashable())
+        assert spec.is_valid(1)
+        assert not spec.is_valid(0)
+
+
+class TestBatch:
+    @pytest.fixture
+    def spec(self) -> Spec:
+        return s(
+            "record",
+            {
+                "id": s.str(conform_format="uuid"),
+                "status": {"open", "closed"},
+                s.opt("note"): s.nilable(s.str(conformer=str.upper)),
+            },
+        )
+
+    @pytest.fixture
+    def records(self) -> list:
+        return [
+            {"id": "c5a28680-986f-4f0d-8187-80d1fbe22059", "status": "open"},
+            {"id": "not-a-uuid", "status": "open"},
+            {"id": "c5a28680-986f-4f0d-8187-80d1fbe22059", "status": "closed"},
+            None,
+            {
+                "id": "c5a28680-986f-4f0d-8187-80d1fbe22059",
+                "status": "pending",
+                "note": 3,
+            },
+            {
+                "id": "c5a28680-986f-4f0d-8187-80d1fbe22059",
+                "status": "closed",
+                "note": "a",
+            },
+        ]
+
+    def test_validate_many(self, spec: Spec, records: list):
+        results = list(spec.validate_many(records))
+        assert [1, 3, 4] == [i for i, _ in results]
+        assert [
+            (i, [e.as_map() for e in spec.validate_all(records[i])]) for i in (1, 3, 4)
+        ] == [(i, [e.as_map() for e in errors]) for i, errors in results]
+
+    def test_conform_many(self, spec: Spec, records: list):
+        results = list(spec.conform_many(records))
+        assert list(range(len(records))) == [result.index for result in results]
+        assert [spec.conform(r) for r in records] == [
+            result.conformed for result in results
+        ]
+        assert [[e.as_map() for e in spec.validate_all(r)] for r in records] == [
+            [e.as_map() for e in result.errors] for result in results
+        ]
+
+    def test_batches_are_lazy(self, spec: Spec, records: list):
+        consumed = []
+
+        def gen():
+            for record in records:
+                consumed.append(record)
+                yield record
+
+        results = spec.conform_many(gen())
+        assert [] == consumed
+        assert 0 == next(results).index
+        assert 1 == len(consumed)
+
+        invalid = spec.validate_many(gen())
+        assert 1 == next(invalid)[0]
+
+    def test_empty_batch(self, spec: Spec):
+        assert [] == list(spec.validate_many([]))
+        assert [] == list(spec.conform_many([]))
+
+    def test_compiled_spec_batch(self, spec: Spec, records: list):
+        compiled = spec.compile()
+        assert list(spec.conform_many(records)) == list(compiled.conform_many(records))
+        assert [i for i, _ in spec.validate_many(records)] == [
+            i for i, _ in compiled.validate_many(records)
+        ]
+
+    def test_conform_many_in_processes(self, spec: Spec, records: list):
+        results = list(
+            spec.conform_many(records * 5, executor="process", workers=2, chunksize=4)
+        )
+        assert list(spec.conform_many(records * 5)) == results
+        assert INVALID is results[1].conformed
+        assert isinstance(results[0].conformed["id"], uuid.UUID)
+
+    @pytest.mark.parametrize(
+        "method",
+        [
+            m
+            for m in ("spawn", "forkserver", "fork")
+            if m in multiprocessing.get_all_start_methods()
+        ],
+    )
+    def test_conform_many_in_processes_start_methods(
+        self, spec: Spec, records: list, method: str
+    ):
+        results = list(
+            spec.conform_many(
+                records,
+                executor="process",
+                workers=1,
+                mp_context=multiprocessing.get_context(method),
+            )
+        )
+        assert list(spec.conform_many(records)) == results
+
+    def test_conform_many_in_processes_requires_picklable_spec(self, records: list):
+        spec = s("record", {"status": lambda v: v in {"open", "closed"}})
+        with pytest.raises((pickle.PicklingError, AttributeError)):
+            spec.conform_many(records, executor="process", workers=1)
+
+    def test_conform_many_in_processes_is_lazy(self, spec: Spec, records: list):
+        consumed = []
+
+        def gen():
+            for i in range(1000):
+                consumed.append(i)
+                yield records[0]
+
+        results = spec.conform_many(gen(), executor="process", workers=1, chunksize=10)
+        assert 0 == next(results).index
+        assert len(consumed) < 1000
+        results.close()
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"executor": "threads"},
+            {"executor": "process", "workers": 0},
+            {"executor": "process", "chunksize": 0},
+        ],
+    )
+    def test_conform_many_invalid_executor_options(self, spec: Spec, kwargs):
+        with pytest.raises(ValueError):
+            spec.conform_many([], **kwargs)
+
+
+def is_even(v) -> bool:
+    return v % 2 == 0
+
+
+def validate_positive(v) -> Iterator[ErrorDetails]:
+    if v <= 0:
+        yield ErrorDetails(
+            message="Value must be positive", pred=validate_positive, value=v
+        )
+
+
+class Color(Enum):
+    RED = "red"
+    GREEN = "green"
+
+
+def _concrete_spec_classes():
+    # Specs defined outside of dataspec.base are only imported when first used
+    classes, pending = set(), [Spec, CachedSpec, CompiledSpec]
+    while pending:
+        cls = pending.pop()
+        pending.extend(cls.__subclasses__())
+        if not inspect.isabstract(cls):
+            classes.add(cls)
+    return sorted(classes, key=lambda c: c.__name__)
+
+
+@pytest.mark.parametrize("cls", _concrete_spec_classes(), ids=lambda c: c.__name__)
+def test_concrete_specs_support_copying(cls):
+    assert attr.has(cls) or all(
+        getattr(cls, name) is not getattr(Spec, name)
+        for name in ("with_conformer", "with_tag")
+    )
+
+
+class TestPickling:
+    SCALARS = [None, "", "red", "GREEN", 0, 3, 4, -2, (1, "a"), (1, None)]
+    MAPPINGS = [{}, {"a": 1}, {"a": "1"}, {"a": 1, "b": ["x"]}, {"a": 1, "b": [2]}]
+
+    @pytest.mark.parametrize(
+        "make,values",
+        [
+            (lambda: s(str), SCALARS),
+            (lambda: s(None), SCALARS),
+            (lambda: s({1, 2, 3}), SCALARS),
+            (lambda: s(Color), SCALARS),
+            (lambda: s("tagged", is_even), SCALARS),
+            (lambda: s(validate_positive), [0, 3, -2]),
+            (lambda: s((int, s.nilable(str))), SCALARS),
+            (
+                lambda: s([int, {"kind": list, "minlength": 1, "maxlength": 3}]),
+                [[], [1, 2], [1, "a"], (1, 2), [1, 2, 3, 4]],
+            ),
+            (lambda: s({"a": int, s.opt("b"): [str]}), MAPPINGS),
+            (lambda: s.any(s(is_even), s(str), conformer=str), [0, 3, "a", None]),
+            (lambda: s.all(s(int), validate_positive), [0, 3, -2, "a"]),
+            (lambda: s.kv(str, int, conform_keys=True), MAPPINGS),
+            (lambda: s.merge({"a": int}, {s.opt("b"): str}), MAPPINGS),
+            (lambda: s(int).with_tag("integer"), SCALARS),
+            (lambda: s(str).with_conformer(str.upper), SCALARS),
+            (
+                lambda: s(str, conformer=str.strip).compose_conformer(str.upper),
+                [" red ", "GREEN", 3],
+            ),
+            (lambda: s({"a": int}).compile(), MAPPINGS),
+            (lambda: s(Color).cached(maxsize=8), SCALARS),
+        ],
+    )
+    def test_round_trip(self, make, values):
+        spec = make()
+        unpickled = pickle.loads(pickle.dumps(spec))
+
+        assert type(spec) is type(unpickled)
+        assert spec.tag == unpickled.tag
+        for v in values:
+            assert spec.is_valid(v) == unpickled.is_valid(v)
+            assert [e.as_map() for e in spec.validate_all(v)] == [
+                e.as_map() for e in unpickled.validate_all(v)
+            ]
+            assert spec.conform(v) == unpickled.conform(v)
+
+    def test_unpicklable_predicate(self):
+        with pytest.raises((pickle.PicklingError, AttributeError)):
+            pickle.dumps(s(lambda v: v > 0))
+
+    def test_unpickle_interned(self):
+        data = pickle.dumps(s({"a": s.str(maxlength=64)}))
+        set_interning(True)
+        try:
+            assert pickle.loads(data) is s({"a": s.str(maxlength=64)})
+        finally:
+            set_interning(False)
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class TestAsync:
+    @staticmethod
+    def make_spec(is_member, validate_positive) -> Spec:
+        is_member = s("is_member", is_member)
+        positive = s("positive", validate_positive)
+        return s(
+            "record",
+            {
+                "ids": [is_member, {"maxlength": 3}],
+                "count": positive,
+                s.opt("alias"): s.nilable(
+                    s.any(is_member, int, tag_conformed=True, conformer=str)
+                ),
+                "counts": s.kv(is_member, positive, conform_keys=True),
+                "pair": (is_member, s.all(int, positive, conformer=lambda v: v * 2)),
+                s.opt("owner"): s.obj({"id": is_member, s.opt("count"): positive}),
+                s.opt("note"): s.blankable(is_member),
+                s.opt("event"): s.union(
+                    "type",
+                    {"a": {"type": str, "id": is_member}, "b": {"type": str}},
+                    conformer=len,
+                ),
+            },
+        )
+
+    @pytest.fixture
+    def sync_spec(self) -> Spec:
+        def is_member(v) -> bool:
+            return v.startswith("M")
+
+        def positive(v) -> Iterator[ErrorDetails]:
+            if v <= 0:
+                yield ErrorDetails(
+                    message="Value must be positive", pred=positive, value=v
+                )
+
+        return self.make_spec(is_member, positive)
+
+    @pytest.fixture
+    def async_spec(self) -> Spec:
+        async def is_member(v) -> bool:
+            await asyncio.sleep(0)
+            return v.startswith("M")
+
+        async def positive(v) -> AsyncIterator[ErrorDetails]:
+            await asyncio.sleep(0)
+            if v <= 0:
+                yield ErrorDetails(
+                    message="Value must be positive", pred=positive, value=v
+                )
+
+        return self.make_spec(is_member, positive)
+
+    @pytest.mark.parametrize(
+        "v",
+        [
+            None,
+            [],
+            {},
+            {
+                "ids": ["M1"],
+                "count": 2,
+                "alias": None,
+                "counts": {"M1": 1},
+                "pair": ("M2", 3),
+                "owner": SimpleNamespace(id="M3"),
+                "note": "",
+                "event": {"type": "a", "id": "M6"},
+            },
+            {"ids": ["M1", "M2"], "count": 1, "counts": {}, "pair": ("M2", 1)},
+            {
+                "ids": ("M1",),
+                "count": 1,
+                "alias": "M4",
+                "counts": {},
+                "pair": ("M2", 1),
+                "note": "M5",
+            },
+            {
+                "ids": ["M1", "X", "M2", "M3"],
+                "count": 0,
+                "alias": "X",
+                "counts": {"M1": 0, "X": 1},
+                "pair": ("X", -1),
+                "owner": SimpleNamespace(id="X", count=0),
+                "note": "X",
+                "event": {"type": "a", "id": "X"},
+            },
+            {
+                "ids": ["M1"],
+                "count": 1,
+                "counts": {},
+                "pair": ("M2", 1),
+                "event": {"type": "c"},
+            },
+            {"ids": ["M1"], "count": 1, "alias": 3, "counts": [], "pair": 5},
+            {"ids": ["M1"], "count": 1, "counts": {}, "pair": ("M2",)},
+            {"ids": ["M1"], "count": "1", "counts": {"M1": "X"}, "pair": ("M2", 1)},
+        ],
+    )
+    def test_same_as_sync(self, sync_spec: Spec, async_spec: Spec, v):
+        conformed, errors = sync_spec.conform_or_errors(v)
+        assert [(e.path, e.via, e.message) for e in errors] == [
+            (e.path, e.via, e.message) for e in run(async_spec.avalidate(v))
+        ]
+        assert conformed == run(async_spec.aconform(v))
+
+    @pytest.mark.parametrize("max_concurrency,peak", [(1, 1), (3, 3), (None, 10)])
+    def test_concurrency(self, max_concurrency: Optional[int], peak: int):
+        active = []
+        seen = []
+
+        async def is_member(v) -> bool:
+            active.append(v)
+            seen.append(len(active))
+            await asyncio.sleep(0.001)
+            active.remove(v)
+            return v.startswith("M")
+
+        spec = s({"ids": [is_member], "id": is_member})
+        v = {"ids": [f"M{i}" for i in range(9)], "id": "X"}
+        errors = run(spec.avalidate(v, max_concurrency=max_concurrency))
+        assert [["id"]] == [e.path for e in errors]
+        assert peak == max(seen)
+
+    def test_invalid_max_concurrency(self, async_spec: Spec):
+        with pytest.raises(ValueError):
+            run(async_spec.avalidate({}, max_concurrency=0))
+
+    def test_sync_specs(self, sync_spec: Spec):
+        v = {"ids": ["X"], "count": 0, "counts": {}, "pair": ("M1", 1)}
+        assert [e.as_map() for e in sync_spec.validate_all(v)] == [
+            e.as_map() for e in run(sync_spec.avalidate(v))
+        ]
+        assert sync_spec.conform({"ids": ["M1"], "count": 1}) is run(
+            sync_spec.aconform({"ids": ["M1"], "count": 1})
+        )
+
+    def test_async_specs_cannot_be_validated_synchronously(self, async_spec: Spec):
+        v = {"ids": ["M1"], "count": 1, "counts": {}, "pair": ("M2", 1)}
+        with pytest.raises(RuntimeError):
+            async_spec.validate_all(v)
+
+        with pytest.raises(RuntimeError):
+            async_spec.is_valid(v)
+
+    def test_predicate_exceptions(self):
+        async def is_member(v) -> bool:
+            raise ValueError("Lookup failed")
+
+        async def validate_member(v) -> AsyncIterator[ErrorDetails]:
+            raise ValueError("Lookup failed")
+            yield  # pylint: disable=unreachable
+
+        for spec in (s(is_member), s(validate_member)):
+            errors = run(spec.avalidate("M1"))
+            assert 1 == len(errors)
+            assert "Lookup failed" in errors[0].message
+            assert INVALID is run(spec.aconform("M1"))
+
+
+class TestProfiling:
+    @pytest.fixture
+    def spec(self) -> Spec:
+        return s(
+            "claim",
+            {"id": s.str("id", regex=r"C\d+"), "amounts": [s.num("amount", min_=0)]},
+        )
+
+    @staticmethod
+    def by_via(profiler, op: str):
+        return {st.via: st for st in profiler.stats() if st.op == op}
+
+    def test_methods_are_restored(self, spec: Spec):
+        methods = {cls: dict(vars(cls)) for cls in (Spec, PredicateSpec, ValidatorSpec)}
+        with profile() as profiler:
+            assert profiler.enabled
+            assert methods[Spec]["conform"] is not Spec.conform
+        assert not profiler.enabled
+        for cls, attrs in methods.items():
+            assert attrs == dict(vars(cls))
+
+    def test_nested_profilers(self, spec: Spec):
+        with profile() as outer:
+            spec.is_valid({"id": "C1", "amounts": []})
+            with profile() as inner:
+                spec.is_valid({"id": "C1", "amounts": []})
+            assert outer.enabled
+            assert not inner.enabled
+
+        assert 2 == self.by_via(outer, "is_valid")[("claim",)].calls
+        assert 1 == self.by_via(inner, "is_valid")[("claim",)].calls
+
+    def test_is_valid(self, spec: Spec):
+        with profile() as profiler:
+            assert spec.is_valid({"id": "C1", "amounts": [1, 2]})
+            assert not spec.is_valid({"id": "C2", "amounts": [1, -2]})
+
+        stats = self.by_via(profiler, "is_valid")
+        assert 2 == stats[("claim",)].calls
+        assert 1 == stats[("claim",)].failures
+        assert 2 == stats[("claim", "id")].calls
+        assert 0 == stats[("claim", "id")].failures
+        assert 4 == stats[("claim", "coll", "amount")].calls
+        assert 1 == stats[("claim", "coll", "amount")].failures
+
+        root = stats[("claim",)]
+        assert root.selftime <= root.cumtime
+        assert stats[("claim", "coll")].cumtime <= root.cumtime
+
+    def test_validate(self, spec: Spec):
+        with profile() as profiler:
+            errors = spec.validate_all({"id": "X1", "amounts": [-1, -2]})
+        assert 3 == len(errors)
+
+        stats = self.by_via(profiler, "validate")
+        assert (1, 1) == (stats[("claim",)].calls, stats[("claim",)].failures)
+        assert (1, 1) == (stats[("claim", "id")].calls, stats[("claim", "id")].failures)
+        amount = stats[("claim", "coll", "amount")]
+        assert (2, 2) == (amount.calls, amount.failures)
+
+    def test_conform(self, spec: Spec):
+        with profile() as profiler:
+            spec.conform({"id": "C1", "amounts": [1]})
+            assert INVALID is spec.conform({"id": "C1", "amounts": [-1]})
+
+        stats = self.by_via(profiler, "conform")
+        assert (2, 1) == (stats[("claim",)].calls, stats[("claim",)].failures)
+        assert ("claim",) not in self.by_via(profiler, "is_valid")
+
+    def test_stats_by_tag(self):
+        inner = s("node", {s.opt("child"): s.str("leaf")})
+        spec = s("node", {s.opt("child"): inner})
+        with profile() as profiler:
+            spec.is_valid({"child": {"child": "a"}})
+
+        stats = {st.tag: st for st in profiler.stats(by="tag")}
+        assert None is stats["node"].via
+        assert 2 == stats["node"].calls
+        assert (
+            stats["node"].cumtime
+            == self.by_via(profiler, "is_valid")[("node",)].cumtime
+        )
+
+    def test_report(self, spec: Spec):
+        with profile() as profiler:
+            spec.conform({"id": "C1", "amounts": [1]})
+
+        report = profiler.report(sort="calls", limit=2).splitlines()
+        assert 3 == len(report)
+        assert report[0].split() == [
+            "calls",
+            "cumtime",
+            "selftime",
+            "failures",
+            "op",
+            "via",
+        ]
+        assert "claim" in profiler.report(by="tag")
+
+        with pytest.raises(ValueError):
+            profiler.report(sort="name")
+
+        with pytest.raises(ValueError):
+            profiler.stats(by="spec")
+
+        profiler.clear()
+        assert [] == profiler.stats()
+
+    def test_threads(self, spec: Spec):
+        def conform():
+            for _ in range(10):
+                spec.conform({"id": "C1", "amounts": [1]})
+
+        with profile() as profiler:
+            threads = [threading.Thread(target=conform) for _ in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        assert 40 == self.by_via(profiler, "conform")[("claim",)].calls
+
+
+class TestTraceHooks:
+    @pytest.fixture
+    def events(self) -> Iterator[list]:
+        events: list = []
+        set_trace_hooks(
+            lambda tag, via, op: events.append(("enter", via, op)),
+            lambda tag, via, op, valid, elapsed: events.append(
+                ("exit", via, op, valid)
+            ),
+        )
+        try:
+            yield events
+        finally:
+            set_trace_hooks()
+
+    @pytest.fixture
+    def spec(self) -> Spec:
+        return s("point", {"x": s.num("x", min_=0), "y": s.num("y", min_=0)})
+
+    def test_hooks_are_removed(self, spec: Spec):
+        methods = dict(vars(Spec))
+        set_trace_hooks(on_exit=lambda *args: None)
+        assert methods["conform"] is not Spec.conform
+        set_trace_hooks()
+        assert methods == dict(vars(Spec))
+
+    def test_classes_created_while_tracing(self, events: list):
+        @attr.s(auto_attribs=True, frozen=True, slots=True)
+        class UpperSpec(PredicateSpec):
+            def conform(self, v):
+                return v.upper() if self.is_valid(v) else INVALID
+
+        conform = UpperSpec.conform
+        assert "A" == UpperSpec("upper", lambda v: isinstance(v, str)).conform("a")
+        assert [
+            ("enter", ("upper",), "conform"),
+            ("exit", ("upper",), "conform", True),
+        ] == events
+
+        set_trace_hooks()
+        assert conform is not UpperSpec.conform
+        assert conform.__wrapped__ is UpperSpec.conform
+
+    def test_conform(self, events: list, spec: Spec):
+        assert INVALID is spec.conform({"x": 1, "y": -1})
+        assert [
+            ("enter", ("point",), "conform"),
+            ("enter", ("point", "x"), "is_valid"),
+            ("exit", ("point", "x"), "is_valid", True),
+            ("enter", ("point", "y"), "is_valid"),
+            ("exit", ("point", "y"), "is_valid", False),
+            ("exit", ("point",), "conform", False),
+        ] == events
+
+    def test_validate(self, events: list, spec: Spec):
+        assert 1 == len(spec.validate_all({"x": -1, "y": -1}, max_errors=1))
+        assert [
+            ("enter", ("point",), "validate"),
+            ("enter", ("point", "x"), "validate"),
+            ("exit", ("point", "x"), "validate", False),
+            ("exit", ("point",), "validate", False),
+        ] == events
+
+    def test_exceptions(self, events: list):
+        def explode(_) -> bool:
+            raise KeyboardInterrupt()
+
+        spec = s("outer", {"k": s("explode", explode)})
+        with pytest.raises(KeyboardInterrupt):
+            spec.is_valid({"k": 1})
+        assert [
+            ("enter", ("outer",), "is_valid"),
+            ("enter", ("outer", "explode"), "is_valid"),
+            ("exit", ("outer", "explode"), "is_valid", False),
+            ("exit", ("outer",), "is_valid", False),
+        ] == events
+
+    def test_elapsed(self, spec: Spec):
+        elapsed = {}
+        set_trace_hooks(
+            on_exit=lambda tag, via, op, valid, t: elapsed.__setitem__(via, t)
+        )
+        try:
+            spec.is_valid({"x": 1, "y": 1})
+        finally:
+            set_trace_hooks()
+        assert elapsed[("point", "x")] + elapsed[("point", "y")] <= elapsed[("point",)]
@@ -1,11 +1,21 @@
+import pickle
 import re
 import sys
+import threading
 import uuid
 from datetime import date, datetime, time, timezone
 
 import pytest
 
-from dataspec import INVALID, Spec, ValidationError, s
+from dataspec import (
+    INVALID,
+    Spec,
+    ValidationError,
+    factories,
+    pred_to_validator,
+    register_str_format,
+    s,
+)
 
 try:
     from dateutil.parser import parse as parse_date
@@ -1282,6 +1292,57 @@ class TestStringSpecValidation:
             s.str(**opts)
 
 
+class TestRegisterStrFormat:
+    @pytest.fixture(autouse=True)
+    def restore_formats(self, monkeypatch):
+        monkeypatch.setattr(factories, "_STR_FORMATS", factories._STR_FORMATS)
+
+    @staticmethod
+    def register(tag: str) -> None:
+        @register_str_format(tag, conformer=str.lower)
+        @pred_to_validator(f"String '{{value}}' is not {tag}", complement=True)
+        def is_upper(s: str) -> bool:
+            return s.isupper()
+
+    def test_register_str_format(self):
+        self.register("upper")
+        assert s.str(format_="upper").is_valid("ABC")
+        assert not s.str(format_="upper").is_valid("abc")
+        assert "abc" == s.str(conform_format="upper").conform("ABC")
+
+    def test_registry_is_copied_on_write(self):
+        formats = factories._STR_FORMATS
+        self.register("upper")
+        assert "upper" not in formats
+        assert "upper" in factories._STR_FORMATS
+
+    def test_concurrent_registration(self):
+        tags = [[f"upper-{i}-{j}" for j in range(50)] for i in range(8)]
+        barrier = threading.Barrier(len(tags))
+        failures = []
+
+        def register_all(thread_tags):
+            barrier.wait()
+            for tag in thread_tags:
+                self.register(tag)
+                if not s.str(format_=tag).is_valid("ABC"):
+                    failures.append(tag)
+
+        threads = [
+            threading.Thread(target=register_all, args=(thread_tags,))
+            for thread_tags in tags
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert [] == failures
+        for thread_tags in tags:
+            for tag in thread_tags:
+                assert tag in factories._STR_FORMATS
+
+
 class TestStringFormatValidation:
     class TestISODateFormat:
         @pytest.fixture
@@ -1653,6 +1714,13 @@ class TestUUIDSpecValidation:
             assert uuid_spec.is_valid(uuid.UUID(v))
             assert uuid.UUID(v) == uuid_spec.conform(uuid.UUID(v))
 
+        def test_uuid_version_error_message(self, uuid_spec: Spec):
+            v = uuid.UUID("6ba7b810-9dad-31d1-80b4-00c04fd430c8")
+            errors = uuid_spec.validate_all(v)
+            assert [f"UUID '{v}' is not in versions {{1, 4}}"] == [
+                e.message for e in errors
+            ]
+
         @pytest.mark.parametrize(
             "v",
             [
@@ -1673,3 +1741,82 @@ class TestUUIDSpecValidation:
         def test_uuid_validation_failure(self, uuid_spec: Spec, v):
             assert not uuid_spec.is_valid(v)
             assert INVALID is uuid_spec.conform(v)
+
+
+class TestSpecPickling:
+    VALUES = [
+        None,
+        "",
+        "abc",
+        "ABC",
+        b"abc",
+        5,
+        -1,
+        3.14,
+        True,
+        date(2020, 1, 1),
+        datetime(2020, 1, 1, 12, tzinfo=timezone.utc),
+        time(12, 30),
+        uuid.UUID("c5a28680-986f-4f0d-8187-80d1fbe22059"),
+        "c5a28680-986f-4f0d-8187-80d1fbe22059",
+        "2020-01-01",
+        "2020-01-01T12:30:00",
+        "me@example.com",
+        "https://www.example.com/path?q=1",
+        "+1 212 555 0100",
+        {"kind": "a", "id": 1},
+        {"kind": "b", "name": "x"},
+    ]
+
+    @pytest.mark.parametrize(
+        "make_spec",
+        [
+            lambda: s.blankable(s.str(regex=r"[a-z]+")),
+            lambda: s.bool(allowed_values={True}),
+            lambda: s.bytes(minlength=1, maxlength=4),
+            lambda: s.bytes(regex=b"[a-z]+"),
+            lambda: s.date(after=date(2019, 1, 1)),
+            lambda: s.date(format_="%Y-%m-%d"),
+            lambda: s.default(s.num(), default=0),
+            lambda: s.dict_tag({"kind": s.str(), s.opt("id"): s.num()}),
+            lambda: s.email(domain_in={"example.com"}),
+            lambda: s.every(conformer=str),
+            lambda: s.inst(is_aware=True),
+            lambda: s.inst(format_="%Y-%m-%dT%H:%M:%S"),
+            lambda: s.nilable(s.num(min_=0)),
+            lambda: s.num(type_=int, max_=10),
+            lambda: s.obj({"real": s.num(), s.opt("imag"): int}),
+            lambda: s.str(minlength=1, maxlength=3, conformer=str.upper),
+            lambda: s.str(format_="iso-date"),
+            lambda: s.str(conform_format="uuid"),
+            lambda: s.time(before=time(13)),
+            lambda: s.url(hostname_regex=r"(www\.)?example\.com", scheme="https"),
+            lambda: s.uuid(versions={4}),
+            lambda: s.is_email,
+            lambda: s.is_int,
+            pytest.param(
+                lambda: s.inst_str(iso_only=True),
+                marks=pytest.mark.skipif(
+                    parse_date is None, reason="python-dateutil must be installed"
+                ),
+            ),
+            pytest.param(
+                lambda: s.phone(region="US"),
+                marks=pytest.mark.skipif(
+                    phonenumbers is None, reason="phonenumbers must be installed"
+                ),
+            ),
+        ],
+    )
+    def test_factory_round_trip(self, make_spec):
+        spec = make_spec()
+        unpickled = pickle.loads(pickle.dumps(spec))
+
+        assert type(spec) is type(unpickled)
+        assert spec.tag == unpickled.tag
+        for v in self.VALUES:
+            assert spec.is_valid(v) == unpickled.is_valid(v)
+            assert [(e.path, e.via) for e in spec.validate_all(v)] == [
+                (e.path, e.via) for e in unpickled.validate_all(v)
+            ]
+            assert spec.conform(v) == unpickled.conform(v)